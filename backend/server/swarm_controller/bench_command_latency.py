@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2025 Carnegie Mellon University - Satyalab
+#
+# SPDX-License-Identifier: GPL-2.0-only
+
+'''
+Measures end-to-end Command latency through the swarm controller using a
+local stand-in vehicle (a DEALER socket that heartbeats and immediately
+answers every CommandRequest with a COMPLETED response).
+
+With --vehicles, a swarm of stand-in vehicles is started instead and
+sequential per-vehicle Commands are compared against one BroadcastCommand.
+
+Usage:
+    python bench_command_latency.py --iterations 1000
+    python bench_command_latency.py --iterations 100 --vehicles 20
+'''
+
+import argparse
+import asyncio
+import statistics
+import time
+import zmq
+import zmq.asyncio
+from google.protobuf import any_pb2
+# Protocol imports
+from steeleagle_sdk.protocol.services.remote_service_pb2 import CommandRequest, CommandResponse, BroadcastCommandRequest, Heartbeat
+from steeleagle_sdk.protocol.services.control_service_pb2 import HoldRequest
+from steeleagle_sdk.protocol.rpc_helpers import generate_response
+from swarm_controller import SwarmController, HEARTBEAT_FRAME
+
+async def stand_in_vehicle(ctx, endpoint, vehicle_id, progress):
+    '''
+    Answers every command with `progress` IN_PROGRESS responses followed
+    by a COMPLETED response.
+    '''
+    sock = ctx.socket(zmq.DEALER)
+    sock.setsockopt(zmq.IDENTITY, vehicle_id.encode("utf-8"))
+    sock.connect(endpoint)
+    heartbeats = asyncio.create_task(send_heartbeats(sock))
+    try:
+        while True:
+            frames = await sock.recv_multipart()
+            if frames[0] == HEARTBEAT_FRAME:
+                continue
+            request = CommandRequest()
+            request.ParseFromString(frames[-1])
+            for status in [1] * progress + [2]:
+                response = CommandResponse(
+                    sequence_number=request.sequence_number,
+                    response=generate_response(status)
+                )
+                await sock.send(response.SerializeToString())
+    except asyncio.exceptions.CancelledError:
+        heartbeats.cancel()
+        sock.close(0)
+
+async def send_heartbeats(sock, interval=1.0):
+    '''
+    Keeps the stand-in vehicle registered as connected.
+    '''
+    heartbeat = Heartbeat()
+    while True:
+        heartbeat.sequence_number += 1
+        heartbeat.sent_time = time.monotonic()
+        await sock.send_multipart([HEARTBEAT_FRAME, heartbeat.SerializeToString()])
+        await asyncio.sleep(interval)
+
+async def sequential(sc, payload, vehicle_ids):
+    '''
+    Sends the command to each vehicle in turn, one Command RPC per vehicle.
+    '''
+    for vehicle_id in vehicle_ids:
+        request = CommandRequest(request=payload, method_name='Control.Hold', vehicle_id=vehicle_id)
+        final = None
+        async for response in sc.Command(request, None):
+            final = response
+        assert final.status == 2, f"Unexpected final status {final.status}"
+
+async def broadcast(sc, payload, vehicle_ids):
+    '''
+    Sends the command to every vehicle with a single BroadcastCommand RPC.
+    '''
+    request = BroadcastCommandRequest(request=payload, method_name='Control.Hold', vehicle_ids=vehicle_ids)
+    final = None
+    async for response in sc.BroadcastCommand(request, None):
+        final = response
+    assert final.response.status == 2, f"Unexpected final status {final.response.status}"
+
+def report(label, latencies):
+    latencies.sort()
+    print(f"{label}: {len(latencies)}")
+    print(f"mean:     {statistics.mean(latencies):.3f} ms")
+    print(f"p50:      {latencies[len(latencies) // 2]:.3f} ms")
+    print(f"p99:      {latencies[int(len(latencies) * 0.99) - 1]:.3f} ms")
+    print(f"max:      {latencies[-1]:.3f} ms")
+
+async def main(args):
+    ctx = zmq.asyncio.Context()
+    router_sock = ctx.socket(zmq.ROUTER)
+    router_sock.setsockopt(zmq.ROUTER_HANDOVER, 1)
+    router_sock.bind(args.endpoint)
+    sc = SwarmController(router_sock, response_timeout=5.0)
+    vehicle_ids = [f'bench{i}' for i in range(max(args.vehicles, 1))]
+    vehicles = [
+        asyncio.create_task(stand_in_vehicle(ctx, args.endpoint, vehicle_id, args.progress))
+        for vehicle_id in vehicle_ids
+    ]
+    # Give the DEALERs time to connect so the ROUTER can route to them
+    await asyncio.sleep(0.5)
+
+    payload = any_pb2.Any()
+    payload.Pack(HoldRequest())
+    modes = [('commands', sequential)]
+    if args.vehicles:
+        modes = [('sequential', sequential), ('broadcast', broadcast)]
+    for label, func in modes:
+        latencies = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            await func(sc, payload, vehicle_ids)
+            latencies.append((time.perf_counter() - start) * 1000)
+        report(label, latencies)
+
+    for vehicle in vehicles:
+        vehicle.cancel()
+    sc.listener_task.cancel()
+    await asyncio.gather(*vehicles, sc.listener_task, return_exceptions=True)
+    router_sock.close(0)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--iterations", type=int, default=1000, help="Number of commands to send [default: 1000]")
+    parser.add_argument("-p", "--progress", type=int, default=0, help="IN_PROGRESS responses per command [default: 0]")
+    parser.add_argument("-b", "--vehicles", type=int, default=0, help="Compare sequential and broadcast commands across this many vehicles [default: 0]")
+    parser.add_argument("-e", "--endpoint", default="tcp://127.0.0.1:5993", help="ROUTER endpoint [default: tcp://127.0.0.1:5993]")
+    asyncio.run(main(parser.parse_args()))
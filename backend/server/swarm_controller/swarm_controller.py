@@ -10,33 +10,65 @@ import asyncio
 import json
 import redis
 import os
+import time
 import zmq
 import zmq.asyncio
 import grpc
 from concurrent import futures
-import aiorwlock
+from fnmatch import fnmatch
 # Protocol imports
-from steeleagle_sdk.protocol.services.remote_service_pb2 import CompileMissionResponse, CommandResponse
+from steeleagle_sdk.protocol.services.remote_service_pb2 import CompileMissionResponse, CommandRequest, CommandResponse, BroadcastCommandResponse, \
+    Heartbeat, ListVehiclesResponse, TeleopStatus
 from steeleagle_sdk.protocol.services.remote_service_pb2_grpc import RemoteServicer, add_RemoteServicer_to_server
 from steeleagle_sdk.protocol.rpc_helpers import generate_response
 from steeleagle_sdk.dsl import build_mission
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Leading frame that marks a vehicle heartbeat (or its echo)
+HEARTBEAT_FRAME = b'heartbeat'
+# Leading frame that marks a teleop setpoint (or status)
+TELEOP_FRAME = b'teleop'
+
+@dataclass
+class VehicleStatus:
+    '''
+    Connection health of a single vehicle, as seen by the server.
+    '''
+    # Wall clock time the server last heard from the vehicle
+    last_seen: float = 0.0
+    # Most recent heartbeat round trip time reported by the vehicle
+    rtt: float = 0.0
+    # Commands sent to the vehicle that have not finished
+    in_flight: int = 0
+
 class SwarmController(RemoteServicer):
     '''
     Multiplexes requests from connected commanders to target vehicles. Also handles
     messages sent between vehicles.
     '''
-    def __init__(self, _router_sock):
+    def __init__(self, _router_sock, response_timeout=30.0, liveness_timeout=5.0):
         self._router_sock: zmq.Socket = _router_sock
         self._sequence_number_lock = asyncio.Lock()
         self._sequence_number = 0
-        self._response_map_lock = aiorwlock.RWLock()
-        self._response_map = {}
+        # Maximum time to wait between responses from a vehicle before
+        # a command is considered dead
+        self._response_timeout = response_timeout
+        # Maps in-flight sequence numbers to the queue their responses
+        # are delivered on
+        self._response_queues = {}
+        # Connection table of every vehicle that has contacted the server;
+        # a vehicle is connected if it was heard from within the liveness
+        # timeout (a falsy timeout disables the check)
+        self._vehicles = {}
+        self._liveness_timeout = liveness_timeout
+        # Maps vehicle IDs to the queue of their open teleop channel;
+        # a vehicle has at most one, and opening another replaces it
+        self._teleop_queues = {}
+        self._teleop_channel = 0
         self.listener_task = asyncio.create_task(self._listen_for_responses())
         logger.info("SwarmController initialized.") 
         
@@ -57,46 +89,332 @@ class SwarmController(RemoteServicer):
         '''
         Gets the current sequence number, then increases it.
         '''
+        return (await self._get_sequence_numbers(1))[0]
+
+    async def _get_sequence_numbers(self, count):
+        '''
+        Reserves a contiguous block of sequence numbers.
+        '''
         async with self._sequence_number_lock:
-            new_sequence_number = self._sequence_number
-            self._sequence_number += 1
-            return new_sequence_number
+            start = self._sequence_number
+            self._sequence_number += count
+            return range(start, start + count)
 
-    async def _poll_for_response(self, sequence_number):
+    def _is_connected(self, vehicle):
         '''
-        Check to see if a response has been received for a RemoteControl request.
+        Checks whether a vehicle has been heard from recently enough.
         '''
-        async with self._response_map_lock.reader_lock:
-            return self._response_map[sequence_number] if sequence_number in self._response_map \
-                else None
-    
+        if not self._liveness_timeout:
+            return True
+        return time.time() - vehicle.last_seen <= self._liveness_timeout
+
+    def _connected_vehicle(self, vehicle_id):
+        '''
+        Gets the status of a vehicle, or None if it is not connected.
+        '''
+        vehicle = self._vehicles.get(vehicle_id)
+        if vehicle is None and not self._liveness_timeout:
+            vehicle = self._vehicles[vehicle_id] = VehicleStatus()
+        if vehicle is None or not self._is_connected(vehicle):
+            return None
+        return vehicle
+
     async def Command(self, request, context):
         '''
         Implementation of RPC Command method defined in the SDK.
         '''
+        sequence_number = None
+        vehicle = None
         try:
             yield generate_response(0)
-            request.sequence_number = await self._get_sequence_number()
+            # Fail fast rather than sending into the void; the ROUTER
+            # socket silently drops messages for unknown identities
+            if self._connected_vehicle(request.vehicle_id) is None:
+                logger.error(f"Rejecting command for disconnected vehicle {request.vehicle_id}")
+                yield generate_response(16, resp_string="Vehicle is not connected")
+                return
+            sequence_number = await self._get_sequence_number()
+            request.sequence_number = sequence_number
             request.identity = 'server'
+            # Register before sending so a fast reply cannot be missed
+            queue = asyncio.Queue()
+            self._response_queues[sequence_number] = queue
+            vehicle = self._vehicles[request.vehicle_id]
+            vehicle.in_flight += 1
             await self._router_sock.send_multipart(
                 [request.vehicle_id.encode("utf-8"), request.SerializeToString()]
             )
-            response = None
-            while not response:
-                yield generate_response(1) 
-                await asyncio.sleep(1)
-                response = await self._poll_for_response(request.sequence_number)
-            yield response if response else generate_response(3)
+            # Vehicles relay progress (OK/IN_PROGRESS) for streaming
+            # commands, so stream responses until a final one arrives
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._response_timeout
+            while True:
+                try:
+                    # Wake up at least once per liveness period so a lost
+                    # vehicle is noticed before the response timeout
+                    wait = deadline - loop.time()
+                    if self._liveness_timeout:
+                        wait = min(wait, self._liveness_timeout)
+                    response = (await asyncio.wait_for(queue.get(), max(wait, 0))).response
+                except asyncio.TimeoutError:
+                    if not self._is_connected(vehicle):
+                        logger.error(f"Lost connection to {request.vehicle_id} while waiting on {sequence_number}")
+                        yield generate_response(16, resp_string="Lost connection to vehicle")
+                        break
+                    if loop.time() < deadline:
+                        continue
+                    logger.error(f"Timed out waiting for {request.vehicle_id} to respond to {sequence_number}")
+                    yield generate_response(6, resp_string="Timed out waiting for vehicle response")
+                    break
+                yield response
+                if response.status > 1:
+                    break
+                deadline = loop.time() + self._response_timeout
         except Exception as e:
             logger.error(f"Error sending request to vehicle: {e}")
             yield generate_response(4)
+        finally:
+            # Evict the entry so late responses are dropped
+            self._response_queues.pop(sequence_number, None)
+            if vehicle is not None:
+                vehicle.in_flight -= 1
+
+    async def Teleop(self, request_iterator, context):
+        '''
+        Implementation of RPC Teleop method defined in the SDK. Setpoints
+        are relayed to the vehicle as they arrive, without waiting for one
+        another, and the vehicle's status reports are streamed back. The
+        vehicle drops stale setpoints and holds if they stop arriving.
+        '''
+        self._teleop_channel += 1
+        channel = self._teleop_channel
+        queue = asyncio.Queue()
+        vehicle_id = None
+        opened = asyncio.Event()
+
+        async def relay():
+            nonlocal vehicle_id
+            try:
+                async for setpoint in request_iterator:
+                    if vehicle_id is None:
+                        vehicle_id = setpoint.vehicle_id
+                        opened.set()
+                        if self._connected_vehicle(vehicle_id) is None:
+                            return
+                        self._teleop_queues[vehicle_id] = queue
+                    setpoint.vehicle_id = vehicle_id
+                    setpoint.identity = 'server'
+                    setpoint.channel = channel
+                    await self._router_sock.send_multipart(
+                        [vehicle_id.encode("utf-8"), TELEOP_FRAME, setpoint.SerializeToString()]
+                    )
+            finally:
+                # The channel closes once the commander stops sending
+                opened.set()
+                queue.put_nowait(None)
+
+        relay_task = asyncio.create_task(relay())
+        try:
+            await opened.wait()
+            if vehicle_id is None:
+                return
+            vehicle = self._connected_vehicle(vehicle_id)
+            if vehicle is None:
+                logger.error(f"Rejecting teleop for disconnected vehicle {vehicle_id}")
+                yield TeleopStatus(
+                    vehicle_id=vehicle_id,
+                    response=generate_response(16, resp_string="Vehicle is not connected")
+                )
+                return
+            logger.info(f"Teleop channel {channel} opened to {vehicle_id}")
+            while True:
+                try:
+                    wait = self._liveness_timeout or None
+                    status = await asyncio.wait_for(queue.get(), wait)
+                except asyncio.TimeoutError:
+                    if not self._is_connected(vehicle):
+                        logger.error(f"Lost connection to {vehicle_id} during teleop")
+                        yield TeleopStatus(
+                            vehicle_id=vehicle_id,
+                            response=generate_response(16, resp_string="Lost connection to vehicle")
+                        )
+                        break
+                    continue
+                if status is None:
+                    break
+                yield status
+        except Exception as e:
+            logger.error(f"Error relaying teleop to vehicle: {e}")
+            yield TeleopStatus(vehicle_id=vehicle_id or '', response=generate_response(4))
+        finally:
+            relay_task.cancel()
+            # Another channel may have replaced this one
+            if vehicle_id is not None and self._teleop_queues.get(vehicle_id) is queue:
+                del self._teleop_queues[vehicle_id]
+
+    def _select_vehicles(self, request):
+        '''
+        Resolves the explicit vehicle IDs and selector of a broadcast
+        into an ordered list of unique vehicle IDs.
+        '''
+        vehicle_ids = list(dict.fromkeys(request.vehicle_ids))
+        if request.selector:
+            selected = set(vehicle_ids)
+            vehicle_ids += sorted(
+                v for v, vehicle in self._vehicles.items()
+                if v not in selected and fnmatch(v, request.selector) and self._is_connected(vehicle)
+            )
+        return vehicle_ids
+
+    async def BroadcastCommand(self, request, context):
+        '''
+        Implementation of RPC BroadcastCommand method defined in the SDK.
+        Sends one command to every target vehicle up front, then streams
+        responses as they arrive. Each vehicle gets its own response
+        timeout, and the stream ends with an aggregate response.
+        '''
+        vehicle_ids = self._select_vehicles(request)
+        timeout = request.timeout if request.HasField('timeout') else self._response_timeout
+        # Maps in-flight sequence numbers to their vehicle and deadline
+        pending = {}
+        deadlines = {}
+        failed = []
+        try:
+            yield BroadcastCommandResponse(response=generate_response(0))
+            if not vehicle_ids:
+                yield BroadcastCommandResponse(
+                    response=generate_response(7, resp_string="No vehicles matched the broadcast")
+                )
+                return
+            # All responses land on a single queue so they are relayed
+            # in arrival order regardless of which vehicle sent them
+            queue = asyncio.Queue()
+            loop = asyncio.get_running_loop()
+            command = CommandRequest(
+                request=request.request,
+                method_name=request.method_name,
+                identity='server'
+            )
+            for vehicle_id in vehicle_ids:
+                if self._connected_vehicle(vehicle_id) is None:
+                    failed.append(vehicle_id)
+                    yield BroadcastCommandResponse(
+                        vehicle_id=vehicle_id,
+                        response=generate_response(16, resp_string="Vehicle is not connected")
+                    )
+            connected = [v for v in vehicle_ids if v not in failed]
+            deadline = loop.time() + timeout
+            for sequence_number, vehicle_id in zip(await self._get_sequence_numbers(len(connected)), connected):
+                command.sequence_number = sequence_number
+                command.vehicle_id = vehicle_id
+                self._response_queues[sequence_number] = queue
+                pending[sequence_number] = vehicle_id
+                deadlines[sequence_number] = deadline
+                self._vehicles[vehicle_id].in_flight += 1
+                await self._router_sock.send_multipart(
+                    [vehicle_id.encode("utf-8"), command.SerializeToString()]
+                )
+            while pending:
+                try:
+                    wait = min(deadlines.values()) - loop.time()
+                    if self._liveness_timeout:
+                        wait = min(wait, self._liveness_timeout)
+                    wrapper = await asyncio.wait_for(queue.get(), max(wait, 0))
+                except asyncio.TimeoutError:
+                    now = loop.time()
+                    for sequence_number in list(pending):
+                        vehicle_id = pending[sequence_number]
+                        if not self._is_connected(self._vehicles[vehicle_id]):
+                            logger.error(f"Lost connection to {vehicle_id} while waiting on {sequence_number}")
+                            response = generate_response(16, resp_string="Lost connection to vehicle")
+                        elif deadlines[sequence_number] <= now:
+                            logger.error(f"Timed out waiting for {vehicle_id} to respond to {sequence_number}")
+                            response = generate_response(6, resp_string="Timed out waiting for vehicle response")
+                        else:
+                            continue
+                        self._finish_broadcast(sequence_number, pending, deadlines)
+                        failed.append(vehicle_id)
+                        yield BroadcastCommandResponse(vehicle_id=vehicle_id, response=response)
+                    continue
+                sequence_number = wrapper.sequence_number
+                vehicle_id = pending.get(sequence_number)
+                if vehicle_id is None:
+                    # Queued just before the vehicle timed out
+                    continue
+                yield BroadcastCommandResponse(vehicle_id=vehicle_id, response=wrapper.response)
+                if wrapper.response.status > 1:
+                    self._finish_broadcast(sequence_number, pending, deadlines)
+                    if wrapper.response.status != 2:
+                        failed.append(vehicle_id)
+                else:
+                    deadlines[sequence_number] = loop.time() + timeout
+            completed = len(vehicle_ids) - len(failed)
+            yield BroadcastCommandResponse(
+                response=generate_response(
+                    2 if not failed else 12,
+                    resp_string=f"{completed}/{len(vehicle_ids)} vehicles completed the command"
+                ),
+                failed_vehicle_ids=failed
+            )
+        except Exception as e:
+            logger.error(f"Error broadcasting request to vehicles: {e}")
+            yield BroadcastCommandResponse(
+                response=generate_response(4),
+                failed_vehicle_ids=failed + list(pending.values())
+            )
+        finally:
+            for sequence_number in list(pending):
+                self._finish_broadcast(sequence_number, pending, deadlines)
+
+    def _finish_broadcast(self, sequence_number, pending, deadlines):
+        '''
+        Stops tracking one vehicle's part of a broadcast.
+        '''
+        vehicle_id = pending.pop(sequence_number)
+        del deadlines[sequence_number]
+        self._response_queues.pop(sequence_number, None)
+        self._vehicles[vehicle_id].in_flight -= 1
+
+    async def ListVehicles(self, request, context):
+        '''
+        Implementation of RPC ListVehicles method defined in the SDK.
+        '''
+        response = ListVehiclesResponse(response=generate_response(2))
+        for vehicle_id, vehicle in sorted(self._vehicles.items()):
+            connected = self._is_connected(vehicle)
+            if not connected and not request.include_disconnected:
+                continue
+            connection = response.vehicles.add(
+                vehicle_id=vehicle_id,
+                connected=connected,
+                rtt=vehicle.rtt,
+                in_flight=vehicle.in_flight
+            )
+            connection.last_seen.FromNanoseconds(int(vehicle.last_seen * 1e9))
+        return response
 
     async def _listen_for_responses(self):
         try:
             logger.info("Starting listener for vehicle responses...")
             while True:
-                logger.info("Listening for vehicle responses...")
-                _, data = await self._router_sock.recv_multipart()
+                frames = await self._router_sock.recv_multipart()
+                # Any message from a vehicle counts as a sign of life
+                vehicle_id = frames[0].decode("utf-8")
+                vehicle = self._vehicles.get(vehicle_id)
+                if vehicle is None:
+                    logger.info(f"Vehicle {vehicle_id} connected")
+                    vehicle = self._vehicles[vehicle_id] = VehicleStatus()
+                vehicle.last_seen = time.time()
+                if len(frames) == 3 and frames[1] == HEARTBEAT_FRAME:
+                    await self._handle_heartbeat(vehicle, frames)
+                    continue
+                if len(frames) == 3 and frames[1] == TELEOP_FRAME:
+                    self._handle_teleop(vehicle_id, frames[2])
+                    continue
+                if len(frames) != 2:
+                    logger.warning(f"Dropping malformed message from {vehicle_id}")
+                    continue
+                data = frames[1]
                 # Parse the raw data into a response
                 response = CommandResponse()
                 try:
@@ -104,12 +422,45 @@ class SwarmController(RemoteServicer):
                 except Exception as e:
                     logger.error(f"Failed to parse response from vehicle: {e}")
                     continue
-                logger.info(f"Received response: {response}, seq_num: {response.sequence_number}")
-                async with self._response_map_lock.writer_lock:
-                    self._response_map[response.sequence_number] = response.response
+                logger.debug(f"Received response: {response}, seq_num: {response.sequence_number}")
+                queue = self._response_queues.get(response.sequence_number)
+                if queue is None:
+                    logger.warning(f"Dropping response for unknown sequence number {response.sequence_number}")
+                    continue
+                queue.put_nowait(response)
         except asyncio.exceptions.CancelledError:
             return
 
+    def _handle_teleop(self, vehicle_id, data):
+        '''
+        Delivers a teleop status to the vehicle's open teleop channel.
+        '''
+        queue = self._teleop_queues.get(vehicle_id)
+        if queue is None:
+            logger.debug(f"Dropping teleop status from {vehicle_id} with no open channel")
+            return
+        status = TeleopStatus()
+        try:
+            status.ParseFromString(data)
+        except Exception as e:
+            logger.error(f"Failed to parse teleop status from vehicle: {e}")
+            return
+        queue.put_nowait(status)
+
+    async def _handle_heartbeat(self, vehicle, frames):
+        '''
+        Records the round trip time reported in a heartbeat, then echoes
+        it back so the vehicle can measure the next one.
+        '''
+        heartbeat = Heartbeat()
+        try:
+            heartbeat.ParseFromString(frames[2])
+        except Exception as e:
+            logger.error(f"Failed to parse heartbeat from vehicle: {e}")
+            return
+        vehicle.rtt = heartbeat.rtt
+        await self._router_sock.send_multipart(frames)
+
 async def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -134,6 +485,20 @@ async def main():
         help="Set port number for redis connection [default: 6379]",
     )
     parser.add_argument("-a", "--auth", default="", help="Shared key for redis user.")
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to wait between vehicle responses before a command times out [default: 30]",
+    )
+    parser.add_argument(
+        "-l",
+        "--liveness",
+        type=float,
+        default=5.0,
+        help="Seconds without a heartbeat before a vehicle is considered disconnected; 0 disables the check [default: 5]",
+    )
     args = parser.parse_args()
 
     # Connect to redis
@@ -157,7 +522,7 @@ async def main():
     server = grpc.aio.server(
             futures.ThreadPoolExecutor(max_workers=10)
             )
-    sc = SwarmController(router_sock)
+    sc = SwarmController(router_sock, response_timeout=args.timeout, liveness_timeout=args.liveness)
     add_RemoteServicer_to_server(sc, server)
     server.add_insecure_port(f'[::]:{args.commander_port}')
     logger.info(f"Listening on tcp//*:{args.commander_port} for commander connections...")
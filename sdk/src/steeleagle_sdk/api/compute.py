@@ -17,12 +17,14 @@ class Compute:
 
     async def get_result(self, topic):
         source = "results"
+        await self.mission_store.subscribe_results(topic)
         return await self.mission_store.get_latest(source, topic)
 
     async def add_datasinks(self, datasinks:List[DatasinkInfo]) -> Response:
         req = compute_proto.AddDatasinksRequest()
         for d in datasinks:
             ParseDict(d.model_dump(exclude_none=True), req.datasinks.add())
+            await self.mission_store.subscribe_results(d.id)
         return await run_unary(self.compute.AddDatasinks, req)
     
     async def set_datasinks(self, datasinks:List[DatasinkInfo]) -> Response:
@@ -37,6 +39,7 @@ class Compute:
         req = compute_proto.SetDatasinksRequest()
         for d in datasinks:
             ParseDict(d.model_dump(exclude_none=True), req.datasinks.add())
+            await self.mission_store.subscribe_results(d.id)
         return await run_unary(self.compute.SetDatasinks, req)
 
     async def remove_datasinks(self, datasinks:List[DatasinkInfo]) -> Response:
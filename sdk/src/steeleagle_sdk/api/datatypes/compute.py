@@ -1,4 +1,5 @@
 
+from typing import Optional
 from enum import Enum
 from ._base import Datatype
 
@@ -13,13 +14,31 @@ class DatasinkLocation(int, Enum):
     REMOTE = 0 
     LOCAL = 1 
 
+class DatasinkPolicy(Datatype):
+    """Telemetry delivery policy for a datasink.
+
+    Rate limited datasinks receive at most `max_rate` telemetry messages per
+    second per stream, coalesced so that only the latest sample in each window
+    is sent. Datasinks with a change threshold only receive a sample when a
+    numeric field has changed by more than the threshold (or any other field
+    has changed) since the last sample they were sent. Imagery is not affected.    
+    
+    Attributes:
+        max_rate (Optional[float]): maximum telemetry messages per second per stream (0 for unlimited)    
+        change_threshold (Optional[float]): minimum change in a numeric field before a sample is resent    
+    """
+    max_rate: Optional[float] = None
+    change_threshold: Optional[float] = None
+
 class DatasinkInfo(Datatype):
     """Information about a datasink.    
     
     Attributes:
         id (str): datasink ID    
         location (DatasinkLocation): datasink location    
+        policy (Optional[DatasinkPolicy]): telemetry delivery policy (every sample if unset)    
     """
     id: str
     location: DatasinkLocation
+    policy: Optional[DatasinkPolicy] = None
 
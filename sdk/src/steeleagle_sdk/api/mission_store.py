@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 import asyncio, time, json, logging
-from typing import Optional, Any
+from typing import Callable, Optional, Any
 import aiosqlite
 import zmq, zmq.asyncio
 from google.protobuf.json_format import MessageToDict
@@ -11,7 +11,7 @@ from .datatypes.telemetry import DriverTelemetry
 from .datatypes.result import FrameResult
 from ..protocol.messages import telemetry_pb2 as telem_proto
 from ..protocol.messages import result_pb2 as result_proto
-from gabriel_protocol import gabriel_pb2
+from ..protocol.rpc_helpers import result_topic
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +36,33 @@ ON CONFLICT(source, topic) DO UPDATE SET
   payload_json=excluded.payload_json
 """
 
-SQL_SELECT_LATEST = "SELECT payload_json FROM latest WHERE source=? AND topic=?"
+FRAME_RESULT_TYPE = result_proto.FrameResult.DESCRIPTOR.full_name
+# Seconds to wait for the kernel's result cache to answer
+CACHE_TIMEOUT = 0.5
+# Seconds between batched commits of the write-behind store
+FLUSH_INTERVAL = 1.0
+
+class LatestValue:
+    """
+    Latest sample of one (source, topic). The model is only built from the
+    raw payload the first time it is read, so samples nobody reads cost
+    nothing beyond keeping the bytes.
+    """
+    __slots__ = ("version", "ts", "_payload", "_parse", "_model")
+
+    def __init__(self, version: int, ts: float, payload: Any, parse: Callable[[Any], Any]):
+        self.version = version
+        self.ts = ts
+        self._payload = payload
+        self._parse = parse
+        self._model = None
+
+    @property
+    def model(self):
+        if self._parse is not None:
+            self._model = self._parse(self._payload)
+            self._payload = self._parse = None
+        return self._model
 
 class MissionStore:
     # ---------- utils ----------
@@ -53,91 +79,204 @@ class MissionStore:
         except Exception:
             return json.dumps(model, default=lambda o: getattr(o, "__dict__", str(o)))
 
-    @staticmethod
-    def _from_json(source: str, payload_json: str):
-        try:
-            data = json.loads(payload_json)
-            if data is None:
-                return None
-            if source == "telemetry":
-                return DriverTelemetry.model_validate(data)
-            if source == "results":
-                return FrameResult.model_validate(data)
-        except Exception:
-            logger.exception("Decode failed for %s", source)
-        return None
+    def __init__(self, telemetry_addr: str, results_addr: str, db_path: Optional[str] = None,
+                 results_cache_addr: Optional[str] = None, result_topics: Optional[list[str]] = None,
+                 flush_interval: float = FLUSH_INTERVAL):
+        """
+        The latest sample of every (source, topic) is kept in memory with a
+        version that increases on every update; readers either take it with
+        `get_latest` or block in `wait_for_update` until a newer one arrives.
+        If db_path is set, samples are also written behind to SQLite, in
+        one batched commit every flush_interval seconds.
 
-    def __init__(self, telemetry_addr: str, results_addr: str, db_path: str = "mission.db"):
+        Results are only received for the engines in result_topics, plus
+        any subscribed to later with `subscribe_results`; if result_topics
+        is None, every result is received. If results_cache_addr is set,
+        the latest result of each engine is fetched from the kernel when it
+        is subscribed to, rather than waiting for the next one.
+        """
         self.telemetry_addr = telemetry_addr
         self.results_addr = results_addr
+        self.results_cache_addr = results_cache_addr
         self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._result_topics = None if result_topics is None else set(result_topics)
+
+        # Latest sample and update event, by (source, topic); the event is
+        # replaced on every update, so waiters hold the one they waited on
+        self._latest: dict[tuple[str, str], LatestValue] = {}
+        self._updated: dict[tuple[str, str], asyncio.Event] = {}
+        # Samples not yet written behind, by (source, topic)
+        self._dirty: dict[tuple[str, str], LatestValue] = {}
 
         self.db: Optional[aiosqlite.Connection] = None
         self.ctx = zmq.asyncio.Context(io_threads=2)
 
         self._telemetry = None
         self._results = None
+        self._results_cache = None
+        self._cache_lock = asyncio.Lock()
         self._tasks: list[asyncio.Task] = []
 
     # ---------- store ----------
-    def _parse_payload(self, source: str, payload: bytes):
+    @staticmethod
+    def _parse_telemetry(payload: bytes):
         try:
-            if source == "telemetry":
-                msg = telem_proto.DriverTelemetry(); msg.ParseFromString(payload)
-                data = MessageToDict(msg, preserving_proto_field_name=True)
-                return DriverTelemetry.model_validate(data)
-            elif source == "results":
-                msg = gabriel_pb2.ResultWrapper(); msg.ParseFromString(payload)
-                logger.info(f'payload:  {msg}')
-                frame_result  = msg.extras
-                logger.info(f'frame_result:  {frame_result}')
-                data = MessageToDict(frame_result, preserving_proto_field_name=True)
-                return FrameResult.model_validate(data)
+            msg = telem_proto.DriverTelemetry(); msg.ParseFromString(payload)
+            data = MessageToDict(msg, preserving_proto_field_name=True)
+            return DriverTelemetry.model_validate(data)
         except Exception:
-            logger.exception("Parse failed for %s payload", source)
+            logger.exception("Parse failed for telemetry payload")
         return None
-    
+
+    @staticmethod
+    def _parse_result(payload: bytes):
+        try:
+            msg = result_proto.FrameResult(); msg.ParseFromString(payload)
+            data = MessageToDict(msg, preserving_proto_field_name=True)
+            return FrameResult.model_validate(data)
+        except Exception:
+            logger.exception("Parse failed for results payload")
+        return None
+
+    def _store(self, source: str, topic: str, ts: float, payload: Any, parse: Callable[[Any], Any]):
+        key = (source, topic)
+        current = self._latest.get(key)
+        value = LatestValue(current.version + 1 if current else 1, ts, payload, parse)
+        self._latest[key] = value
+        if self.db is not None:
+            self._dirty[key] = value
+        updated = self._updated.pop(key, None)
+        if updated is not None:
+            updated.set()
+
+    def _store_result(self, data: bytes, only_newer: bool = False):
+        """
+        Store a result envelope. Results from the subscription are always
+        stored; with only_newer, as for cache replies that can race them,
+        a result is dropped if the stored one has a later envelope timestamp.
+        """
+        envelope = result_proto.ResultEnvelope()
+        try:
+            envelope.ParseFromString(data)
+        except Exception:
+            logger.exception("Parse failed for result envelope")
+            return
+        # Only frame results are decoded; other types are not stored
+        if envelope.type != FRAME_RESULT_TYPE:
+            return
+        ts = envelope.timestamp.ToNanoseconds() / 1e9
+        if only_newer:
+            current = self._latest.get(("results", envelope.engine_id))
+            if current is not None and ts < current.ts:
+                return
+        self._store("results", envelope.engine_id, ts, envelope.payload, self._parse_result)
+
+    async def _write_behind(self):
+        """Commit the samples stored since the last flush, one batch per interval."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self._flush()
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush(self):
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        rows = [(source, topic, value.ts, self._to_json(value.model))
+                for (source, topic), value in dirty.items()]
+        try:
+            await self.db.executemany(SQL_UPSERT_LATEST, rows)
+            await self.db.commit()
+        except Exception:
+            logger.exception("DB upsert failed for %d samples", len(rows))
+
     async def _receive_and_store(self, source: str, sock: zmq.asyncio.Socket):
         try:
             while True:
                 frames = await sock.recv_multipart()
                 if not frames:
                     continue
+                if source == "results":
+                    if frames[0].startswith(result_topic('telemetry')):
+                        continue # ignore telmetry engine
+                    self._store_result(frames[-1])
+                    continue
                 topic = self._norm_topic(frames[0])
-                if topic == 'telemetry':
-                    continue # ignore telmetry engine
-                payload = frames[-1]
-
-                model = self._parse_payload(source, payload)
-                ts = time.time()
-                pj = self._to_json(model)
-
-                try:
-                    await self.db.execute(SQL_UPSERT_LATEST, (source, topic, ts, pj))
-                    await self.db.commit()
-                except Exception:
-                    logger.exception("DB upsert failed for %s/%s", source, topic)
+                self._store(source, topic, time.time(), frames[-1], self._parse_telemetry)
         except asyncio.CancelledError:
             pass
         except Exception:
             logger.exception("Consumer crashed (%s)", source)
     
+    # ---------- subscriptions ----------
+    async def subscribe_results(self, engine_id: str):
+        """Start receiving results from an engine, fetching its latest result."""
+        if self._result_topics is None or engine_id in self._result_topics:
+            return
+        self._result_topics.add(engine_id)
+        if self._results:
+            self._results.setsockopt(zmq.SUBSCRIBE, result_topic(engine_id))
+            await self._fetch_latest_results(result_topic(engine_id))
+
+    async def _fetch_latest_results(self, prefix: bytes):
+        """Store the latest result of every topic matching prefix from the kernel cache."""
+        if not self._results_cache:
+            return
+        async with self._cache_lock:
+            await self._results_cache.send(prefix)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + CACHE_TIMEOUT
+            try:
+                while True:
+                    frames = await asyncio.wait_for(
+                        self._results_cache.recv_multipart(), max(deadline - loop.time(), 0))
+                    # Skip replies to requests that timed out earlier
+                    if frames[0] == prefix:
+                        break
+            except asyncio.TimeoutError:
+                logger.warning("No reply from result cache for %s", prefix)
+                return
+        for data in frames[2::2]:
+            self._store_result(data, only_newer=True)
+
     # ---------- reads ----------
     async def get_latest(self, source: str, topic: str) -> Datatype:
-        """Read latest from DB and return decoded model (no cache)."""
-        await asyncio.sleep(0)
-        async with self.db.execute(SQL_SELECT_LATEST, (source, topic)) as cur:
-            row = await cur.fetchone()
-            if not row:
-                return None
-            (payload_json,) = row
-            return self._from_json(source, payload_json)
+        """Return the latest decoded model, or None if nothing was received yet."""
+        value = self._latest.get((source, topic))
+        return value.model if value else None
+
+    def get_version(self, source: str, topic: str) -> int:
+        """Return the version of the latest sample, or 0 if nothing was received yet."""
+        value = self._latest.get((source, topic))
+        return value.version if value else 0
+
+    async def wait_for_update(self, source: str, topic: str, after_version: int = 0,
+                              timeout: Optional[float] = None) -> tuple[int, Datatype]:
+        """
+        Wait until a sample newer than after_version is stored, returning its
+        version and decoded model. Returns at once if one already is; raises
+        TimeoutError if none arrives within timeout seconds.
+        """
+        key = (source, topic)
+        async with asyncio.timeout(timeout):
+            while True:
+                value = self._latest.get(key)
+                if value is not None and value.version > after_version:
+                    return value.version, value.model
+                updated = self._updated.get(key)
+                if updated is None:
+                    updated = self._updated[key] = asyncio.Event()
+                await updated.wait()
 
     # ---------- lifecycle ----------
     async def start(self):
-        self.db = await aiosqlite.connect(self.db_path)
-        await self.db.executescript(INIT_SQL)
-        await self.db.commit()
+        if self.db_path:
+            self.db = await aiosqlite.connect(self.db_path)
+            await self.db.executescript(INIT_SQL)
+            await self.db.commit()
 
         self._telemetry = self.ctx.socket(zmq.SUB)
         self._telemetry.setsockopt(zmq.SUBSCRIBE, b"")
@@ -145,14 +284,26 @@ class MissionStore:
         self._telemetry.connect(self.telemetry_addr)
 
         self._results = self.ctx.socket(zmq.SUB)
-        self._results.setsockopt(zmq.SUBSCRIBE, b"")
+        prefixes = [b""] if self._result_topics is None else [result_topic(t) for t in self._result_topics]
+        for prefix in prefixes:
+            self._results.setsockopt(zmq.SUBSCRIBE, prefix)
         self._results.setsockopt(zmq.RCVHWM, 1000)
         self._results.connect(self.results_addr)
 
+        if self.results_cache_addr:
+            self._results_cache = self.ctx.socket(zmq.DEALER)
+            self._results_cache.setsockopt(zmq.LINGER, 0)
+            self._results_cache.connect(self.results_cache_addr)
+
         self._tasks = [
             asyncio.create_task(self._receive_and_store("telemetry", self._telemetry)),
             asyncio.create_task(self._receive_and_store("results", self._results)),
         ]
+        if self.db:
+            self._tasks.append(asyncio.create_task(self._write_behind()))
+        # Fill in results published before we subscribed
+        for prefix in prefixes:
+            await self._fetch_latest_results(prefix)
 
     async def stop(self):
         for t in self._tasks:
@@ -162,4 +313,7 @@ class MissionStore:
 
         if self._telemetry: self._telemetry.close(0); self._telemetry = None
         if self._results:   self._results.close(0);   self._results = None
-        if self.db:         await self.db.close();    self.db = None
\ No newline at end of file
+        if self._results_cache: self._results_cache.close(0); self._results_cache = None
+        if self.db:
+            await self._flush()
+            await self.db.close(); self.db = None
\ No newline at end of file
@@ -35,7 +35,8 @@ def register_data(cls: Datatype) -> Datatype:
     key = _norm(cls.__name__)
     prev = _DATA.get(key)
     _DATA[key] = cls
-    if prev and prev is not cls:
+    # Hand-written extensions of generated datatypes replace them quietly
+    if prev and prev is not cls and not issubclass(cls, prev):
         logger.warning("Overwriting datatype '%s'", key)
     else:
         logger.debug("Registered datatype '%s'", key)
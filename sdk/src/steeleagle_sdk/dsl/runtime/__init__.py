@@ -9,6 +9,7 @@ import grpc
 from ...api.vehicle import Vehicle
 from ...api.compute import Compute
 from ...api.mission_store import MissionStore
+from .conditions import Conditions
 from .fsm import MissionFSM
 from ..compiler.ir import MissionIR
 
@@ -20,6 +21,7 @@ COMPUTE: Optional[Compute] = None
 MAP = None
 _CHANNEL: Optional[grpc.aio.Channel] = None
 _STORE: Optional[MissionStore] = None
+CONDITIONS: Optional[Conditions] = None
 _FSM: Optional[MissionFSM] = None
 _FSM_TASK: Optional[asyncio.Task] = None
 _STARTED: bool = False
@@ -32,12 +34,14 @@ async def init(
     telemetry_address: str,
     result_address: str,
     map_obj,
+    result_cache_address: Optional[str] = None,
 ) -> None:
     """
     Initialize runtime singletons and start the MissionFSM loop.
     Safe to call multiple times — subsequent calls are ignored.
+    Results are only received for engines the mission uses.
     """
-    global VEHICLE, COMPUTE, MAP, _CHANNEL, _STORE, _FSM, _FSM_TASK, _STARTED
+    global VEHICLE, COMPUTE, MAP, CONDITIONS, _CHANNEL, _STORE, _FSM, _FSM_TASK, _STARTED
 
     async with _LOCK:
         if _STARTED:
@@ -48,13 +52,15 @@ async def init(
         try:
             _CHANNEL = grpc.aio.insecure_channel(vehicle_address)
 
-            _STORE = MissionStore(telemetry_address, result_address)
+            _STORE = MissionStore(telemetry_address, result_address,
+                                  results_cache_addr=result_cache_address, result_topics=[])
             await _STORE.start()
             logger.info("MissionStore started (telemetry=%s, results=%s).",
                         telemetry_address, result_address)
 
             VEHICLE = Vehicle(_CHANNEL, _STORE)
             COMPUTE = Compute(_CHANNEL, _STORE)
+            CONDITIONS = Conditions(_STORE)
             MAP = map_obj
 
             _FSM = MissionFSM(mission)
@@ -72,7 +78,7 @@ async def init(
                 if _CHANNEL:
                     await _CHANNEL.close()
 
-            VEHICLE = COMPUTE = MAP = None
+            VEHICLE = COMPUTE = MAP = CONDITIONS = None
             _CHANNEL = _STORE = _FSM = _FSM_TASK = None
             _STARTED = False
             raise
@@ -83,7 +89,7 @@ async def term() -> None:
     Stop the FSM task, shut down streams, and close the gRPC channel.
     Safe to call multiple times.
     """
-    global VEHICLE, COMPUTE, MAP, _CHANNEL, _STORE, _FSM, _FSM_TASK, _STARTED
+    global VEHICLE, COMPUTE, MAP, CONDITIONS, _CHANNEL, _STORE, _FSM, _FSM_TASK, _STARTED
 
     async with _LOCK:
         if not _STARTED:
@@ -99,6 +105,10 @@ async def term() -> None:
         _FSM_TASK = None
         _FSM = None
 
+        if CONDITIONS:
+            await CONDITIONS.close()
+        CONDITIONS = None
+
         if _STORE:
             try:
                 await _STORE.stop()
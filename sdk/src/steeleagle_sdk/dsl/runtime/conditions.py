@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Tuple
+
+from ...api.mission_store import MissionStore
+from .predicates import CompiledPredicate, PredicateTable
+
+logger = logging.getLogger(__name__)
+
+Predicate = Callable[[Any], bool]
+StreamKey = Tuple[str, str]
+
+
+class Conditions:
+    """
+    Wakes events when the stream they watch gets a new sample, instead of
+    having each event poll the MissionStore. Every (source, topic) with
+    waiting events has one watcher task, which evaluates the predicates
+    of all of them against each new sample in a single pass. Compiled
+    predicates are checked together in one vectorized pass per sample.
+    """
+
+    def __init__(self, store: MissionStore):
+        self._store = store
+        # Waiting predicates and the futures they resolve, by stream
+        self._waiting: Dict[StreamKey, List[Tuple[Predicate, asyncio.Future]]] = {}
+        # Waiting compiled predicates and the futures they resolve, by stream and slot
+        self._tables: Dict[StreamKey, PredicateTable] = {}
+        self._compiled: Dict[StreamKey, Dict[int, asyncio.Future]] = {}
+        self._watchers: Dict[StreamKey, asyncio.Task] = {}
+
+    async def wait_for(self, source: str, topic: str, predicate: Predicate) -> Any:
+        """
+        Wait until a sample of (source, topic) satisfies predicate, and
+        return that sample. The latest sample is checked first, so a
+        condition that already holds returns without waiting for the next.
+        """
+        key = (source, topic)
+        if source == "results":
+            await self._store.subscribe_results(topic)
+        version = self._store.get_version(source, topic)
+        if version:
+            sample = await self._store.get_latest(source, topic)
+            if sample is not None and predicate(sample):
+                return sample
+
+        future = asyncio.get_running_loop().create_future()
+        if isinstance(predicate, CompiledPredicate):
+            slot = self._tables.setdefault(key, PredicateTable()).add(predicate)
+            self._compiled.setdefault(key, {})[slot] = future
+        else:
+            entry = (predicate, future)
+            self._waiting.setdefault(key, []).append(entry)
+        watcher = self._watchers.get(key)
+        if watcher is None or watcher.done():
+            self._watchers[key] = asyncio.create_task(self._watch(key, version), name=f"conditions:{source}/{topic}")
+        try:
+            return await future
+        finally:
+            if isinstance(predicate, CompiledPredicate):
+                if self._compiled.get(key, {}).pop(slot, None) is not None:
+                    self._tables[key].remove(slot)
+            else:
+                waiting = self._waiting.get(key)
+                if waiting and entry in waiting:
+                    waiting.remove(entry)
+
+    def _has_waiting(self, key: StreamKey) -> bool:
+        return bool(self._waiting.get(key) or self._compiled.get(key))
+
+    async def _watch(self, key: StreamKey, version: int) -> None:
+        try:
+            # Stops after the first sample with nobody left waiting
+            while self._has_waiting(key):
+                version, sample = await self._store.wait_for_update(*key, version)
+                if sample is None:
+                    continue  # undecodable sample
+                compiled = self._compiled.get(key)
+                if compiled:
+                    try:
+                        for slot in self._tables[key].evaluate(sample):
+                            if not compiled[slot].done():
+                                compiled[slot].set_result(sample)
+                    except Exception as e:
+                        for future in compiled.values():
+                            if not future.done():
+                                future.set_exception(e)
+                for predicate, future in list(self._waiting.get(key, [])):
+                    if future.done():
+                        continue
+                    try:
+                        if predicate(sample):
+                            future.set_result(sample)
+                    except Exception as e:
+                        future.set_exception(e)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if self._watchers.get(key) is asyncio.current_task():
+                del self._watchers[key]
+
+    async def close(self) -> None:
+        """Stop watching; events still waiting are cancelled."""
+        watchers = list(self._watchers.values())
+        for task in watchers:
+            task.cancel()
+        await asyncio.gather(*watchers, return_exceptions=True)
+        for waiting in self._waiting.values():
+            for _, future in waiting:
+                future.cancel()
+        for compiled in self._compiled.values():
+            for future in compiled.values():
+                future.cancel()
+        self._waiting.clear()
+        self._compiled.clear()
+        self._tables.clear()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def _column(sample: Any, path: List[str]) -> float:
+    """
+    Read a split dotted attribute path from a sample as a float. Missing
+    values are NaN, which fail every comparison; sub-messages read as 1.0,
+    so a path can also be used to check that a message is present.
+    """
+    value = sample
+    for name in path:
+        value = getattr(value, name, None)
+        if value is None:
+            return math.nan
+    if isinstance(value, (bool, int, float)):
+        return float(value)
+    return 1.0
+
+
+@dataclass(frozen=True)
+class Clause:
+    """
+    One condition on the columns of a sample:
+      bound:    lower <= col <= upper
+      near:     |col - target| <= tol
+      angle:    angular difference between col and target, in degrees, <= tol
+      distance: great-circle distance from (col, col2) to (target, target2),
+                as latitude/longitude in degrees, <= tol meters
+      never:    always false
+    """
+    kind: str
+    column: str = ""
+    column2: str = ""
+    target: float = 0.0
+    target2: float = 0.0
+    tol: float = 0.0
+    lower: float = -math.inf
+    upper: float = math.inf
+
+
+def at_most(column: str, value: float) -> Clause:
+    return Clause("bound", column, upper=value)
+
+
+def at_least(column: str, value: float) -> Clause:
+    return Clause("bound", column, lower=value)
+
+
+def present(column: str) -> Clause:
+    return Clause("bound", column)
+
+
+def near(column: str, target: float, tol: float) -> Clause:
+    return Clause("near", column, target=target, tol=tol)
+
+
+def angle_near(column: str, target: float, tol: float) -> Clause:
+    return Clause("angle", column, target=target, tol=tol)
+
+
+def distance_within(lat_column: str, lon_column: str, lat: float, lon: float, tol_m: float) -> Clause:
+    return Clause("distance", lat_column, lon_column, target=lat, target2=lon, tol=tol_m)
+
+
+def never() -> Clause:
+    return Clause("never")
+
+
+class CompiledPredicate:
+    """
+    A conjunction of clauses over the columns of a sample. Calling it
+    checks a single sample; a PredicateTable checks many at once.
+    """
+
+    def __init__(self, clauses: List[Clause]):
+        self.clauses = list(clauses)
+        self._table: Optional[PredicateTable] = None
+
+    def __call__(self, sample: Any) -> bool:
+        if self._table is None:
+            self._table = PredicateTable()
+            self._table.add(self)
+        return bool(self._table.evaluate(sample))
+
+
+class _Compiled:
+    """Clause arrays of a PredicateTable, rebuilt when its predicates change."""
+
+    def __init__(self, predicates: Dict[int, CompiledPredicate]):
+        self.slots = np.array(list(predicates), dtype=np.int64)
+        columns: Dict[str, int] = {}
+        rows: Dict[str, List[Tuple]] = {"bound": [], "near": [], "angle": [], "distance": [], "never": []}
+        for row, predicate in enumerate(predicates.values()):
+            for clause in predicate.clauses:
+                col = columns.setdefault(clause.column, len(columns)) if clause.column else -1
+                col2 = columns.setdefault(clause.column2, len(columns)) if clause.column2 else -1
+                rows[clause.kind].append((row, col, col2, clause.target, clause.target2,
+                                          clause.tol, clause.lower, clause.upper))
+        self.columns = list(columns)
+        self.paths = [column.split(".") for column in columns]
+        self.kinds = {}
+        for kind, entries in rows.items():
+            if entries:
+                fields = list(zip(*entries))
+                self.kinds[kind] = (
+                    np.array(fields[0], dtype=np.int64),
+                    np.array(fields[1], dtype=np.int64),
+                    np.array(fields[2], dtype=np.int64),
+                    *(np.array(f, dtype=np.float64) for f in fields[3:]),
+                )
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        failed = np.zeros(len(self.slots), dtype=bool)
+        with np.errstate(invalid="ignore"):
+            for kind, (rows, col, col2, target, target2, tol, lower, upper) in self.kinds.items():
+                if kind == "bound":
+                    ok = (x[col] >= lower) & (x[col] <= upper)
+                elif kind == "near":
+                    ok = np.abs(x[col] - target) <= tol
+                elif kind == "angle":
+                    d = np.abs(np.mod(x[col] - target, 360.0))
+                    ok = np.minimum(d, 360.0 - d) <= tol
+                elif kind == "distance":
+                    lat1, lon1 = np.radians(x[col]), np.radians(x[col2])
+                    lat2, lon2 = np.radians(target), np.radians(target2)
+                    h = (np.sin((lat2 - lat1) / 2) ** 2 +
+                         np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+                    ok = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(h)) <= tol
+                else:
+                    ok = np.zeros(len(rows), dtype=bool)
+                failed[rows[~ok]] = True
+        return self.slots[~failed]
+
+
+class PredicateTable:
+    """
+    Compiled predicates checked together: each sample is read into one
+    column vector, and every clause of every predicate is evaluated with
+    a handful of NumPy operations, however many predicates there are.
+    """
+
+    def __init__(self):
+        self._predicates: Dict[int, CompiledPredicate] = {}
+        self._next_slot = 0
+        self._compiled: Optional[_Compiled] = None
+
+    def __len__(self) -> int:
+        return len(self._predicates)
+
+    def add(self, predicate: CompiledPredicate) -> int:
+        """Add a predicate, returning the slot it is reported under."""
+        slot = self._next_slot
+        self._next_slot += 1
+        self._predicates[slot] = predicate
+        self._compiled = None
+        return slot
+
+    def remove(self, slot: int) -> None:
+        if self._predicates.pop(slot, None) is not None:
+            self._compiled = None
+
+    def evaluate(self, sample: Any) -> List[int]:
+        """Return the slots of the predicates that hold for sample."""
+        if not self._predicates:
+            return []
+        if self._compiled is None:
+            self._compiled = _Compiled(self._predicates)
+        x = np.array([_column(sample, path) for path in self._compiled.paths], dtype=np.float64)
+        return self._compiled.evaluate(x).tolist()
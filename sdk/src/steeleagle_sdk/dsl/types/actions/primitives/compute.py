@@ -5,7 +5,7 @@ from ....compiler.registry import register_action
 
 # Type imports
 from ...datatypes.common import Response
-from ...datatypes import compute as params
+from ...datatypes import datasink as params
 from ...datatypes import common as common
 from .....dsl import runtime
 
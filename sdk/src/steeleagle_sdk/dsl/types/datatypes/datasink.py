@@ -0,0 +1,35 @@
+from typing import Optional
+from ..base import Datatype
+from ...compiler.registry import register_data
+from ..datatypes import compute as compute
+
+# Hand-written until the datasink policy is picked up by the generated
+# compute types; extends DatasinkInfo in place of the generated class.
+
+@register_data
+class DatasinkPolicy(Datatype):
+    """Telemetry delivery policy for a datasink.
+
+    Rate limited datasinks receive at most `max_rate` telemetry messages per
+    second per stream, coalesced so that only the latest sample in each window
+    is sent. Datasinks with a change threshold only receive a sample when a
+    numeric field has changed by more than the threshold (or any other field
+    has changed) since the last sample they were sent. Imagery is not affected.
+
+    Attributes:
+        max_rate (Optional[float]): maximum telemetry messages per second per stream (0 for unlimited)
+        change_threshold (Optional[float]): minimum change in a numeric field before a sample is resent
+    """
+    max_rate: Optional[float] = None
+    change_threshold: Optional[float] = None
+
+@register_data
+class DatasinkInfo(compute.DatasinkInfo):
+    """Information about a datasink.
+
+    Attributes:
+        id (str): datasink ID
+        location (DatasinkLocation): datasink location
+        policy (Optional[DatasinkPolicy]): telemetry delivery policy (every sample if unset)
+    """
+    policy: Optional[DatasinkPolicy] = None
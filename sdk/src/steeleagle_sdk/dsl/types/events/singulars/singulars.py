@@ -1,6 +1,5 @@
 import asyncio
 import json
-import math
 from typing import Optional
 from pydantic import Field
 
@@ -11,7 +10,9 @@ from ...datatypes.control import ReferenceFrame
 from ...datatypes.telemetry import DriverTelemetry
 from ...datatypes.result import FrameResult, ComputeResult, DetectionResult, Detection, HSV
 from ...datatypes.common import Pose, Velocity, Location, Position
-from ...utils import fetch_results, fetch_telemetry
+from ...utils import wait_for_results, wait_for_telemetry
+from ....runtime.predicates import (CompiledPredicate, at_least, at_most, present, near,
+                                    angle_near, distance_within, never)
 import logging
 logger = logging.getLogger(__name__)
 
@@ -31,13 +32,11 @@ class BatteryReached(Event):
     threshold: int = Field(..., ge=0, le=100)
 
     async def check(self) -> bool:
-        while True:
-            tel = await fetch_telemetry()
-            if not tel or not tel.vehicle_info or not tel.vehicle_info.battery_info:
-                continue
-            pct = tel.vehicle_info.battery_info.percentage
-            if pct is not None and pct <= self.threshold:
-                return True
+        await wait_for_telemetry(self._condition())
+        return True
+
+    def _condition(self) -> CompiledPredicate:
+        return CompiledPredicate([at_most("vehicle_info.battery_info.percentage", self.threshold)])
 
 
 @register_event
@@ -46,13 +45,11 @@ class SatellitesReached(Event):
     threshold: int = Field(..., ge=0)
 
     async def check(self) -> bool:
-        while True:
-            tel = await fetch_telemetry()
-            if not tel or not tel.vehicle_info or not tel.vehicle_info.gps_info:
-                continue
-            sats = tel.vehicle_info.gps_info.satellites
-            if sats is not None and sats >= self.threshold:
-                return True
+        await wait_for_telemetry(self._condition())
+        return True
+
+    def _condition(self) -> CompiledPredicate:
+        return CompiledPredicate([at_least("vehicle_info.gps_info.satellites", self.threshold)])
 
 
 @register_event
@@ -62,29 +59,32 @@ class GimbalPoseReached(Event):
     tol_deg: float = Field(3.0, gt=0.0)
 
     async def check(self) -> bool:
-        while True:
-            tel = await fetch_telemetry()
-            if not tel or not tel.gimbal_info or not tel.gimbal_info.gimbals:
-                continue
+        await wait_for_telemetry(self._matches)
+        return True
 
-            for g in (tel.gimbal_info.gimbals or []):
-                actual = g.pose_body or g.pose_neu
-                if not actual:
-                    continue
+    def _matches(self, tel: DriverTelemetry) -> bool:
+        if not tel.gimbal_info or not tel.gimbal_info.gimbals:
+            return False
 
-                ok = True
-                if self.target.roll is not None:
-                    if actual.roll is None or abs(actual.roll - self.target.roll) > self.tol_deg:
-                        ok = False
-                if self.target.pitch is not None:
-                    if actual.pitch is None or abs(actual.pitch - self.target.pitch) > self.tol_deg:
-                        ok = False
-                if self.target.yaw is not None:
-                    if actual.yaw is None or abs(actual.yaw - self.target.yaw) > self.tol_deg:
-                        ok = False
-
-                if ok:
-                    return True
+        for g in (tel.gimbal_info.gimbals or []):
+            actual = g.pose_body or g.pose_neu
+            if not actual:
+                continue
+
+            ok = True
+            if self.target.roll is not None:
+                if actual.roll is None or abs(actual.roll - self.target.roll) > self.tol_deg:
+                    ok = False
+            if self.target.pitch is not None:
+                if actual.pitch is None or abs(actual.pitch - self.target.pitch) > self.tol_deg:
+                    ok = False
+            if self.target.yaw is not None:
+                if actual.yaw is None or abs(actual.yaw - self.target.yaw) > self.tol_deg:
+                    ok = False
+
+            if ok:
+                return True
+        return False
 
 
 @register_event
@@ -95,35 +95,23 @@ class VelocityReached(Event):
     tol: Optional[float] = Field(0, ge=0.0, description="Allowed absolute error per component")
 
     async def check(self) -> bool:
-        while True:
-            tel = await fetch_telemetry()
-            if not tel or not tel.position_info:
-                continue
-
-            if self.frame == ReferenceFrame.BODY:
-                v = tel.position_info.velocity_body
-            elif self.frame == ReferenceFrame.NEU:
-                v = tel.position_info.velocity_neu
-            else:
-                continue
+        await wait_for_telemetry(self._condition())
+        return True
 
-            if v is None:
-                continue
+    def _condition(self) -> CompiledPredicate:
+        if self.frame == ReferenceFrame.BODY:
+            v = "position_info.velocity_body"
+        elif self.frame == ReferenceFrame.NEU:
+            v = "position_info.velocity_neu"
+        else:
+            return CompiledPredicate([never()])
 
-            if self.target.x_vel is not None:
-                if v.x_vel is None or abs(v.x_vel - self.target.x_vel) > self.tol:
-                    continue
-            if self.target.y_vel is not None:
-                if v.y_vel is None or abs(v.y_vel - self.target.y_vel) > self.tol:
-                    continue
-            if self.target.z_vel is not None:
-                if v.z_vel is None or abs(v.z_vel - self.target.z_vel) > self.tol:
-                    continue
-            if self.target.angular_vel is not None:
-                if v.angular_vel is None or abs(v.angular_vel - self.target.angular_vel) > self.tol:
-                    continue
-
-            return True
+        clauses = [present(v)]
+        for axis in ("x_vel", "y_vel", "z_vel", "angular_vel"):
+            target = getattr(self.target, axis)
+            if target is not None:
+                clauses.append(near(f"{v}.{axis}", target, self.tol))
+        return CompiledPredicate(clauses)
 
 
 @register_event
@@ -136,34 +124,20 @@ class RelativePositionReached(Event):
     tol_m: Optional[float] = Field(0.20, ge=0.0, description="Tolerance for x/y/z (meters)")
     tol_deg: Optional[float] = Field(0.0, ge=0.0, description="Tolerance for angle (degrees)")
 
-    @staticmethod
-    def _deg_diff(a: float, b: float) -> float:
-        d = abs((a - b) % 360.0)
-        return d if d <= 180.0 else 360.0 - d
-
     async def check(self) -> bool:
-        while True:
-            tel: Optional[DriverTelemetry] = await fetch_telemetry()
-            if not tel or not tel.position_info:
-                continue
-            cur = tel.position_info.relative_position
-            if not cur:
-                continue
-
-            if self.target.x is not None:
-                if cur.x is None or abs(cur.x - self.target.x) > self.tol_m:
-                    continue
-            if self.target.y is not None:
-                if cur.y is None or abs(cur.y - self.target.y) > self.tol_m:
-                    continue
-            if self.target.z is not None:
-                if cur.z is None or abs(cur.z - self.target.z) > self.tol_m:
-                    continue
-            if self.target.angle is not None:
-                if cur.angle is None or self._deg_diff(cur.angle, self.target.angle) > self.tol_deg:
-                    continue
+        await wait_for_telemetry(self._condition())
+        return True
 
-            return True
+    def _condition(self) -> CompiledPredicate:
+        cur = "position_info.relative_position"
+        clauses = [present(cur)]
+        for axis in ("x", "y", "z"):
+            target = getattr(self.target, axis)
+            if target is not None:
+                clauses.append(near(f"{cur}.{axis}", target, self.tol_m))
+        if self.target.angle is not None:
+            clauses.append(angle_near(f"{cur}.angle", self.target.angle, self.tol_deg))
+        return CompiledPredicate(clauses)
 
 
 @register_event
@@ -178,54 +152,27 @@ class GlobalPositionReached(Event):
     tol_alt_m: Optional[float] = Field(0.50, ge=0.0, description="Altitude tolerance (meters)")
     tol_deg: Optional[float] = Field(3.0, ge=0.0, description="Heading tolerance (degrees)")
 
-    @staticmethod
-    def _haversine_m(a: Optional[Location], b: Optional[Location]) -> Optional[float]:
-        if (
-            not a or not b or
-            a.latitude is None or a.longitude is None or
-            b.latitude is None or b.longitude is None
-        ):
-            return None
-        R = 6371000.0
-        lat1, lon1, lat2, lon2 = map(math.radians, [a.latitude, a.longitude, b.latitude, b.longitude])
-        dlat, dlon = lat2 - lat1, lon2 - lon1
-        h = math.sin(dlat/2)**2 + math.cos(lat1)*math.cos(lat2)*math.sin(dlon/2)**2
-        return 2 * R * math.asin(math.sqrt(h))
-
-    @staticmethod
-    def _deg_diff(a: float, b: float) -> float:
-        d = abs((a - b) % 360.0)
-        return d if d <= 180.0 else 360.0 - d
-
     async def check(self) -> bool:
-        while True:
-            if self.target is None:
-                continue
-
-            tel: Optional[DriverTelemetry] = await fetch_telemetry()
-            if not tel or not tel.position_info:
-                continue
-            cur = tel.position_info.global_position
-            if not cur:
-                continue
-
-            # If latitude & longitude specified, require distance within tol_m
-            if self.target.latitude is not None and self.target.longitude is not None:
-                d = self._haversine_m(cur, self.target)
-                if d is None or d > self.tol_m:
-                    continue
-
-            # Altitude (optional)
-            if self.target.altitude is not None:
-                if cur.altitude is None or abs(cur.altitude - self.target.altitude) > self.tol_alt_m:
-                    continue
-
-            # Heading (optional)
-            if self.target.heading is not None:
-                if cur.heading is None or self._deg_diff(cur.heading, self.target.heading) > self.tol_deg:
-                    continue
+        await wait_for_telemetry(self._condition())
+        return True
 
-            return True
+    def _condition(self) -> CompiledPredicate:
+        if self.target is None:
+            return CompiledPredicate([never()])
+
+        cur = "position_info.global_position"
+        clauses = [present(cur)]
+        # If latitude & longitude specified, require distance within tol_m
+        if self.target.latitude is not None and self.target.longitude is not None:
+            clauses.append(distance_within(f"{cur}.latitude", f"{cur}.longitude",
+                                           self.target.latitude, self.target.longitude, self.tol_m))
+        # Altitude (optional)
+        if self.target.altitude is not None:
+            clauses.append(near(f"{cur}.altitude", self.target.altitude, self.tol_alt_m))
+        # Heading (optional)
+        if self.target.heading is not None:
+            clauses.append(angle_near(f"{cur}.heading", self.target.heading, self.tol_deg))
+        return CompiledPredicate(clauses)
 
 
 # ---- compute events ----
@@ -235,23 +182,25 @@ class DetectionFound(Event):
     target: Detection  # use class_name/score if provided
 
     async def check(self) -> bool:
-        # Keep consuming FrameResult messages until a matching detection appears.
-        while True:
-            res: FrameResult = await fetch_results("object-engine")
+        # Checked against each FrameResult until a matching detection appears.
+        await wait_for_results("object-engine", self._matches)
+        return True
 
-            if not res.result:
-                continue  # no ComputeResult entries
+    def _matches(self, res: FrameResult) -> bool:
+        if not res.result:
+            return False  # no ComputeResult entries
 
-            for compute in res.result:
-                det_result = compute.detection_result
-                if not det_result or not det_result.detections:
-                    continue
+        for compute in res.result:
+            det_result = compute.detection_result
+            if not det_result or not det_result.detections:
+                continue
 
-                for det in det_result.detections:
-                    if det is None:
-                        continue
-                    if self._matches_target(det):
-                        return True
+            for det in det_result.detections:
+                if det is None:
+                    continue
+                if self._matches_target(det):
+                    return True
+        return False
 
     def _matches_target(self, det: Detection) -> bool:
         # Filter on class_name if provided
@@ -278,34 +227,36 @@ class HSVReached(Event):
     tol: int = Field(15, ge=0)
 
     async def check(self) -> bool:
-        # Continuously read FrameResult messages and inspect generic_result JSON.
-        while True:
-            res: FrameResult = await fetch_results("object-engine")
+        # Inspect the generic_result JSON of each FrameResult as it arrives.
+        await wait_for_results("object-engine", self._matches)
+        return True
 
-            if not res.result:
-                continue
+    def _matches(self, res: FrameResult) -> bool:
+        if not res.result:
+            return False
 
-            for compute in res.result:
-                if not compute.generic_result:
-                    continue
+        for compute in res.result:
+            if not compute.generic_result:
+                continue
 
-                try:
-                    payload = json.loads(compute.generic_result)
-                except Exception:
-                    # Ignore malformed JSON
-                    continue
+            try:
+                payload = json.loads(compute.generic_result)
+            except Exception:
+                # Ignore malformed JSON
+                continue
 
-                # Shortcut: explicit pass flag
-                if payload.get("hsv_pass") is True:
-                    return True
+            # Shortcut: explicit pass flag
+            if payload.get("hsv_pass") is True:
+                return True
 
-                # Try to read HSV values from JSON; adjust to whatever structure you use
-                h = payload.get("h")
-                s = payload.get("s")
-                v = payload.get("v")
+            # Try to read HSV values from JSON; adjust to whatever structure you use
+            h = payload.get("h")
+            s = payload.get("s")
+            v = payload.get("v")
 
-                if self._matches_hsv(h, s, v):
-                    return True
+            if self._matches_hsv(h, s, v):
+                return True
+        return False
 
     def _matches_hsv(
         self,
@@ -5,10 +5,18 @@ from .datatypes.telemetry import DriverTelemetry
 from .datatypes.result import FrameResult
 
 async def fetch_results(topic) -> FrameResult:
-    await runtime.COMPUTE.get_result(topic)
+    return await runtime.COMPUTE.get_result(topic)
 
 async def fetch_telemetry() -> DriverTelemetry:
-    await runtime.VEHICLE.get_telemetry()
+    return await runtime.VEHICLE.get_telemetry()
+
+async def wait_for_results(topic, predicate) -> FrameResult:
+    """Wait for the first result from an engine that satisfies predicate."""
+    return await runtime.CONDITIONS.wait_for("results", topic, predicate)
+
+async def wait_for_telemetry(predicate) -> DriverTelemetry:
+    """Wait for the first telemetry sample that satisfies predicate."""
+    return await runtime.CONDITIONS.wait_for("telemetry", "driver_telemetry", predicate)
 
 async def consume_last(async_iterable):
     """Consume an async iterator and return the last item (or None if empty)."""
@@ -2,9 +2,10 @@
 from google.protobuf.timestamp_pb2 import Timestamp
 from .common_pb2 import Request, Response
 
-async def native_grpc_call(metadata, full_method_name, method_desc, request, classes, channel):
+def build_grpc_callable(full_method_name, method_desc, classes, channel):
     '''
-    Calls the provided gRPC method by invoking it directly on the channel.
+    Builds a callable for the provided gRPC method on a channel. The
+    callable can be reused for any number of calls.
     '''
     # Get the classes for request and response, needed to deserialize
     # and serialize messages from the channel correctly
@@ -12,25 +13,57 @@ async def native_grpc_call(metadata, full_method_name, method_desc, request, cla
 
     if method_desc.server_streaming:
         # Server-streaming call
-        call = channel.unary_stream(
+        return channel.unary_stream(
             full_method_name,
             request_serializer=req_class.SerializeToString,
             response_deserializer=rep_class.FromString
         )
-        responses = []
-        # In this case, call responds with a wrapper that is an async
-        # generator function
-        async for resp in call(request, metadata=metadata):
-            responses.append(resp)
-        return responses[-1] # Just the last response is needed
     else:
         # Unary call
-        call = channel.unary_unary(
+        return channel.unary_unary(
             full_method_name,
             request_serializer=req_class.SerializeToString,
             response_deserializer=rep_class.FromString
         )
-        return await call(request, metadata=metadata)
+
+async def stream_grpc_callable(metadata, method_desc, request, call):
+    '''
+    Invokes a callable built by `build_grpc_callable` and yields each
+    response as it arrives. Unary methods yield a single response.
+    '''
+    if method_desc.server_streaming:
+        # In this case, call responds with a wrapper that is an async
+        # generator function
+        async for resp in call(request, metadata=metadata):
+            yield resp
+    else:
+        yield await call(request, metadata=metadata)
+
+async def invoke_grpc_callable(metadata, method_desc, request, call):
+    '''
+    Invokes a callable built by `build_grpc_callable` and returns the
+    final response.
+    '''
+    response = None
+    async for resp in stream_grpc_callable(metadata, method_desc, request, call):
+        response = resp # Just the last response is needed
+    return response
+
+async def native_grpc_stream(metadata, full_method_name, method_desc, request, classes, channel):
+    '''
+    Calls the provided gRPC method by invoking it directly on the channel,
+    yielding every response as it arrives.
+    '''
+    call = build_grpc_callable(full_method_name, method_desc, classes, channel)
+    async for resp in stream_grpc_callable(metadata, method_desc, request, call):
+        yield resp
+
+async def native_grpc_call(metadata, full_method_name, method_desc, request, classes, channel):
+    '''
+    Calls the provided gRPC method by invoking it directly on the channel.
+    '''
+    call = build_grpc_callable(full_method_name, method_desc, classes, channel)
+    return await invoke_grpc_callable(metadata, method_desc, request, call)
 
 def generate_request():
     '''
@@ -51,3 +84,11 @@ def generate_response(resp_type, resp_string=""):
             response_string=resp_string,
             timestamp=Timestamp().GetCurrentTime()
             )
+
+def result_topic(engine_id, result_type=None):
+    '''
+    Gets the topic a compute result is published under on the result
+    stream. Without a result type, this is the prefix matching every
+    result from the engine.
+    '''
+    return f'{engine_id}/{result_type or ""}'.encode('utf-8')
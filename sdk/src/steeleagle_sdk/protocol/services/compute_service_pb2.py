@@ -7,21 +7,30 @@ from google.protobuf.internal import builder as _builder
 _runtime_version.ValidateProtobufRuntimeVersion(_runtime_version.Domain.PUBLIC, 5, 29, 0, '', 'services/compute_service.proto')
 _sym_db = _symbol_database.Default()
 from .. import common_pb2 as common__pb2
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1eservices/compute_service.proto\x12,steeleagle.protocol.services.compute_service\x1a\x0ccommon.proto"l\n\x0cDatasinkInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12P\n\x08location\x18\x02 \x01(\x0e2>.steeleagle.protocol.services.compute_service.DatasinkLocation"\x9a\x01\n\x13AddDatasinksRequest\x124\n\x07request\x18\x01 \x01(\x0b2#.steeleagle.protocol.common.Request\x12M\n\tdatasinks\x18\x02 \x03(\x0b2:.steeleagle.protocol.services.compute_service.DatasinkInfo"\x9a\x01\n\x13SetDatasinksRequest\x124\n\x07request\x18\x01 \x01(\x0b2#.steeleagle.protocol.common.Request\x12M\n\tdatasinks\x18\x02 \x03(\x0b2:.steeleagle.protocol.services.compute_service.DatasinkInfo"\x9d\x01\n\x16RemoveDatasinksRequest\x124\n\x07request\x18\x01 \x01(\x0b2#.steeleagle.protocol.common.Request\x12M\n\tdatasinks\x18\x02 \x03(\x0b2:.steeleagle.protocol.services.compute_service.DatasinkInfo*)\n\x10DatasinkLocation\x12\n\n\x06REMOTE\x10\x00\x12\t\n\x05LOCAL\x10\x012\x80\x03\n\x07Compute\x12y\n\x0cAddDatasinks\x12A.steeleagle.protocol.services.compute_service.AddDatasinksRequest\x1a$.steeleagle.protocol.common.Response"\x00\x12y\n\x0cSetDatasinks\x12A.steeleagle.protocol.services.compute_service.SetDatasinksRequest\x1a$.steeleagle.protocol.common.Response"\x00\x12\x7f\n\x0fRemoveDatasinks\x12D.steeleagle.protocol.services.compute_service.RemoveDatasinksRequest\x1a$.steeleagle.protocol.common.Response"\x00b\x06proto3')
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1eservices/compute_service.proto\x12,steeleagle.protocol.services.compute_service\x1a\x0ccommon.proto\x1a\x1fgoogle/protobuf/timestamp.proto"\xca\x01\n\x0cDatasinkInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12P\n\x08location\x18\x02 \x01(\x0e2>.steeleagle.protocol.services.compute_service.DatasinkLocation\x12Q\n\x06policy\x18\x03 \x01(\x0b2<.steeleagle.protocol.services.compute_service.DatasinkPolicyH\x00\x88\x01\x01B\t\n\x07_policy"h\n\x0eDatasinkPolicy\x12\x15\n\x08max_rate\x18\x01 \x01(\x02H\x00\x88\x01\x01\x12\x1d\n\x10change_threshold\x18\x02 \x01(\x02H\x01\x88\x01\x01B\x0b\n\t_max_rateB\x13\n\x11_change_threshold"\x9a\x01\n\x13AddDatasinksRequest\x124\n\x07request\x18\x01 \x01(\x0b2#.steeleagle.protocol.common.Request\x12M\n\tdatasinks\x18\x02 \x03(\x0b2:.steeleagle.protocol.services.compute_service.DatasinkInfo"\x9a\x01\n\x13SetDatasinksRequest\x124\n\x07request\x18\x01 \x01(\x0b2#.steeleagle.protocol.common.Request\x12M\n\tdatasinks\x18\x02 \x03(\x0b2:.steeleagle.protocol.services.compute_service.DatasinkInfo"\x9d\x01\n\x16RemoveDatasinksRequest\x124\n\x07request\x18\x01 \x01(\x0b2#.steeleagle.protocol.common.Request\x12M\n\tdatasinks\x18\x02 \x03(\x0b2:.steeleagle.protocol.services.compute_service.DatasinkInfo"P\n\x18GetDatasinkHealthRequest\x124\n\x07request\x18\x01 \x01(\x0b2#.steeleagle.protocol.common.Request"\xd2\x02\n\x0eDatasinkHealth\x12\n\n\x02id\x18\x01 \x01(\t\x12P\n\x08location\x18\x02 \x01(\x0e2>.steeleagle.protocol.services.compute_service.DatasinkLocation\x12\x0f\n\x07healthy\x18\x03 \x01(\x08\x12\x0f\n\x07results\x18\x04 \x01(\x04\x124\n\x0blast_result\x18\x05 \x01(\x0b2\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12\x13\n\x0blatency_p50\x18\x06 \x01(\x01\x12\x13\n\x0blatency_p90\x18\x07 \x01(\x01\x12\x13\n\x0blatency_p99\x18\x08 \x01(\x01\x12\x11\n\tin_flight\x18\t \x01(\r\x12\x13\n\x0bstalled_for\x18\n \x01(\x01\x12\x13\n\x0bstarved_for\x18\x0b \x01(\x01B\x0e\n\x0c_last_result"\xa4\x01\n\x19GetDatasinkHealthResponse\x126\n\x08response\x18\x01 \x01(\x0b2$.steeleagle.protocol.common.Response\x12O\n\tdatasinks\x18\x02 \x03(\x0b2<.steeleagle.protocol.services.compute_service.DatasinkHealth*)\n\x10DatasinkLocation\x12\n\n\x06REMOTE\x10\x00\x12\t\n\x05LOCAL\x10\x012\xa9\x04\n\x07Compute\x12y\n\x0cAddDatasinks\x12A.steeleagle.protocol.services.compute_service.AddDatasinksRequest\x1a$.steeleagle.protocol.common.Response"\x00\x12y\n\x0cSetDatasinks\x12A.steeleagle.protocol.services.compute_service.SetDatasinksRequest\x1a$.steeleagle.protocol.common.Response"\x00\x12\x7f\n\x0fRemoveDatasinks\x12D.steeleagle.protocol.services.compute_service.RemoveDatasinksRequest\x1a$.steeleagle.protocol.common.Response"\x00\x12\xa6\x01\n\x11GetDatasinkHealth\x12F.steeleagle.protocol.services.compute_service.GetDatasinkHealthRequest\x1aG.steeleagle.protocol.services.compute_service.GetDatasinkHealthResponse"\x00b\x06proto3')
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'services.compute_service_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
-    _globals['_DATASINKLOCATION']._serialized_start = 678
-    _globals['_DATASINKLOCATION']._serialized_end = 719
-    _globals['_DATASINKINFO']._serialized_start = 94
-    _globals['_DATASINKINFO']._serialized_end = 202
-    _globals['_ADDDATASINKSREQUEST']._serialized_start = 205
-    _globals['_ADDDATASINKSREQUEST']._serialized_end = 359
-    _globals['_SETDATASINKSREQUEST']._serialized_start = 362
-    _globals['_SETDATASINKSREQUEST']._serialized_end = 516
-    _globals['_REMOVEDATASINKSREQUEST']._serialized_start = 519
-    _globals['_REMOVEDATASINKSREQUEST']._serialized_end = 676
-    _globals['_COMPUTE']._serialized_start = 722
-    _globals['_COMPUTE']._serialized_end = 1106
\ No newline at end of file
+    _globals['_DATASINKLOCATION']._serialized_start = 1502
+    _globals['_DATASINKLOCATION']._serialized_end = 1543
+    _globals['_DATASINKINFO']._serialized_start = 128
+    _globals['_DATASINKINFO']._serialized_end = 330
+    _globals['_DATASINKPOLICY']._serialized_start = 332
+    _globals['_DATASINKPOLICY']._serialized_end = 436
+    _globals['_ADDDATASINKSREQUEST']._serialized_start = 439
+    _globals['_ADDDATASINKSREQUEST']._serialized_end = 593
+    _globals['_SETDATASINKSREQUEST']._serialized_start = 596
+    _globals['_SETDATASINKSREQUEST']._serialized_end = 750
+    _globals['_REMOVEDATASINKSREQUEST']._serialized_start = 753
+    _globals['_REMOVEDATASINKSREQUEST']._serialized_end = 910
+    _globals['_GETDATASINKHEALTHREQUEST']._serialized_start = 912
+    _globals['_GETDATASINKHEALTHREQUEST']._serialized_end = 992
+    _globals['_DATASINKHEALTH']._serialized_start = 995
+    _globals['_DATASINKHEALTH']._serialized_end = 1333
+    _globals['_GETDATASINKHEALTHRESPONSE']._serialized_start = 1336
+    _globals['_GETDATASINKHEALTHRESPONSE']._serialized_end = 1500
+    _globals['_COMPUTE']._serialized_start = 1546
+    _globals['_COMPUTE']._serialized_end = 2099
\ No newline at end of file
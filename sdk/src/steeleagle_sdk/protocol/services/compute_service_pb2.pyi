@@ -1,4 +1,5 @@
 import common_pb2 as _common_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
 from google.protobuf.internal import containers as _containers
 from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
@@ -14,13 +15,25 @@ REMOTE: DatasinkLocation
 LOCAL: DatasinkLocation
 
 class DatasinkInfo(_message.Message):
-    __slots__ = ('id', 'location')
+    __slots__ = ('id', 'location', 'policy')
     ID_FIELD_NUMBER: _ClassVar[int]
     LOCATION_FIELD_NUMBER: _ClassVar[int]
+    POLICY_FIELD_NUMBER: _ClassVar[int]
     id: str
     location: DatasinkLocation
+    policy: DatasinkPolicy
 
-    def __init__(self, id: _Optional[str]=..., location: _Optional[_Union[DatasinkLocation, str]]=...) -> None:
+    def __init__(self, id: _Optional[str]=..., location: _Optional[_Union[DatasinkLocation, str]]=..., policy: _Optional[_Union[DatasinkPolicy, _Mapping]]=...) -> None:
+        ...
+
+class DatasinkPolicy(_message.Message):
+    __slots__ = ('max_rate', 'change_threshold')
+    MAX_RATE_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+    max_rate: float
+    change_threshold: float
+
+    def __init__(self, max_rate: _Optional[float]=..., change_threshold: _Optional[float]=...) -> None:
         ...
 
 class AddDatasinksRequest(_message.Message):
@@ -51,4 +64,50 @@ class RemoveDatasinksRequest(_message.Message):
     datasinks: _containers.RepeatedCompositeFieldContainer[DatasinkInfo]
 
     def __init__(self, request: _Optional[_Union[_common_pb2.Request, _Mapping]]=..., datasinks: _Optional[_Iterable[_Union[DatasinkInfo, _Mapping]]]=...) -> None:
+        ...
+
+class GetDatasinkHealthRequest(_message.Message):
+    __slots__ = ('request',)
+    REQUEST_FIELD_NUMBER: _ClassVar[int]
+    request: _common_pb2.Request
+
+    def __init__(self, request: _Optional[_Union[_common_pb2.Request, _Mapping]]=...) -> None:
+        ...
+
+class DatasinkHealth(_message.Message):
+    __slots__ = ('id', 'location', 'healthy', 'results', 'last_result', 'latency_p50', 'latency_p90', 'latency_p99', 'in_flight', 'stalled_for', 'starved_for')
+    ID_FIELD_NUMBER: _ClassVar[int]
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    HEALTHY_FIELD_NUMBER: _ClassVar[int]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    LAST_RESULT_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_P50_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_P90_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_P99_FIELD_NUMBER: _ClassVar[int]
+    IN_FLIGHT_FIELD_NUMBER: _ClassVar[int]
+    STALLED_FOR_FIELD_NUMBER: _ClassVar[int]
+    STARVED_FOR_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    location: DatasinkLocation
+    healthy: bool
+    results: int
+    last_result: _timestamp_pb2.Timestamp
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    in_flight: int
+    stalled_for: float
+    starved_for: float
+
+    def __init__(self, id: _Optional[str]=..., location: _Optional[_Union[DatasinkLocation, str]]=..., healthy: bool=..., results: _Optional[int]=..., last_result: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]]=..., latency_p50: _Optional[float]=..., latency_p90: _Optional[float]=..., latency_p99: _Optional[float]=..., in_flight: _Optional[int]=..., stalled_for: _Optional[float]=..., starved_for: _Optional[float]=...) -> None:
+        ...
+
+class GetDatasinkHealthResponse(_message.Message):
+    __slots__ = ('response', 'datasinks')
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    DATASINKS_FIELD_NUMBER: _ClassVar[int]
+    response: _common_pb2.Response
+    datasinks: _containers.RepeatedCompositeFieldContainer[DatasinkHealth]
+
+    def __init__(self, response: _Optional[_Union[_common_pb2.Response, _Mapping]]=..., datasinks: _Optional[_Iterable[_Union[DatasinkHealth, _Mapping]]]=...) -> None:
         ...
\ No newline at end of file
@@ -33,6 +33,7 @@ class ComputeStub(object):
         self.AddDatasinks = channel.unary_unary('/steeleagle.protocol.services.compute_service.Compute/AddDatasinks', request_serializer=services_dot_compute__service__pb2.AddDatasinksRequest.SerializeToString, response_deserializer=common__pb2.Response.FromString, _registered_method=True)
         self.SetDatasinks = channel.unary_unary('/steeleagle.protocol.services.compute_service.Compute/SetDatasinks', request_serializer=services_dot_compute__service__pb2.SetDatasinksRequest.SerializeToString, response_deserializer=common__pb2.Response.FromString, _registered_method=True)
         self.RemoveDatasinks = channel.unary_unary('/steeleagle.protocol.services.compute_service.Compute/RemoveDatasinks', request_serializer=services_dot_compute__service__pb2.RemoveDatasinksRequest.SerializeToString, response_deserializer=common__pb2.Response.FromString, _registered_method=True)
+        self.GetDatasinkHealth = channel.unary_unary('/steeleagle.protocol.services.compute_service.Compute/GetDatasinkHealth', request_serializer=services_dot_compute__service__pb2.GetDatasinkHealthRequest.SerializeToString, response_deserializer=services_dot_compute__service__pb2.GetDatasinkHealthResponse.FromString, _registered_method=True)
 
 class ComputeServicer(object):
     """
@@ -74,8 +75,21 @@ class ComputeServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetDatasinkHealth(self, request, context):
+        """
+        Get the health of datasinks in the consumer list.
+
+        Reports result latency, outstanding frames and stalls for each
+        datasink. Datasinks that hold frames without returning results for
+        longer than their timeout trigger the compute failsafe for their
+        location.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 def add_ComputeServicer_to_server(servicer, server):
-    rpc_method_handlers = {'AddDatasinks': grpc.unary_unary_rpc_method_handler(servicer.AddDatasinks, request_deserializer=services_dot_compute__service__pb2.AddDatasinksRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'SetDatasinks': grpc.unary_unary_rpc_method_handler(servicer.SetDatasinks, request_deserializer=services_dot_compute__service__pb2.SetDatasinksRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'RemoveDatasinks': grpc.unary_unary_rpc_method_handler(servicer.RemoveDatasinks, request_deserializer=services_dot_compute__service__pb2.RemoveDatasinksRequest.FromString, response_serializer=common__pb2.Response.SerializeToString)}
+    rpc_method_handlers = {'AddDatasinks': grpc.unary_unary_rpc_method_handler(servicer.AddDatasinks, request_deserializer=services_dot_compute__service__pb2.AddDatasinksRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'SetDatasinks': grpc.unary_unary_rpc_method_handler(servicer.SetDatasinks, request_deserializer=services_dot_compute__service__pb2.SetDatasinksRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'RemoveDatasinks': grpc.unary_unary_rpc_method_handler(servicer.RemoveDatasinks, request_deserializer=services_dot_compute__service__pb2.RemoveDatasinksRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'GetDatasinkHealth': grpc.unary_unary_rpc_method_handler(servicer.GetDatasinkHealth, request_deserializer=services_dot_compute__service__pb2.GetDatasinkHealthRequest.FromString, response_serializer=services_dot_compute__service__pb2.GetDatasinkHealthResponse.SerializeToString)}
     generic_handler = grpc.method_handlers_generic_handler('steeleagle.protocol.services.compute_service.Compute', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
     server.add_registered_method_handlers('steeleagle.protocol.services.compute_service.Compute', rpc_method_handlers)
@@ -100,4 +114,8 @@ class Compute(object):
 
     @staticmethod
     def RemoveDatasinks(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/steeleagle.protocol.services.compute_service.Compute/RemoveDatasinks', services_dot_compute__service__pb2.RemoveDatasinksRequest.SerializeToString, common__pb2.Response.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
+        return grpc.experimental.unary_unary(request, target, '/steeleagle.protocol.services.compute_service.Compute/RemoveDatasinks', services_dot_compute__service__pb2.RemoveDatasinksRequest.SerializeToString, common__pb2.Response.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def GetDatasinkHealth(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/steeleagle.protocol.services.compute_service.Compute/GetDatasinkHealth', services_dot_compute__service__pb2.GetDatasinkHealthRequest.SerializeToString, services_dot_compute__service__pb2.GetDatasinkHealthResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
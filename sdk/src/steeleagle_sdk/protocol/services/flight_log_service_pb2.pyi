@@ -1,8 +1,10 @@
 import common_pb2 as _common_pb2
+from google.protobuf import any_pb2 as _any_pb2
+from google.protobuf.internal import containers as _containers
 from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Mapping as _Mapping, Optional as _Optional, Union as _Union
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class LogType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
@@ -56,14 +58,30 @@ class ReqRepProto(_message.Message):
     def __init__(self, request: _Optional[_Union[_common_pb2.Request, _Mapping]]=..., response: _Optional[_Union[_common_pb2.Response, _Mapping]]=..., name: _Optional[str]=..., content: _Optional[str]=...) -> None:
         ...
 
+class LogBatchRequest(_message.Message):
+    __slots__ = ('request', 'logs', 'dropped', 'proto_logs')
+    REQUEST_FIELD_NUMBER: _ClassVar[int]
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    DROPPED_FIELD_NUMBER: _ClassVar[int]
+    PROTO_LOGS_FIELD_NUMBER: _ClassVar[int]
+    request: _common_pb2.Request
+    logs: _containers.RepeatedCompositeFieldContainer[LogRequest]
+    dropped: int
+    proto_logs: _containers.RepeatedCompositeFieldContainer[LogProtoRequest]
+
+    def __init__(self, request: _Optional[_Union[_common_pb2.Request, _Mapping]]=..., logs: _Optional[_Iterable[_Union[LogRequest, _Mapping]]]=..., dropped: _Optional[int]=..., proto_logs: _Optional[_Iterable[_Union[LogProtoRequest, _Mapping]]]=...) -> None:
+        ...
+
 class LogProtoRequest(_message.Message):
-    __slots__ = ('request', 'topic', 'reqrep_proto')
+    __slots__ = ('request', 'topic', 'reqrep_proto', 'message')
     REQUEST_FIELD_NUMBER: _ClassVar[int]
     TOPIC_FIELD_NUMBER: _ClassVar[int]
     REQREP_PROTO_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
     request: _common_pb2.Request
     topic: str
     reqrep_proto: ReqRepProto
+    message: _any_pb2.Any
 
-    def __init__(self, request: _Optional[_Union[_common_pb2.Request, _Mapping]]=..., topic: _Optional[str]=..., reqrep_proto: _Optional[_Union[ReqRepProto, _Mapping]]=...) -> None:
+    def __init__(self, request: _Optional[_Union[_common_pb2.Request, _Mapping]]=..., topic: _Optional[str]=..., reqrep_proto: _Optional[_Union[ReqRepProto, _Mapping]]=..., message: _Optional[_Union[_any_pb2.Any, _Mapping]]=...) -> None:
         ...
\ No newline at end of file
@@ -30,6 +30,7 @@ class FlightLogStub(object):
         """
         self.Log = channel.unary_unary('/steeleagle.protocol.services.flight_log_service.FlightLog/Log', request_serializer=services_dot_flight__log__service__pb2.LogRequest.SerializeToString, response_deserializer=common__pb2.Response.FromString, _registered_method=True)
         self.LogProto = channel.unary_unary('/steeleagle.protocol.services.flight_log_service.FlightLog/LogProto', request_serializer=services_dot_flight__log__service__pb2.LogProtoRequest.SerializeToString, response_deserializer=common__pb2.Response.FromString, _registered_method=True)
+        self.LogBatch = channel.stream_unary('/steeleagle.protocol.services.flight_log_service.FlightLog/LogBatch', request_serializer=services_dot_flight__log__service__pb2.LogBatchRequest.SerializeToString, response_deserializer=common__pb2.Response.FromString, _registered_method=True)
 
 class FlightLogServicer(object):
     """
@@ -55,14 +56,27 @@ class FlightLogServicer(object):
         Protobuf log endpoint.
 
         Accepts Protobuf Request/Response types, and writes the data to
-        an MCAP file. Useful for playback of gRPC calls.
+        an MCAP file. Useful for playback of gRPC calls. Binary messages
+        are written with their own schema, without a JSON round trip.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def LogBatch(self, request_iterator, context):
+        """
+        Batched log endpoint.
+
+        Accepts a stream of log batches, so clients can buffer records and
+        send them without making an RPC per record. Responds once the stream
+        ends, with the number of records written in the response string.
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
 def add_FlightLogServicer_to_server(servicer, server):
-    rpc_method_handlers = {'Log': grpc.unary_unary_rpc_method_handler(servicer.Log, request_deserializer=services_dot_flight__log__service__pb2.LogRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'LogProto': grpc.unary_unary_rpc_method_handler(servicer.LogProto, request_deserializer=services_dot_flight__log__service__pb2.LogProtoRequest.FromString, response_serializer=common__pb2.Response.SerializeToString)}
+    rpc_method_handlers = {'Log': grpc.unary_unary_rpc_method_handler(servicer.Log, request_deserializer=services_dot_flight__log__service__pb2.LogRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'LogProto': grpc.unary_unary_rpc_method_handler(servicer.LogProto, request_deserializer=services_dot_flight__log__service__pb2.LogProtoRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'LogBatch': grpc.stream_unary_rpc_method_handler(servicer.LogBatch, request_deserializer=services_dot_flight__log__service__pb2.LogBatchRequest.FromString, response_serializer=common__pb2.Response.SerializeToString)}
     generic_handler = grpc.method_handlers_generic_handler('steeleagle.protocol.services.flight_log_service.FlightLog', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
     server.add_registered_method_handlers('steeleagle.protocol.services.flight_log_service.FlightLog', rpc_method_handlers)
@@ -81,4 +95,8 @@ class FlightLog(object):
 
     @staticmethod
     def LogProto(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/steeleagle.protocol.services.flight_log_service.FlightLog/LogProto', services_dot_flight__log__service__pb2.LogProtoRequest.SerializeToString, common__pb2.Response.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
+        return grpc.experimental.unary_unary(request, target, '/steeleagle.protocol.services.flight_log_service.FlightLog/LogProto', services_dot_flight__log__service__pb2.LogProtoRequest.SerializeToString, common__pb2.Response.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def LogBatch(request_iterator, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/steeleagle.protocol.services.flight_log_service.FlightLog/LogBatch', services_dot_flight__log__service__pb2.LogBatchRequest.SerializeToString, common__pb2.Response.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
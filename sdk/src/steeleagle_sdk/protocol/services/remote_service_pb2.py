@@ -8,19 +8,37 @@ _runtime_version.ValidateProtobufRuntimeVersion(_runtime_version.Domain.PUBLIC,
 _sym_db = _symbol_database.Default()
 from .. import common_pb2 as common__pb2
 from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dservices/remote_service.proto\x12+steeleagle.protocol.services.remote_service\x1a\x0ccommon.proto\x1a\x19google/protobuf/any.proto",\n\x15CompileMissionRequest\x12\x13\n\x0bdsl_content\x18\x01 \x01(\t"n\n\x16CompileMissionResponse\x12\x1c\n\x14compiled_dsl_content\x18\x01 \x01(\t\x126\n\x08response\x18\x02 \x01(\x0b2$.steeleagle.protocol.common.Response"\xa4\x01\n\x0eCommandRequest\x12\x1c\n\x0fsequence_number\x18\x01 \x01(\rH\x00\x88\x01\x01\x12%\n\x07request\x18\x02 \x01(\x0b2\x14.google.protobuf.Any\x12\x13\n\x0bmethod_name\x18\x03 \x01(\t\x12\x10\n\x08identity\x18\x04 \x01(\t\x12\x12\n\nvehicle_id\x18\x05 \x01(\tB\x12\n\x10_sequence_number"b\n\x0fCommandResponse\x12\x17\n\x0fsequence_number\x18\x01 \x01(\r\x126\n\x08response\x18\x02 \x01(\x0b2$.steeleagle.protocol.common.Response2\x98\x02\n\x06Remote\x12p\n\x07Command\x12;.steeleagle.protocol.services.remote_service.CommandRequest\x1a$.steeleagle.protocol.common.Response"\x000\x01\x12\x9b\x01\n\x0eCompileMission\x12B.steeleagle.protocol.services.remote_service.CompileMissionRequest\x1aC.steeleagle.protocol.services.remote_service.CompileMissionResponse"\x00b\x06proto3')
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dservices/remote_service.proto\x12+steeleagle.protocol.services.remote_service\x1a\x0ccommon.proto\x1a\x19google/protobuf/any.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto",\n\x15CompileMissionRequest\x12\x13\n\x0bdsl_content\x18\x01 \x01(\t"n\n\x16CompileMissionResponse\x12\x1c\n\x14compiled_dsl_content\x18\x01 \x01(\t\x126\n\x08response\x18\x02 \x01(\x0b2$.steeleagle.protocol.common.Response"\xa4\x01\n\x0eCommandRequest\x12\x1c\n\x0fsequence_number\x18\x01 \x01(\rH\x00\x88\x01\x01\x12%\n\x07request\x18\x02 \x01(\x0b2\x14.google.protobuf.Any\x12\x13\n\x0bmethod_name\x18\x03 \x01(\t\x12\x10\n\x08identity\x18\x04 \x01(\t\x12\x12\n\nvehicle_id\x18\x05 \x01(\tB\x12\n\x10_sequence_number"\x9e\x01\n\x17BroadcastCommandRequest\x12%\n\x07request\x18\x01 \x01(\x0b2\x14.google.protobuf.Any\x12\x13\n\x0bmethod_name\x18\x02 \x01(\t\x12\x13\n\x0bvehicle_ids\x18\x03 \x03(\t\x12\x10\n\x08selector\x18\x04 \x01(\t\x12\x14\n\x07timeout\x18\x05 \x01(\x02H\x00\x88\x01\x01B\n\n\x08_timeout"\x82\x01\n\x18BroadcastCommandResponse\x12\x12\n\nvehicle_id\x18\x01 \x01(\t\x126\n\x08response\x18\x02 \x01(\x0b2$.steeleagle.protocol.common.Response\x12\x1a\n\x12failed_vehicle_ids\x18\x03 \x03(\t"3\n\x13ListVehiclesRequest\x12\x1c\n\x14include_disconnected\x18\x01 \x01(\x08"\x89\x01\n\x11VehicleConnection\x12\x12\n\nvehicle_id\x18\x01 \x01(\t\x12\x11\n\tconnected\x18\x02 \x01(\x08\x12-\n\tlast_seen\x18\x03 \x01(\x0b2\x1a.google.protobuf.Timestamp\x12\x0b\n\x03rtt\x18\x04 \x01(\x01\x12\x11\n\tin_flight\x18\x05 \x01(\r"\xa0\x01\n\x14ListVehiclesResponse\x12P\n\x08vehicles\x18\x01 \x03(\x0b2>.steeleagle.protocol.services.remote_service.VehicleConnection\x126\n\x08response\x18\x02 \x01(\x0b2$.steeleagle.protocol.common.Response"D\n\tHeartbeat\x12\x17\n\x0fsequence_number\x18\x01 \x01(\r\x12\x11\n\tsent_time\x18\x02 \x01(\x01\x12\x0b\n\x03rtt\x18\x03 \x01(\x01"\xc5\x01\n\x0eTeleopSetpoint\x12\x12\n\nvehicle_id\x18\x01 \x01(\t\x12\x17\n\x0fsequence_number\x18\x02 \x01(\x04\x126\n\x08velocity\x18\x03 \x01(\x0b2$.steeleagle.protocol.common.Velocity\x12+\n\x08duration\x18\x04 \x01(\x0b2\x19.google.protobuf.Duration\x12\x10\n\x08identity\x18\x05 \x01(\t\x12\x0f\n\x07channel\x18\x06 \x01(\r"\x95\x01\n\x0cTeleopStatus\x12\x12\n\nvehicle_id\x18\x01 \x01(\t\x12\x17\n\x0fsequence_number\x18\x02 \x01(\x04\x12\x0f\n\x07dropped\x18\x03 \x01(\x04\x12\x0f\n\x07holding\x18\x04 \x01(\x08\x126\n\x08response\x18\x05 \x01(\x0b2$.steeleagle.protocol.common.Response"b\n\x0fCommandResponse\x12\x17\n\x0fsequence_number\x18\x01 \x01(\r\x126\n\x08response\x18\x02 \x01(\x0b2$.steeleagle.protocol.common.Response2\xdf\x05\n\x06Remote\x12p\n\x07Command\x12;.steeleagle.protocol.services.remote_service.CommandRequest\x1a$.steeleagle.protocol.common.Response"\x000\x01\x12\xa3\x01\n\x10BroadcastCommand\x12D.steeleagle.protocol.services.remote_service.BroadcastCommandRequest\x1aE.steeleagle.protocol.services.remote_service.BroadcastCommandResponse"\x000\x01\x12\x95\x01\n\x0cListVehicles\x12@.steeleagle.protocol.services.remote_service.ListVehiclesRequest\x1aA.steeleagle.protocol.services.remote_service.ListVehiclesResponse"\x00\x12\x86\x01\n\x06Teleop\x12;.steeleagle.protocol.services.remote_service.TeleopSetpoint\x1a9.steeleagle.protocol.services.remote_service.TeleopStatus"\x00(\x010\x01\x12\x9b\x01\n\x0eCompileMission\x12B.steeleagle.protocol.services.remote_service.CompileMissionRequest\x1aC.steeleagle.protocol.services.remote_service.CompileMissionResponse"\x00b\x06proto3')
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'services.remote_service_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
-    _globals['_COMPILEMISSIONREQUEST']._serialized_start = 119
-    _globals['_COMPILEMISSIONREQUEST']._serialized_end = 163
-    _globals['_COMPILEMISSIONRESPONSE']._serialized_start = 165
-    _globals['_COMPILEMISSIONRESPONSE']._serialized_end = 275
-    _globals['_COMMANDREQUEST']._serialized_start = 278
-    _globals['_COMMANDREQUEST']._serialized_end = 442
-    _globals['_COMMANDRESPONSE']._serialized_start = 444
-    _globals['_COMMANDRESPONSE']._serialized_end = 542
-    _globals['_REMOTE']._serialized_start = 545
-    _globals['_REMOTE']._serialized_end = 825
\ No newline at end of file
+    _globals['_COMPILEMISSIONREQUEST']._serialized_start = 184
+    _globals['_COMPILEMISSIONREQUEST']._serialized_end = 228
+    _globals['_COMPILEMISSIONRESPONSE']._serialized_start = 230
+    _globals['_COMPILEMISSIONRESPONSE']._serialized_end = 340
+    _globals['_COMMANDREQUEST']._serialized_start = 343
+    _globals['_COMMANDREQUEST']._serialized_end = 507
+    _globals['_BROADCASTCOMMANDREQUEST']._serialized_start = 510
+    _globals['_BROADCASTCOMMANDREQUEST']._serialized_end = 668
+    _globals['_BROADCASTCOMMANDRESPONSE']._serialized_start = 671
+    _globals['_BROADCASTCOMMANDRESPONSE']._serialized_end = 801
+    _globals['_LISTVEHICLESREQUEST']._serialized_start = 803
+    _globals['_LISTVEHICLESREQUEST']._serialized_end = 854
+    _globals['_VEHICLECONNECTION']._serialized_start = 857
+    _globals['_VEHICLECONNECTION']._serialized_end = 994
+    _globals['_LISTVEHICLESRESPONSE']._serialized_start = 997
+    _globals['_LISTVEHICLESRESPONSE']._serialized_end = 1157
+    _globals['_HEARTBEAT']._serialized_start = 1159
+    _globals['_HEARTBEAT']._serialized_end = 1227
+    _globals['_TELEOPSETPOINT']._serialized_start = 1230
+    _globals['_TELEOPSETPOINT']._serialized_end = 1427
+    _globals['_TELEOPSTATUS']._serialized_start = 1430
+    _globals['_TELEOPSTATUS']._serialized_end = 1579
+    _globals['_COMMANDRESPONSE']._serialized_start = 1581
+    _globals['_COMMANDRESPONSE']._serialized_end = 1679
+    _globals['_REMOTE']._serialized_start = 1682
+    _globals['_REMOTE']._serialized_end = 2417
\ No newline at end of file
@@ -1,8 +1,11 @@
 import common_pb2 as _common_pb2
 from google.protobuf import any_pb2 as _any_pb2
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Mapping as _Mapping, Optional as _Optional, Union as _Union
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class CompileMissionRequest(_message.Message):
@@ -39,6 +42,114 @@ class CommandRequest(_message.Message):
     def __init__(self, sequence_number: _Optional[int]=..., request: _Optional[_Union[_any_pb2.Any, _Mapping]]=..., method_name: _Optional[str]=..., identity: _Optional[str]=..., vehicle_id: _Optional[str]=...) -> None:
         ...
 
+class BroadcastCommandRequest(_message.Message):
+    __slots__ = ('request', 'method_name', 'vehicle_ids', 'selector', 'timeout')
+    REQUEST_FIELD_NUMBER: _ClassVar[int]
+    METHOD_NAME_FIELD_NUMBER: _ClassVar[int]
+    VEHICLE_IDS_FIELD_NUMBER: _ClassVar[int]
+    SELECTOR_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_FIELD_NUMBER: _ClassVar[int]
+    request: _any_pb2.Any
+    method_name: str
+    vehicle_ids: _containers.RepeatedScalarFieldContainer[str]
+    selector: str
+    timeout: float
+
+    def __init__(self, request: _Optional[_Union[_any_pb2.Any, _Mapping]]=..., method_name: _Optional[str]=..., vehicle_ids: _Optional[_Iterable[str]]=..., selector: _Optional[str]=..., timeout: _Optional[float]=...) -> None:
+        ...
+
+class BroadcastCommandResponse(_message.Message):
+    __slots__ = ('vehicle_id', 'response', 'failed_vehicle_ids')
+    VEHICLE_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    FAILED_VEHICLE_IDS_FIELD_NUMBER: _ClassVar[int]
+    vehicle_id: str
+    response: _common_pb2.Response
+    failed_vehicle_ids: _containers.RepeatedScalarFieldContainer[str]
+
+    def __init__(self, vehicle_id: _Optional[str]=..., response: _Optional[_Union[_common_pb2.Response, _Mapping]]=..., failed_vehicle_ids: _Optional[_Iterable[str]]=...) -> None:
+        ...
+
+class ListVehiclesRequest(_message.Message):
+    __slots__ = ('include_disconnected',)
+    INCLUDE_DISCONNECTED_FIELD_NUMBER: _ClassVar[int]
+    include_disconnected: bool
+
+    def __init__(self, include_disconnected: bool=...) -> None:
+        ...
+
+class VehicleConnection(_message.Message):
+    __slots__ = ('vehicle_id', 'connected', 'last_seen', 'rtt', 'in_flight')
+    VEHICLE_ID_FIELD_NUMBER: _ClassVar[int]
+    CONNECTED_FIELD_NUMBER: _ClassVar[int]
+    LAST_SEEN_FIELD_NUMBER: _ClassVar[int]
+    RTT_FIELD_NUMBER: _ClassVar[int]
+    IN_FLIGHT_FIELD_NUMBER: _ClassVar[int]
+    vehicle_id: str
+    connected: bool
+    last_seen: _timestamp_pb2.Timestamp
+    rtt: float
+    in_flight: int
+
+    def __init__(self, vehicle_id: _Optional[str]=..., connected: bool=..., last_seen: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]]=..., rtt: _Optional[float]=..., in_flight: _Optional[int]=...) -> None:
+        ...
+
+class ListVehiclesResponse(_message.Message):
+    __slots__ = ('vehicles', 'response')
+    VEHICLES_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    vehicles: _containers.RepeatedCompositeFieldContainer[VehicleConnection]
+    response: _common_pb2.Response
+
+    def __init__(self, vehicles: _Optional[_Iterable[_Union[VehicleConnection, _Mapping]]]=..., response: _Optional[_Union[_common_pb2.Response, _Mapping]]=...) -> None:
+        ...
+
+class Heartbeat(_message.Message):
+    __slots__ = ('sequence_number', 'sent_time', 'rtt')
+    SEQUENCE_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    SENT_TIME_FIELD_NUMBER: _ClassVar[int]
+    RTT_FIELD_NUMBER: _ClassVar[int]
+    sequence_number: int
+    sent_time: float
+    rtt: float
+
+    def __init__(self, sequence_number: _Optional[int]=..., sent_time: _Optional[float]=..., rtt: _Optional[float]=...) -> None:
+        ...
+
+class TeleopSetpoint(_message.Message):
+    __slots__ = ('vehicle_id', 'sequence_number', 'velocity', 'duration', 'identity', 'channel')
+    VEHICLE_ID_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    VELOCITY_FIELD_NUMBER: _ClassVar[int]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    IDENTITY_FIELD_NUMBER: _ClassVar[int]
+    CHANNEL_FIELD_NUMBER: _ClassVar[int]
+    vehicle_id: str
+    sequence_number: int
+    velocity: _common_pb2.Velocity
+    duration: _duration_pb2.Duration
+    identity: str
+    channel: int
+
+    def __init__(self, vehicle_id: _Optional[str]=..., sequence_number: _Optional[int]=..., velocity: _Optional[_Union[_common_pb2.Velocity, _Mapping]]=..., duration: _Optional[_Union[_duration_pb2.Duration, _Mapping]]=..., identity: _Optional[str]=..., channel: _Optional[int]=...) -> None:
+        ...
+
+class TeleopStatus(_message.Message):
+    __slots__ = ('vehicle_id', 'sequence_number', 'dropped', 'holding', 'response')
+    VEHICLE_ID_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    DROPPED_FIELD_NUMBER: _ClassVar[int]
+    HOLDING_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    vehicle_id: str
+    sequence_number: int
+    dropped: int
+    holding: bool
+    response: _common_pb2.Response
+
+    def __init__(self, vehicle_id: _Optional[str]=..., sequence_number: _Optional[int]=..., dropped: _Optional[int]=..., holding: bool=..., response: _Optional[_Union[_common_pb2.Response, _Mapping]]=...) -> None:
+        ...
+
 class CommandResponse(_message.Message):
     __slots__ = ('sequence_number', 'response')
     SEQUENCE_NUMBER_FIELD_NUMBER: _ClassVar[int]
@@ -27,6 +27,9 @@ class RemoteStub(object):
             channel: A grpc.Channel.
         """
         self.Command = channel.unary_stream('/steeleagle.protocol.services.remote_service.Remote/Command', request_serializer=services_dot_remote__service__pb2.CommandRequest.SerializeToString, response_deserializer=common__pb2.Response.FromString, _registered_method=True)
+        self.BroadcastCommand = channel.unary_stream('/steeleagle.protocol.services.remote_service.Remote/BroadcastCommand', request_serializer=services_dot_remote__service__pb2.BroadcastCommandRequest.SerializeToString, response_deserializer=services_dot_remote__service__pb2.BroadcastCommandResponse.FromString, _registered_method=True)
+        self.ListVehicles = channel.unary_unary('/steeleagle.protocol.services.remote_service.Remote/ListVehicles', request_serializer=services_dot_remote__service__pb2.ListVehiclesRequest.SerializeToString, response_deserializer=services_dot_remote__service__pb2.ListVehiclesResponse.FromString, _registered_method=True)
+        self.Teleop = channel.stream_stream('/steeleagle.protocol.services.remote_service.Remote/Teleop', request_serializer=services_dot_remote__service__pb2.TeleopSetpoint.SerializeToString, response_deserializer=services_dot_remote__service__pb2.TeleopStatus.FromString, _registered_method=True)
         self.CompileMission = channel.unary_unary('/steeleagle.protocol.services.remote_service.Remote/CompileMission', request_serializer=services_dot_remote__service__pb2.CompileMissionRequest.SerializeToString, response_deserializer=services_dot_remote__service__pb2.CompileMissionResponse.FromString, _registered_method=True)
 
 class RemoteServicer(object):
@@ -43,6 +46,32 @@ class RemoteServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BroadcastCommand(self, request, context):
+        """Sends the same service request to several vehicles at once and
+        streams back their responses, merged in arrival order, followed
+        by an aggregate response
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListVehicles(self, request, context):
+        """Lists the vehicles known to the server along with their
+        connection health
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Teleop(self, request_iterator, context):
+        """Opens a teleoperation channel to a vehicle. Setpoints are relayed
+        to the vehicle as they arrive, without waiting for responses, and
+        the vehicle's teleoperation status is streamed back
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CompileMission(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -50,7 +79,7 @@ class RemoteServicer(object):
         raise NotImplementedError('Method not implemented!')
 
 def add_RemoteServicer_to_server(servicer, server):
-    rpc_method_handlers = {'Command': grpc.unary_stream_rpc_method_handler(servicer.Command, request_deserializer=services_dot_remote__service__pb2.CommandRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'CompileMission': grpc.unary_unary_rpc_method_handler(servicer.CompileMission, request_deserializer=services_dot_remote__service__pb2.CompileMissionRequest.FromString, response_serializer=services_dot_remote__service__pb2.CompileMissionResponse.SerializeToString)}
+    rpc_method_handlers = {'Command': grpc.unary_stream_rpc_method_handler(servicer.Command, request_deserializer=services_dot_remote__service__pb2.CommandRequest.FromString, response_serializer=common__pb2.Response.SerializeToString), 'BroadcastCommand': grpc.unary_stream_rpc_method_handler(servicer.BroadcastCommand, request_deserializer=services_dot_remote__service__pb2.BroadcastCommandRequest.FromString, response_serializer=services_dot_remote__service__pb2.BroadcastCommandResponse.SerializeToString), 'ListVehicles': grpc.unary_unary_rpc_method_handler(servicer.ListVehicles, request_deserializer=services_dot_remote__service__pb2.ListVehiclesRequest.FromString, response_serializer=services_dot_remote__service__pb2.ListVehiclesResponse.SerializeToString), 'Teleop': grpc.stream_stream_rpc_method_handler(servicer.Teleop, request_deserializer=services_dot_remote__service__pb2.TeleopSetpoint.FromString, response_serializer=services_dot_remote__service__pb2.TeleopStatus.SerializeToString), 'CompileMission': grpc.unary_unary_rpc_method_handler(servicer.CompileMission, request_deserializer=services_dot_remote__service__pb2.CompileMissionRequest.FromString, response_serializer=services_dot_remote__service__pb2.CompileMissionResponse.SerializeToString)}
     generic_handler = grpc.method_handlers_generic_handler('steeleagle.protocol.services.remote_service.Remote', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
     server.add_registered_method_handlers('steeleagle.protocol.services.remote_service.Remote', rpc_method_handlers)
@@ -65,6 +94,18 @@ class Remote(object):
     def Command(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
         return grpc.experimental.unary_stream(request, target, '/steeleagle.protocol.services.remote_service.Remote/Command', services_dot_remote__service__pb2.CommandRequest.SerializeToString, common__pb2.Response.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
 
+    @staticmethod
+    def BroadcastCommand(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/steeleagle.protocol.services.remote_service.Remote/BroadcastCommand', services_dot_remote__service__pb2.BroadcastCommandRequest.SerializeToString, services_dot_remote__service__pb2.BroadcastCommandResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def ListVehicles(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/steeleagle.protocol.services.remote_service.Remote/ListVehicles', services_dot_remote__service__pb2.ListVehiclesRequest.SerializeToString, services_dot_remote__service__pb2.ListVehiclesResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def Teleop(request_iterator, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/steeleagle.protocol.services.remote_service.Remote/Teleop', services_dot_remote__service__pb2.TeleopSetpoint.SerializeToString, services_dot_remote__service__pb2.TeleopStatus.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
     @staticmethod
     def CompileMission(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
         return grpc.experimental.unary_unary(request, target, '/steeleagle.protocol.services.remote_service.Remote/CompileMission', services_dot_remote__service__pb2.CompileMissionRequest.SerializeToString, services_dot_remote__service__pb2.CompileMissionResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
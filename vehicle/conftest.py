@@ -163,31 +163,25 @@ async def results():
 
 @pytest_asyncio.fixture(scope='function')
 async def gabriel():
-    from gabriel_protocol.gabriel_pb2 import PayloadType, ResultWrapper
+    from gabriel_protocol.gabriel_pb2 import Status, StatusCode
     from gabriel_server.local_engine import LocalEngine
-    from gabriel_server.cognitive_engine import create_result_wrapper, Engine
+    from gabriel_server.cognitive_engine import Engine, Result
     from util.config import query_config
-    # Sequencer cognitive engine for writing what we see
+    # Sequencer cognitive engine that answers with where it runs
     class RepeaterEngine(Engine):
         def __init__(self, name):
             super().__init__()
             self._name = name
 
         def handle(self, input_frame):
-            status = ResultWrapper.Status.SUCCESS
-            result_wrapper = create_result_wrapper(status)
-            result_wrapper.result_producer_name.value = self._name
-            result = ResultWrapper.Result()
-            result.payload_type = input_frame.payload_type
-            result_wrapper.results.append(result)
-            return result_wrapper
+            return Result(Status(code=StatusCode.SUCCESS), self._name)
     # Run remote server
     remote_engine = LocalEngine(
             lambda: RepeaterEngine('REMOTE'),
             60,
             query_config('cloudlet.remote_compute_service').split(':')[-1],
             2,
-            engine_name='engine',
+            engine_id='engine',
             use_zeromq=True
             )
     remote_task = asyncio.create_task(remote_engine.run_async())
@@ -197,7 +191,7 @@ async def gabriel():
             60,
             None,
             2,
-            engine_name='engine',
+            engine_id='engine',
             use_zeromq=True,
             ipc_path=query_config('internal.streams.local_compute').replace('unix://', '')
             )
@@ -0,0 +1,190 @@
+import asyncio
+import logging
+from collections import deque
+# Gabriel import
+from gabriel_protocol import gabriel_pb2
+
+logger = logging.getLogger('kernel/handlers/capture')
+
+# Messages kept for consumers of an ordered stream (the ZeroMQ default
+# receive high water mark)
+HISTORY = 1000
+
+def payload_converter(proto_class, payload_type):
+    '''
+    Returns a conversion function that parses a serialized message and
+    packs it into a Gabriel input frame.
+    '''
+    def convert(data):
+        message = proto_class()
+        message.ParseFromString(data)
+        input_frame = gabriel_pb2.InputFrame()
+        input_frame.payload_type = payload_type
+        input_frame.any_payload.Pack(message)
+        return input_frame
+    return convert
+
+class _Entry:
+    '''
+    A received message along with its (lazily) converted input frames.
+    '''
+    __slots__ = ('seq', 'index', 'topic', 'data', 'frames')
+
+    def __init__(self, seq, index, topic, data):
+        # Position in the stream and within the topic
+        self.seq = seq
+        self.index = index
+        self.topic = topic
+        self.data = data
+        # Conversions keyed by consumer parameters
+        self.frames = {}
+
+class CaptureStage:
+    '''
+    Receives a stream once and shares it between several consumers (e.g.
+    the local and remote Gabriel clients). Each message is converted into
+    an input frame at most once per set of consumer parameters, the first
+    time a consumer asks for it, and consumers with the same parameters
+    get the same frame object. Consumers track their own cursor into the
+    stream, so a slow consumer skips ahead rather than holding back a
+    fast one.
+
+    In latest mode only the newest message per topic is kept, so every
+    consumer always gets the freshest data. Otherwise, the last `history`
+    messages are kept and delivered in order.
+    '''
+    def __init__(self, name, socket, convert, executor=None, latest=False, history=HISTORY):
+        self.name = name
+        self._socket = socket
+        self._convert = convert
+        # Conversions run on the executor if one is given, otherwise
+        # directly on the event loop
+        self._executor = executor
+        self._latest = latest
+        self._slots = {}
+        self._history = deque(maxlen=history)
+        self._seq = 0
+        self._indices = {}
+        self._updated = asyncio.Event()
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._receive())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def consumer(self, params=()):
+        return CaptureConsumer(self, params)
+
+    async def _receive(self):
+        try:
+            while True:
+                frames = await self._socket.recv_multipart()
+                if len(frames) != 2:
+                    logger.warning(f'Dropping malformed {self.name} message with {len(frames)} frames')
+                    continue
+                topic, data = frames
+                self._seq += 1
+                index = self._indices[topic] = self._indices.get(topic, 0) + 1
+                entry = _Entry(self._seq, index, topic, data)
+                if self._latest:
+                    # Move the topic to the back so the camera that has
+                    # waited the longest is served first
+                    self._slots.pop(topic, None)
+                    self._slots[topic] = entry
+                else:
+                    self._history.append(entry)
+                # Wake every waiting consumer
+                self._updated.set()
+                self._updated = asyncio.Event()
+        except asyncio.exceptions.CancelledError:
+            return
+        except Exception as e:
+            logger.error(f'Capture of {self.name} terminated due to exception: {e}')
+
+    def _next_entry(self, consumer):
+        '''
+        Finds the next entry for a consumer, advancing its cursor.
+        '''
+        if self._latest:
+            for entry in self._slots.values():
+                seen = consumer._cursor.get(entry.topic, 0)
+                if entry.index > seen:
+                    consumer.dropped += entry.index - seen - 1
+                    consumer._cursor[entry.topic] = entry.index
+                    return entry
+            return None
+        if not self._history or self._history[-1].seq <= consumer._cursor:
+            return None
+        oldest = self._history[0].seq
+        if oldest > consumer._cursor + 1:
+            consumer.dropped += oldest - consumer._cursor - 1
+            consumer._cursor = oldest - 1
+        entry = self._history[consumer._cursor - oldest + 1]
+        consumer._cursor = entry.seq
+        return entry
+
+    def _resolve(self, entry, params):
+        '''
+        Gets the future for an entry's input frame, starting the
+        conversion if no consumer with the same parameters has asked
+        for it yet.
+        '''
+        frame = entry.frames.get(params)
+        if frame is None:
+            loop = asyncio.get_running_loop()
+            if self._executor:
+                frame = loop.run_in_executor(self._executor, self._convert, entry.data, *params)
+            else:
+                frame = loop.create_future()
+                try:
+                    frame.set_result(self._convert(entry.data, *params))
+                except Exception as e:
+                    frame.set_exception(e)
+            entry.frames[params] = frame
+        return frame
+
+    async def _get(self, consumer):
+        self.start()
+        entry = self._next_entry(consumer)
+        while entry is None:
+            await self._updated.wait()
+            entry = self._next_entry(consumer)
+        # Shield the shared conversion so one consumer being cancelled
+        # does not cancel it for the others
+        return await asyncio.shield(self._resolve(entry, consumer.params))
+
+class CaptureConsumer:
+    '''
+    A single consumer's view of a capture stage. New consumers start
+    at the current end of the stream. The consumer's parameters are
+    passed to the conversion function after the message data, and may
+    be changed at any time.
+    '''
+    def __init__(self, stage, params=()):
+        self._stage = stage
+        self.params = tuple(params)
+        self._cursor = dict(stage._indices) if stage._latest else stage._seq
+        # Messages this consumer skipped over
+        self.dropped = 0
+
+    def skip(self):
+        '''
+        Skips ahead so the next message returned is the newest one
+        received (or the next one, if it has seen them all). Latest mode
+        stages already do this.
+        '''
+        stage = self._stage
+        if not stage._latest and stage._seq - 1 > self._cursor:
+            self.dropped += stage._seq - 1 - self._cursor
+            self._cursor = stage._seq - 1
+
+    async def get(self):
+        '''
+        Waits for the next message and returns its input frame.
+        '''
+        return await self._stage._get(self)
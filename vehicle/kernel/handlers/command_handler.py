@@ -15,39 +15,89 @@ from google.protobuf import any_pb2
 from util.config import query_config
 from steeleagle_sdk.protocol.rpc_helpers import generate_response, generate_request
 # Protocol import
-from steeleagle_sdk.protocol.services.remote_service_pb2 import CommandRequest, CommandResponse
+from steeleagle_sdk.protocol.services.remote_service_pb2 import CommandRequest, CommandResponse, Heartbeat
 # Law import
 from kernel.laws.authority import Failsafe
+# Teleop import
+from kernel.handlers.teleop import TELEOP_FRAME
 
 logger = logging.getLogger('kernel/handlers/command_handler')
 
+# Leading frame that marks a heartbeat (or its echo) on the command socket
+HEARTBEAT_FRAME = b'heartbeat'
+
 class CommandHandler:
     '''
     Handles all remote input from the server and external vehicles.
     '''
-    def __init__(self, law_authority, command_socket):
+    def __init__(self, law_authority, command_socket, teleop_handler=None):
         self._law_authority = law_authority
         self._command_socket = command_socket
+        self._teleop_handler = teleop_handler
         self._main_loop_task = None
+        self._heartbeat_task = None
+        # Most recently measured round trip time to the server
+        self._rtt = 0.0
     
-    async def start(self, failsafe_timeout=1):
+    async def start(self, failsafe_timeout=1, heartbeat_interval=None):
         self._main_loop_task = asyncio.create_task(self._handle_commands(failsafe_timeout)) 
+        if heartbeat_interval:
+            self._heartbeat_task = asyncio.create_task(self._send_heartbeats(heartbeat_interval))
 
     async def wait_for_termination(self):
         await self._main_loop_task
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+
+    async def _send_heartbeats(self, interval):
+        '''
+        Periodically pings the swarm controller so it can track whether
+        this vehicle is connected. Each ping carries the last measured
+        round trip time.
+        '''
+        heartbeat = Heartbeat()
+        try:
+            while True:
+                heartbeat.sequence_number += 1
+                heartbeat.sent_time = time.monotonic()
+                heartbeat.rtt = self._rtt
+                try:
+                    # Never queue stale heartbeats while disconnected
+                    await self._command_socket.send_multipart(
+                        [HEARTBEAT_FRAME, heartbeat.SerializeToString()],
+                        flags=zmq.NOBLOCK
+                        )
+                except zmq.error.Again:
+                    logger.debug('Swarm controller unreachable, skipping heartbeat')
+                await asyncio.sleep(interval)
+        except asyncio.exceptions.CancelledError:
+            return
+
+    def _handle_heartbeat(self, message):
+        '''
+        Updates the round trip time from a heartbeat echoed by the
+        swarm controller.
+        '''
+        heartbeat = Heartbeat()
+        heartbeat.ParseFromString(message)
+        self._rtt = time.monotonic() - heartbeat.sent_time
+        logger.debug(f'Heartbeat {heartbeat.sequence_number} round trip: {self._rtt * 1000:.1f} ms')
     
     async def _send_results(self, command):
         '''
-        Send command and then relay its results over ZeroMQ.
+        Send command and then relay its results over ZeroMQ. Intermediate
+        responses from streaming methods are relayed as they arrive, tagged
+        with the command's sequence number.
         '''
-        results = await self._law_authority._send_commands([command], identity=command.identity)
-        # Only get one result back
-        result = results[0]
-        logger.info('Sending result back to the swarm controller...')
-        response = CommandResponse()
-        response.sequence_number = command.sequence_number
-        response.response.ParseFromString(result.SerializeToString())
-        await self._command_socket.send(response.SerializeToString())
+        async for result in self._law_authority._stream_command(command, identity=command.identity):
+            if result.status > 1:
+                logger.info('Sending result back to the swarm controller...')
+            else:
+                logger.debug('Sending progress back to the swarm controller...')
+            response = CommandResponse()
+            response.sequence_number = command.sequence_number
+            response.response.ParseFromString(result.SerializeToString())
+            await self._command_socket.send(response.SerializeToString())
 
     async def _handle_commands(self, timeout):
         '''
@@ -79,8 +129,16 @@ class CommandHandler:
                         last_manual_command_ts = None
                     continue
 
+                frames = await self._command_socket.recv_multipart()
+                if len(frames) == 2 and frames[0] == HEARTBEAT_FRAME:
+                    self._handle_heartbeat(frames[1])
+                    continue
                 last_manual_command_ts = time.time()
-                message = await self._command_socket.recv()
+                if len(frames) == 2 and frames[0] == TELEOP_FRAME:
+                    if self._teleop_handler is not None:
+                        self._teleop_handler.handle(frames[1])
+                    continue
+                message = frames[-1]
                 request = CommandRequest()
                 request.ParseFromString(message)
                 asyncio.create_task(self._send_results(request))
@@ -0,0 +1,177 @@
+import logging
+
+logger = logging.getLogger('kernel/handlers/delivery')
+
+# Clock-like fields change with every sample, so they are ignored when
+# deciding whether a sample has changed
+IGNORED_TYPES = ('google.protobuf.Timestamp', 'google.protobuf.Duration')
+
+def _is_repeated(field):
+    # Newer Protobuf releases deprecate field labels
+    if hasattr(field, 'is_repeated'):
+        return field.is_repeated
+    return field.label == field.LABEL_REPEATED
+
+def flatten(message, prefix='', out=None):
+    '''
+    Flattens a message into a dict of leaf field paths to values, leaving
+    out clock-like fields.
+    '''
+    out = {} if out is None else out
+    for field, value in message.ListFields():
+        name = prefix + field.name
+        if field.message_type is not None:
+            if field.message_type.full_name in IGNORED_TYPES:
+                continue
+            if field.message_type.GetOptions().map_entry:
+                for key in value:
+                    item = value[key]
+                    if hasattr(item, 'ListFields'):
+                        flatten(item, f'{name}.{key}.', out)
+                    else:
+                        out[f'{name}.{key}'] = item
+            elif _is_repeated(field):
+                for i, item in enumerate(value):
+                    flatten(item, f'{name}.{i}.', out)
+            else:
+                flatten(value, f'{name}.', out)
+        elif _is_repeated(field):
+            for i, item in enumerate(value):
+                out[f'{name}.{i}'] = item
+        else:
+            out[name] = value
+    return out
+
+def changed(previous, current, threshold):
+    '''
+    Checks whether a flattened sample differs from a previous one, with
+    numeric fields having to move by more than the threshold.
+    '''
+    if previous is None or previous.keys() != current.keys():
+        return True
+    for name, value in current.items():
+        old = previous[name]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if abs(value - old) > threshold:
+                return True
+        elif value != old:
+            return True
+    return False
+
+class DeliveryPolicy:
+    '''
+    Telemetry delivery policy for a datasink. A max_rate of 0 delivers
+    every sample, and a change_threshold of None delivers samples whether
+    or not they changed.
+    '''
+    def __init__(self, max_rate=0.0, change_threshold=None):
+        if max_rate < 0:
+            raise ValueError('max_rate must not be negative')
+        if change_threshold is not None and change_threshold < 0:
+            raise ValueError('change_threshold must not be negative')
+        self.max_rate = max_rate
+        self.change_threshold = change_threshold
+
+    @classmethod
+    def from_proto(cls, info):
+        '''
+        Builds a policy from a DatasinkInfo, or returns None if it does
+        not have one.
+        '''
+        if not info.HasField('policy'):
+            return None
+        policy = info.policy
+        return cls(
+            policy.max_rate if policy.HasField('max_rate') else 0.0,
+            policy.change_threshold if policy.HasField('change_threshold') else None
+            )
+
+    def __eq__(self, other):
+        return isinstance(other, DeliveryPolicy) and \
+            (self.max_rate, self.change_threshold) == (other.max_rate, other.change_threshold)
+
+    def __repr__(self):
+        return f'DeliveryPolicy(max_rate={self.max_rate}, change_threshold={self.change_threshold})'
+
+class _Sink:
+    __slots__ = ('policy', 'last_sent', 'last_sample')
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.last_sent = None
+        self.last_sample = None
+
+    @property
+    def period(self):
+        if self.policy is None or not self.policy.max_rate:
+            return 0.0
+        return 1 / self.policy.max_rate
+
+    def wait(self, now):
+        if self.last_sent is None:
+            return 0.0
+        return max(0.0, self.last_sent + self.period - now)
+
+class DeliveryScheduler:
+    '''
+    Decides which datasinks each sample of a telemetry stream is sent to.
+    Rate limited datasinks are sent a sample once per window, and the
+    producer skips ahead to the latest sample whenever only rate limited
+    datasinks are waiting, so each window delivers its newest sample.
+    Change-only datasinks are skipped until the sample has changed since
+    the last one they were sent.
+    '''
+    def __init__(self, message_class):
+        self._message_class = message_class
+        self._sinks = {}
+
+    def set_engines(self, policies):
+        '''
+        Replaces the datasinks with a dict of engine IDs to policies (or
+        None), keeping the delivery state of unchanged datasinks.
+        '''
+        sinks = {}
+        for engine, policy in policies.items():
+            sink = self._sinks.get(engine)
+            if sink is None or sink.policy != policy:
+                sink = _Sink(policy)
+            sinks[engine] = sink
+        self._sinks = sinks
+
+    def next_due(self, now):
+        '''
+        Returns how long until a datasink is due a sample, or None if
+        there are no datasinks.
+        '''
+        if not self._sinks:
+            return None
+        return min(sink.wait(now) for sink in self._sinks.values())
+
+    def coalesce(self, now):
+        '''
+        Checks whether every datasink due a sample is rate limited, in
+        which case older samples can be skipped.
+        '''
+        return all(sink.period for sink in self._sinks.values() if sink.wait(now) == 0)
+
+    def select(self, input_frame, now):
+        '''
+        Returns the engine IDs a sample should be sent to, recording it
+        as sent to them.
+        '''
+        due = [(engine, sink) for engine, sink in self._sinks.items() if sink.wait(now) == 0]
+        sample = None
+        targets = []
+        for engine, sink in due:
+            threshold = sink.policy.change_threshold if sink.policy else None
+            if threshold is not None:
+                if sample is None:
+                    message = self._message_class()
+                    input_frame.any_payload.Unpack(message)
+                    sample = flatten(message)
+                if not changed(sink.last_sample, sample, threshold):
+                    continue
+                sink.last_sample = sample
+            sink.last_sent = now
+            targets.append(engine)
+        return targets
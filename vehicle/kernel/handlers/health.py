@@ -0,0 +1,170 @@
+import time
+import logging
+from collections import deque
+# Gabriel import
+from gabriel_client.zeromq_client import ZeroMQClient
+
+logger = logging.getLogger('kernel/handlers/health')
+
+class DatasinkHealth:
+    '''
+    Result statistics for a single datasink. Frames sent to the datasink
+    stay pending until it returns a result for them.
+    '''
+    def __init__(self, name, window):
+        self.name = name
+        self.location, self.id = name.split(':', 1)
+        self.results = 0
+        # Monotonic and wall clock time of the last result
+        self.last_result = None
+        self.last_result_time = None
+        self.latencies = deque(maxlen=window)
+        # Send times of frames awaiting a result, by (producer ID, frame ID)
+        self.pending = {}
+        # Whether the datasink went quiet and the failsafe was triggered
+        self.quiet = False
+
+    def percentile(self, q):
+        '''
+        Gets a result latency percentile (0 to 100) over the most recent
+        results, or 0 if there are none.
+        '''
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def stalled_for(self, now):
+        '''
+        Gets how long the datasink has been holding frames without
+        returning any result.
+        '''
+        if not self.pending:
+            return 0.0
+        waiting_since = min(self.pending.values())
+        if self.last_result is not None:
+            waiting_since = max(waiting_since, self.last_result)
+        return now - waiting_since
+
+class ComputeHealth:
+    '''
+    Tracks the health of every datasink from the frames sent to it and
+    the results it returns. A datasink goes quiet once it has held frames
+    for longer than the timeout for its location without returning a
+    result; `check` reports each datasink once when it goes quiet.
+    Producers that run out of Gabriel tokens are tracked as starved until
+    a result returns one.
+    '''
+    def __init__(self, timeouts, window=200):
+        # Timeout in seconds, by location (local or remote)
+        self._timeouts = timeouts
+        self._window = window
+        self._datasinks = {}
+        # Time each starved producer ran out of tokens, by producer ID
+        self._starved = {}
+
+    def __iter__(self):
+        return iter(self._datasinks.values())
+
+    def _datasink(self, name):
+        datasink = self._datasinks.get(name)
+        if datasink is None:
+            datasink = self._datasinks[name] = DatasinkHealth(name, self._window)
+        return datasink
+
+    def set_datasinks(self, names):
+        '''
+        Sets the datasinks that are tracked, keeping the statistics of
+        those that were already tracked.
+        '''
+        self._datasinks = {name: self._datasink(name) for name in names}
+
+    def record_send(self, location, producer_id, frame_id, engines, tokens, now):
+        '''
+        Records a frame sent to a set of engines, with the number of tokens
+        the producer has left after sending it.
+        '''
+        for engine in engines:
+            datasink = self._datasinks.get(f'{location}:{engine}')
+            if datasink is not None:
+                datasink.pending[(producer_id, frame_id)] = now
+        if tokens == 0:
+            self._starved.setdefault(producer_id, now)
+
+    def record_result(self, location, producer_id, frame_id, engine, now):
+        '''
+        Records a result returned by an engine for a frame.
+        '''
+        self._starved.pop(producer_id, None)
+        datasink = self._datasinks.get(f'{location}:{engine}')
+        if datasink is None:
+            return
+        sent = datasink.pending.pop((producer_id, frame_id), None)
+        if sent is not None:
+            datasink.latencies.append(now - sent)
+        datasink.results += 1
+        datasink.last_result = now
+        datasink.last_result_time = time.time()
+        if datasink.quiet:
+            logger.info(f'Datasink {datasink.name} recovered')
+            datasink.quiet = False
+
+    def starved_for(self, datasink, now):
+        '''
+        Gets how long the producers waiting on a datasink have been out
+        of tokens.
+        '''
+        producers = {producer_id for producer_id, _ in datasink.pending}
+        since = [self._starved[p] for p in producers if p in self._starved]
+        return now - min(since) if since else 0.0
+
+    def check(self, now):
+        '''
+        Returns the datasinks that have gone quiet since the last check.
+        '''
+        quiet = []
+        for datasink in self._datasinks.values():
+            timeout = self._timeouts.get(datasink.location)
+            if not timeout:
+                continue
+            if datasink.last_result is not None:
+                # Frames the datasink skipped over are not waiting on it
+                cutoff = datasink.last_result - timeout
+                for key in [k for k, sent in datasink.pending.items() if sent < cutoff]:
+                    del datasink.pending[key]
+            if not datasink.quiet and datasink.stalled_for(now) >= timeout:
+                datasink.quiet = True
+                quiet.append(datasink)
+        return quiet
+
+class MonitoredClient(ZeroMQClient):
+    '''
+    Gabriel client that reports every frame it sends and every result it
+    receives to a ComputeHealth tracker.
+    '''
+    def __init__(self, server_endpoint, input_producers, consumer, health, location):
+        super().__init__(server_endpoint, input_producers, consumer)
+        self._health = health
+        self._location = location
+
+    def record_send_metrics(self, from_client):
+        super().record_send_metrics(from_client)
+        token_pool = self._tokens.get(from_client.producer_id)
+        self._health.record_send(
+            self._location,
+            from_client.producer_id,
+            from_client.frame_id,
+            from_client.target_engine_ids,
+            token_pool.get_remaining_tokens() if token_pool else None,
+            time.monotonic()
+            )
+
+    def record_response_latency(self, result_wrapper):
+        super().record_response_latency(result_wrapper)
+        self._health.record_result(
+            self._location,
+            result_wrapper.producer_id,
+            result_wrapper.result.frame_id,
+            result_wrapper.result.target_engine_id,
+            time.monotonic()
+            )
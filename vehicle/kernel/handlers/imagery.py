@@ -0,0 +1,178 @@
+import time
+import logging
+import numpy as np
+import cv2
+from prometheus_client import Gauge
+# Gabriel import
+from gabriel_protocol import gabriel_pb2
+# Protocol import
+from steeleagle_sdk.protocol.messages.telemetry_pb2 import Frame
+
+logger = logging.getLogger('kernel/handlers/imagery')
+
+# JPEG quality used when encoding frames for compute
+JPEG_QUALITY = 90
+
+# Encoder metrics, labelled by producer (local/remote)
+IMAGERY_JPEG_QUALITY = Gauge(
+    'steeleagle_imagery_jpeg_quality',
+    'JPEG quality of imagery sent to compute',
+    ['producer']
+    )
+IMAGERY_SCALE = Gauge(
+    'steeleagle_imagery_scale',
+    'Resize factor of imagery sent to compute',
+    ['producer']
+    )
+IMAGERY_FRAME_RATE = Gauge(
+    'steeleagle_imagery_frame_rate',
+    'Maximum frame rate of imagery sent to compute',
+    ['producer']
+    )
+
+def encode_frame(data, quality=JPEG_QUALITY, scale=1.0, frame_buffer=None):
+    '''
+    Parses a serialized raw frame and JPEG encodes it into a Gabriel
+    input frame, resizing it by scale first. Frames that reference a
+    shared memory slot are read in place from frame_buffer (a
+    FrameBufferSource). This is CPU bound, so it is run on a thread pool
+    rather than on the event loop.
+    '''
+    raw_frame = Frame()
+    raw_frame.ParseFromString(data)
+    shape = (raw_frame.v_res, raw_frame.h_res, raw_frame.channels)
+    reader = None
+    if raw_frame.HasField('slot'):
+        if frame_buffer is None:
+            raise ValueError(f'frame {raw_frame.id} is in shared memory but no frame buffer is configured')
+        reader = frame_buffer.get()
+        image = reader.view(raw_frame.slot.index, raw_frame.slot.sequence, shape)
+    else:
+        image = np.frombuffer(raw_frame.data, dtype=np.uint8).reshape(shape)
+    if scale < 1.0:
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+    success, encoded_img = cv2.imencode('.jpg', image, encode_param)
+    if not success:
+        raise ValueError(f'could not encode frame {raw_frame.id}')
+    if reader is not None:
+        # The driver may have reused the slot while it was being encoded
+        if not reader.valid(raw_frame.slot.index, raw_frame.slot.sequence):
+            raise LookupError(f'frame {raw_frame.id} was overwritten while encoding')
+        raw_frame.ClearField('slot')
+    # Reuse the raw frame for its metadata, swapping in the JPEG data;
+    # the resolution fields keep describing the native frame
+    raw_frame.data = encoded_img.tobytes()
+    raw_frame.encoding.jpeg_quality = quality
+    raw_frame.encoding.scale = scale
+    input_frame = gabriel_pb2.InputFrame()
+    input_frame.payload_type = gabriel_pb2.PayloadType.IMAGE
+    input_frame.any_payload.Pack(raw_frame)
+    return input_frame
+
+class EncoderPolicy:
+    '''
+    Adapts how imagery is encoded to the link it is sent over. Every
+    `interval` seconds, the average Gabriel token wait time and round
+    trip time are compared against their targets. If either is over
+    target, the policy degrades one step, lowering JPEG quality first,
+    then resolution, then frame rate. If both are under half their
+    target, it recovers one step in the reverse order.
+    '''
+    QUALITY_STEP = 10
+    SCALE_STEP = 0.25
+
+    def __init__(self, name, min_quality=40, max_quality=JPEG_QUALITY, min_scale=0.25,
+                 min_frame_rate=1.0, max_frame_rate=30.0, target_token_wait=0.1,
+                 target_rtt=0.5, interval=1.0):
+        if not 1 <= min_quality <= max_quality <= 100:
+            raise ValueError('JPEG quality bounds must satisfy 1 <= min_quality <= max_quality <= 100')
+        if not 0 < min_scale <= 1:
+            raise ValueError('min_scale must be in (0, 1]')
+        if not 0 < min_frame_rate <= max_frame_rate:
+            raise ValueError('frame rate bounds must satisfy 0 < min_frame_rate <= max_frame_rate')
+        self.name = name
+        self._min_quality = min_quality
+        self._max_quality = max_quality
+        self._min_scale = min_scale
+        self._min_frame_rate = min_frame_rate
+        self._max_frame_rate = max_frame_rate
+        self._target_token_wait = target_token_wait
+        self._target_rtt = target_rtt
+        self._interval = interval
+        # Start at the best quality and back off as needed
+        self.quality = max_quality
+        self.scale = 1.0
+        self.frame_rate = max_frame_rate
+        self._waits = []
+        self._rtts = []
+        self._last_update = time.monotonic()
+        self._publish()
+
+    @property
+    def params(self):
+        '''
+        Encoding parameters to pass to `encode_frame`.
+        '''
+        return (self.quality, self.scale)
+
+    def due(self, now=None):
+        '''
+        Checks whether an interval has passed since the last update.
+        '''
+        now = time.monotonic() if now is None else now
+        return now - self._last_update >= self._interval
+
+    def record_token_wait(self, wait):
+        self._waits.append(wait)
+
+    def record_rtt(self, rtt):
+        self._rtts.append(rtt)
+
+    def update(self, now=None):
+        '''
+        Adjusts the encoding parameters if an interval has passed since
+        the last update. Returns whether the parameters changed.
+        '''
+        now = time.monotonic() if now is None else now
+        if not self.due(now) or not self._waits:
+            return False
+        self._last_update = now
+        wait = sum(self._waits) / len(self._waits)
+        rtt = sum(self._rtts) / len(self._rtts) if self._rtts else 0.0
+        self._waits.clear()
+        self._rtts.clear()
+        before = (self.quality, self.scale, self.frame_rate)
+        if wait > self._target_token_wait or rtt > self._target_rtt:
+            self._degrade()
+        elif wait < self._target_token_wait / 2 and rtt < self._target_rtt / 2:
+            self._recover()
+        if before == (self.quality, self.scale, self.frame_rate):
+            return False
+        logger.info(
+            f'Adapted {self.name} imagery to quality {self.quality}, scale {self.scale}, '
+            f'{self.frame_rate} fps (token wait {wait * 1000:.0f} ms, rtt {rtt * 1000:.0f} ms)'
+            )
+        self._publish()
+        return True
+
+    def _degrade(self):
+        if self.quality > self._min_quality:
+            self.quality = max(self._min_quality, self.quality - self.QUALITY_STEP)
+        elif self.scale > self._min_scale:
+            self.scale = max(self._min_scale, self.scale - self.SCALE_STEP)
+        elif self.frame_rate > self._min_frame_rate:
+            self.frame_rate = max(self._min_frame_rate, self.frame_rate / 2)
+
+    def _recover(self):
+        if self.frame_rate < self._max_frame_rate:
+            self.frame_rate = min(self._max_frame_rate, self.frame_rate * 2)
+        elif self.scale < 1.0:
+            self.scale = min(1.0, self.scale + self.SCALE_STEP)
+        elif self.quality < self._max_quality:
+            self.quality = min(self._max_quality, self.quality + self.QUALITY_STEP)
+
+    def _publish(self):
+        IMAGERY_JPEG_QUALITY.labels(producer=self.name).set(self.quality)
+        IMAGERY_SCALE.labels(producer=self.name).set(self.scale)
+        IMAGERY_FRAME_RATE.labels(producer=self.name).set(self.frame_rate)
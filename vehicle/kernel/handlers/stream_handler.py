@@ -1,27 +1,78 @@
 import asyncio
 import zmq
+import zmq.asyncio
 import time
 import logging
-import numpy as np
-import cv2
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from prometheus_client import REGISTRY
 # Utility import
-from util.config import query_config
+from util.config import query_config, subscribe_config
 from util.sockets import setup_zmq_socket, SocketOperation
+from util.frame_buffer import FrameBufferSource
 # Gabriel import
-from gabriel_client.zeromq_client import ZeroMQClient
 from gabriel_client.gabriel_client import InputProducer
 from gabriel_protocol import gabriel_pb2
 from gabriel_server import cognitive_engine
 # Protocol import
-from steeleagle_sdk.protocol.messages.telemetry_pb2 import DriverTelemetry, Frame, MissionTelemetry
-from steeleagle_sdk.protocol.messages.result_pb2 import ComputeResult
+from steeleagle_sdk.protocol.messages.telemetry_pb2 import DriverTelemetry, MissionTelemetry
+from steeleagle_sdk.protocol.messages.result_pb2 import ComputeResult, ResultEnvelope
+from steeleagle_sdk.protocol.rpc_helpers import result_topic
+# Capture import
+from kernel.handlers.capture import CaptureStage, payload_converter
+from kernel.handlers.imagery import EncoderPolicy, encode_frame, JPEG_QUALITY
+from kernel.handlers.delivery import DeliveryScheduler
+from kernel.handlers.health import ComputeHealth, MonitoredClient
+# Law import
+from kernel.laws.authority import Failsafe
 
 logger = logging.getLogger('kernel/handlers/stream_handler')
 
+# Gabriel's end-to-end input latency histogram, used as the round trip time
+GABRIEL_LATENCY = 'gabriel_client_input_processing_latency_seconds'
+
+# Failsafe triggered when a datasink goes quiet, by location
+COMPUTE_FAILSAFES = {
+    'local': Failsafe.DC_LOCAL_COMPUTE,
+    'remote': Failsafe.DC_REMOTE_COMPUTE
+}
+
+def _latency_totals(producer_id):
+    '''
+    Gets the total latency and number of results recorded by Gabriel
+    for a producer, or None if it has not recorded any.
+    '''
+    labels = {'producer_id': producer_id}
+    total = REGISTRY.get_sample_value(f'{GABRIEL_LATENCY}_sum', labels)
+    count = REGISTRY.get_sample_value(f'{GABRIEL_LATENCY}_count', labels)
+    if total is None or count is None:
+        return None
+    return total, count
+
+def _envelope(result):
+    '''
+    Unwraps the payload of a Gabriel result into a result envelope.
+    '''
+    envelope = ResultEnvelope(engine_id=result.target_engine_id, frame_id=result.frame_id)
+    payload = result.WhichOneof('payload')
+    if payload == 'any_result':
+        envelope.type = result.any_result.type_url.rsplit('/', 1)[-1]
+        envelope.payload = result.any_result.value
+    elif payload == 'string_result':
+        envelope.type = 'string'
+        envelope.payload = result.string_result.encode('utf-8')
+    elif payload == 'bytes_result':
+        envelope.type = 'bytes'
+        envelope.payload = result.bytes_result
+    envelope.timestamp.GetCurrentTime()
+    return envelope
+
 class StreamHandler:
     '''
     Pushes telemetry and imagery to both local compute and remote compute
-    servers and relays results over the result socket.
+    servers and relays results over the result socket. Results are
+    published under a topic per engine and result type, and the latest
+    result for each topic can be fetched from the result cache socket.
     '''
     def __init__(self, law_authority):
         # Reference to the law authority
@@ -33,6 +84,56 @@ class StreamHandler:
             'internal.streams.results',
             SocketOperation.BIND
             )
+        # Latest published result, by topic, for subscribers that join late
+        self._latest_results = {}
+        self._result_cache_sock = zmq.asyncio.Context().socket(zmq.ROUTER)
+        try:
+            setup_zmq_socket(
+                self._result_cache_sock,
+                'internal.streams.results_cache',
+                SocketOperation.BIND
+                )
+        except ValueError:
+            self._result_cache_sock.close()
+            self._result_cache_sock = None
+        self._result_cache_task = None
+        # In latest frame mode, producers always encode the newest frame
+        # instead of working through every frame in order
+        try:
+            self._latest_frame = query_config('imagery.latest_frame')
+        except ValueError:
+            self._latest_frame = True
+        try:
+            encoder_threads = query_config('imagery.encoder_threads')
+        except ValueError:
+            encoder_threads = 2
+        # JPEG encoding is done off the event loop so it does not stall
+        # the gRPC server and command handler
+        self._encoder_pool = ThreadPoolExecutor(
+            max_workers=encoder_threads,
+            thread_name_prefix='imagery_encoder'
+            )
+        # Drivers may write raw frames to a shared memory frame buffer,
+        # sending only frame metadata over the imagery socket
+        try:
+            self._frame_buffer = FrameBufferSource(query_config('internal.streams.imagery_buffer'))
+        except ValueError:
+            self._frame_buffer = None
+        # Each stream is received and converted once, then shared by
+        # the local and remote producers
+        self._captures = {}
+        # Telemetry delivery schedulers, keyed by producer ID
+        self._schedulers = {}
+        # Datasinks that hold frames without returning results for longer
+        # than their location's timeout trigger a failsafe
+        timeouts = {}
+        for location in COMPUTE_FAILSAFES:
+            try:
+                timeouts[location] = query_config(f'internal.timeouts.{location}_compute')
+            except ValueError:
+                timeouts[location] = None
+        self.health = ComputeHealth(timeouts)
+        self._health_task = None
         # Configure local compute handler
         self._local_compute_handler = None
         self._lch_task = None
@@ -45,7 +146,7 @@ class StreamHandler:
             ]
             lc_server = \
                 query_config('internal.streams.local_compute').replace('unix', 'ipc')
-            self._local_compute_handler = ZeroMQClient(lc_server, self._local_producers, self.process)
+            self._local_compute_handler = MonitoredClient(lc_server, self._local_producers, self.process, self.health, 'local')
         except Exception as e:
             logger.error(e)
             logger.warning('No valid configuration found for local compute handler, not running it')
@@ -58,12 +159,12 @@ class StreamHandler:
             # Create producers
             self._remote_producers = [
                 self.get_driver_telemetry_producer(),
-                self.get_imagery_producer(),
+                self.get_imagery_producer(self._get_encoder_policy('remote')),
                 self.get_mission_telemetry_producer()
             ]
             rc_server = \
                 query_config('cloudlet.remote_compute_service')
-            self._remote_compute_handler = ZeroMQClient(f'tcp://{rc_server}', self._remote_producers, self.process)
+            self._remote_compute_handler = MonitoredClient(f'tcp://{rc_server}', self._remote_producers, self.process, self.health, 'remote')
         except Exception as e:
             logger.error(e)
             logger.warning('No valid configuration found for remote compute handler, not running it')
@@ -83,137 +184,279 @@ class StreamHandler:
             self._rch_task = asyncio.create_task(self._remote_compute_handler.launch_async())
         else:
             self._rch_task = asyncio.sleep(0)
+        self._health_task = asyncio.create_task(self._monitor_health())
+        if self._result_cache_sock:
+            self._result_cache_task = asyncio.create_task(self._serve_latest_results())
+        # The remote compute service can be moved without a restart
+        loop = asyncio.get_running_loop()
+        subscribe_config(
+            'cloudlet.remote_compute_service',
+            lambda endpoint: loop.call_soon_threadsafe(self._move_remote_compute, endpoint)
+            )
+
+    async def _monitor_health(self, interval=0.5):
+        '''
+        Triggers the compute failsafe for the location of every datasink
+        that goes quiet.
+        '''
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                for datasink in self.health.check(time.monotonic()):
+                    failsafe = COMPUTE_FAILSAFES[datasink.location]
+                    logger.warning(
+                        f'Datasink {datasink.name} returned no results for '
+                        f'{datasink.stalled_for(time.monotonic()):.1f}s, {failsafe.name} failsafe activated!'
+                        )
+                    await self.law_authority.failsafe(failsafe)
+        except asyncio.exceptions.CancelledError:
+            return
+
+    def _move_remote_compute(self, endpoint):
+        '''
+        Reconnects the remote producers to a new remote compute service.
+        '''
+        if not self._remote_producers or not endpoint:
+            logger.warning(f'Cannot move remote compute to {endpoint}, restart to apply')
+            return
+        logger.info(f'Moving remote compute to {endpoint}')
+        task = self._rch_task
+        self._remote_compute_handler = MonitoredClient(f'tcp://{endpoint}', self._remote_producers, self.process, self.health, 'remote')
+        self._rch_task = asyncio.create_task(self._remote_compute_handler.launch_async())
+        task.cancel()
 
     def update_target_engines(self, target_engines):
         '''
         Update the target engines for local/remote producers. Decides which server the
         engine is on based on the name prefix (remote:____ for a remote engine and
-        local:____ for a local engine).
+        local:____ for a local engine). Target engines may be a dict mapping each
+        engine to its telemetry delivery policy.
         '''
-        logger.info(f'Updating target engines to {target_engines}')
-        remote_engines = []
-        local_engines = []
-        for engine in target_engines:
+        logger.info(f'Updating target engines to {list(target_engines)}')
+        if not isinstance(target_engines, dict):
+            target_engines = dict.fromkeys(target_engines)
+        self.health.set_datasinks(target_engines)
+        remote_engines = {}
+        local_engines = {}
+        for engine, policy in target_engines.items():
             if 'remote:' in engine:
-                remote_engines.append(engine.replace('remote:', ''))
+                remote_engines[engine.replace('remote:', '')] = policy
             elif 'local:' in engine:
-                local_engines.append(engine.replace('local:', ''))
+                local_engines[engine.replace('local:', '')] = policy
         for producer in self._remote_producers:
-            producer.change_target_engines(remote_engines)
+            self._change_target_engines(producer, remote_engines)
         for producer in self._local_producers:
             if len(local_engines):
-                producer.change_target_engines(local_engines)
+                self._change_target_engines(producer, local_engines)
+
+    def _change_target_engines(self, producer, policies):
+        producer.change_target_engines(list(policies))
+        scheduler = self._schedulers.get(producer.producer_id)
+        if scheduler is not None:
+            scheduler.set_engines(policies)
 
     async def wait_for_termination(self):
-        await asyncio.gather(self._lch_task, self._rch_task)
+        self._lch_task = asyncio.ensure_future(self._lch_task)
+        while True:
+            task = asyncio.ensure_future(self._rch_task)
+            self._rch_task = task
+            try:
+                await asyncio.gather(self._lch_task, task)
+                for task in (self._health_task, self._result_cache_task):
+                    if task:
+                        task.cancel()
+                return
+            except asyncio.CancelledError:
+                # Keep waiting if the remote compute client was replaced
+                if self._rch_task is task:
+                    raise
 
     def get_driver_telemetry_producer(self):
-        driver_sock = zmq.asyncio.Context().socket(zmq.SUB)
-        driver_sock.setsockopt(zmq.SUBSCRIBE, b'')
-        setup_zmq_socket(
-            driver_sock,
-            'internal.streams.driver_telemetry',
-            SocketOperation.CONNECT
-            )
-        return InputProducer(
-                self._base_producer(
-                    driver_sock,
-                    DriverTelemetry(),
-                    gabriel_pb2.PayloadType.TEXT
-                    ),
-                [],
-                producer_name="driver_telemetry"
-                )
+        return self._get_telemetry_producer('driver_telemetry', DriverTelemetry)
 
     def get_mission_telemetry_producer(self):
-        mission_sock = zmq.asyncio.Context().socket(zmq.SUB)
-        mission_sock.setsockopt(zmq.SUBSCRIBE, b'')
-        setup_zmq_socket(
-            mission_sock,
-            'internal.streams.mission_telemetry',
-            SocketOperation.CONNECT
-            )
-        return InputProducer(
-                self._base_producer(
-                    mission_sock,
-                    MissionTelemetry(),
-                    gabriel_pb2.PayloadType.TEXT
-                    ),
-                [],
-                producer_name="mission_telemetry"
-                )
+        return self._get_telemetry_producer('mission_telemetry', MissionTelemetry)
 
-    def get_imagery_producer(self):
-        imagery_sock = zmq.asyncio.Context().socket(zmq.SUB)
-        imagery_sock.setsockopt(zmq.SUBSCRIBE, b'')
-        setup_zmq_socket(
-            imagery_sock,
-            'internal.streams.imagery',
-            SocketOperation.CONNECT
+    def get_imagery_producer(self, policy=None):
+        # JPEG encode on the encoder pool; in order mode, only keep about
+        # a second of frames since each one can be several megabytes
+        capture = self._get_capture(
+            'imagery',
+            partial(encode_frame, frame_buffer=self._frame_buffer),
+            executor=self._encoder_pool,
+            latest=self._latest_frame,
+            history=30
             )
-
-        # Define a JPG encoding function
-        async def produce_image():
-            input_frame = gabriel_pb2.InputFrame()
-            input_frame.payload_type = gabriel_pb2.PayloadType.IMAGE
-            try:
-                _, data = await imagery_sock.recv_multipart()
-            except Exception as e:
-                logger.error(f'Exception when reading from producer {type(proto_class)}, {e}')
-                return None
-
-            encoded_frame = Frame()
-            raw_frame = Frame()
-            raw_frame.ParseFromString(data)
-            frame_bytes = np.frombuffer(raw_frame.data, dtype=np.uint8)
-            encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-            _, encoded_img = cv2.imencode(
-                    '.jpg',
-                    frame_bytes.reshape(
-                        raw_frame.v_res,
-                        raw_frame.h_res,
-                        raw_frame.channels),
-                    encode_param
+        if policy is None:
+            return InputProducer(
+                    self._base_producer(capture, (JPEG_QUALITY, 1.0)),
+                    [],
+                    producer_name="images"
                     )
-            encoded_frame.data = encoded_img.tobytes()
-            encoded_frame.timestamp.CopyFrom(raw_frame.timestamp)
-            encoded_frame.id = raw_frame.id
-            encoded_frame.vehicle_info.CopyFrom(raw_frame.vehicle_info)
-            encoded_frame.position_info.CopyFrom(raw_frame.position_info)
-            encoded_frame.gimbal_info.CopyFrom(raw_frame.gimbal_info)
-            encoded_frame.imaging_sensor_info.CopyFrom(raw_frame.imaging_sensor_info)
-            input_frame.any_payload.Pack(encoded_frame)
-            return input_frame
-
-        return InputProducer(
-                produce_image,
+        producer = InputProducer(
+                self._adaptive_producer(capture, policy, lambda: producer.producer_id),
                 [],
                 producer_name="images"
                 )
+        return producer
 
     def process(self, result):
         '''
         Send results from Gabriel over the result socket.
         '''
-        self._result_sock.send_multipart([
-            result.target_engine_id.encode('utf-8'),
-            result.SerializeToString()
-            ])
+        envelope = _envelope(result)
+        topic = result_topic(envelope.engine_id, envelope.type)
+        data = envelope.SerializeToString()
+        self._result_sock.send_multipart([topic, data])
+        self._latest_results[topic] = data
+
+    async def _serve_latest_results(self):
+        '''
+        Answers each topic prefix sent to the result cache socket with the
+        latest result of every matching topic, so subscribers that join
+        late do not wait for the next result. Replies start with the
+        requested prefix, followed by a (topic, ResultEnvelope) pair per
+        matching topic.
+        '''
+        try:
+            while True:
+                frames = await self._result_cache_sock.recv_multipart()
+                if len(frames) != 2:
+                    logger.warning('Dropping malformed result cache request')
+                    continue
+                identity, prefix = frames
+                reply = [identity, prefix]
+                for topic, data in list(self._latest_results.items()):
+                    if topic.startswith(prefix):
+                        reply += [topic, data]
+                await self._result_cache_sock.send_multipart(reply)
+        except asyncio.exceptions.CancelledError:
+            return
+
+    def _get_capture(self, stream, convert, **kwargs):
+        '''
+        Gets the shared capture stage for a stream, connecting to it
+        the first time it is requested.
+        '''
+        capture = self._captures.get(stream)
+        if capture is None:
+            sock = zmq.asyncio.Context().socket(zmq.SUB)
+            sock.setsockopt(zmq.SUBSCRIBE, b'')
+            setup_zmq_socket(
+                sock,
+                f'internal.streams.{stream}',
+                SocketOperation.CONNECT
+                )
+            capture = self._captures[stream] = CaptureStage(stream, sock, convert, **kwargs)
+        return capture
 
-    def _base_producer(self, socket, proto_class, payload_type):
+    def _get_telemetry_producer(self, stream, message_class):
+        capture = self._get_capture(
+            stream,
+            payload_converter(message_class, gabriel_pb2.PayloadType.TEXT)
+            )
+        scheduler = DeliveryScheduler(message_class)
+        producer = InputProducer(
+                self._scheduled_producer(capture, scheduler, lambda: producer),
+                [],
+                producer_name=stream
+                )
+        self._schedulers[producer.producer_id] = scheduler
+        return producer
+
+    def _get_encoder_policy(self, name):
         '''
-        Returns a base producer object that builds a given payload type
-        off a corresponding socket.
+        Builds an adaptive encoder policy from the configuration, or
+        returns None if adaptive encoding is disabled.
         '''
+        try:
+            config = dict(query_config('imagery.adaptive'))
+        except ValueError:
+            return None
+        if not config.pop('enabled', False):
+            return None
+        try:
+            return EncoderPolicy(name, **config)
+        except (TypeError, ValueError) as e:
+            logger.error(f'Invalid adaptive imagery configuration, not adapting {name} imagery: {e}')
+            return None
+
+    def _base_producer(self, capture, params=()):
+        '''
+        Returns a base producer object that reads input frames from its
+        own cursor into a shared capture stage.
+        '''
+        consumer = capture.consumer(params)
         async def producer():
-            input_frame = gabriel_pb2.InputFrame()
-            input_frame.payload_type = payload_type
-            try:
-                _, data = await socket.recv_multipart()
-            except Exception as e:
-                logger.error(f'Exception when reading from producer {type(proto_class)}, {e}')
-                return None
-            proto_class.ParseFromString(data)
-            input_frame.any_payload.Pack(proto_class)
-            return input_frame
+            return await self._base_consume(capture, consumer)
+        return producer
+
+    def _scheduled_producer(self, capture, scheduler, get_producer):
+        '''
+        Returns a producer that sends each telemetry sample only to the
+        datasinks whose delivery policy calls for it. The Gabriel client
+        reads the target engines after a frame is produced, so they are
+        narrowed down to those datasinks just before returning it.
+        '''
+        consumer = capture.consumer()
+        async def producer():
+            while True:
+                wait = scheduler.next_due(time.monotonic())
+                if wait is None:
+                    # No datasinks yet, so defer to the target engines
+                    # set through the client
+                    return await self._base_consume(capture, consumer)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                if scheduler.coalesce(time.monotonic()):
+                    consumer.skip()
+                frame = await self._base_consume(capture, consumer)
+                if frame is None:
+                    return None
+                targets = scheduler.select(frame, time.monotonic())
+                if not targets:
+                    continue
+                gabriel_producer = get_producer()
+                if targets != gabriel_producer.get_target_engines():
+                    gabriel_producer.change_target_engines(targets)
+                return frame
+        return producer
+
+    async def _base_consume(self, capture, consumer):
+        try:
+            return await consumer.get()
+        except Exception as e:
+            logger.error(f'Exception when producing {capture.name}, {e}')
+            return None
+
+    def _adaptive_producer(self, capture, policy, get_producer_id):
+        '''
+        Returns a producer that encodes imagery according to an adaptive
+        policy. The client only asks for the next frame once it holds a
+        token, so the time between handing off a frame and the next call
+        is the token wait time.
+        '''
+        consumer = capture.consumer(policy.params)
+        handed_off = None
+        latency = None
+        async def producer():
+            nonlocal handed_off, latency
+            now = time.monotonic()
+            if handed_off is not None:
+                policy.record_token_wait(now - handed_off)
+            if policy.due(now):
+                totals = _latency_totals(get_producer_id())
+                if totals and latency and totals[1] > latency[1]:
+                    policy.record_rtt((totals[0] - latency[0]) / (totals[1] - latency[1]))
+                latency = totals
+                if policy.update(now):
+                    consumer.params = policy.params
+            # Hold back to the current frame rate
+            if handed_off is not None:
+                delay = handed_off + 1 / policy.frame_rate - now
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            frame = await self._base_consume(capture, consumer)
+            handed_off = time.monotonic()
+            return frame
         return producer
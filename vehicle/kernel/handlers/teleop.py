@@ -0,0 +1,231 @@
+import asyncio
+import time
+import grpc
+import zmq
+import logging
+# Utility import
+from util.config import query_config
+from steeleagle_sdk.protocol.rpc_helpers import generate_request, generate_response
+# Protocol import
+from steeleagle_sdk.protocol.common_pb2 import Response
+from steeleagle_sdk.protocol.services.control_service_pb2 import JoystickRequest
+from steeleagle_sdk.protocol.services.remote_service_pb2 import TeleopSetpoint, TeleopStatus
+
+logger = logging.getLogger('kernel/handlers/teleop')
+
+# Leading frame that marks a teleop setpoint (or status) on the command socket
+TELEOP_FRAME = b'teleop'
+
+CONTROL_SERVICE = '/steeleagle.protocol.services.control_service.Control'
+
+class TeleopHandler:
+    '''
+    Relays teleoperation setpoints from the swarm controller to the driver.
+    Setpoints are written to a single JoystickStream call through the
+    kernel, so they are checked against the current law like any other
+    command without paying for a call each. Only the newest setpoint is
+    ever sent: setpoints that arrive out of order, are replaced before
+    they are sent, or are older than max_age are dropped. If no setpoint
+    arrives within deadman_timeout seconds, the vehicle is ordered to Hold
+    on behalf of the channel, as long as the law accepted its setpoints.
+    Status is reported back to the swarm controller every status_interval
+    seconds while a channel is active.
+    '''
+    def __init__(self, law_authority, command_socket, deadman_timeout=0.5, max_age=0.25, status_interval=0.25):
+        self._law_authority = law_authority
+        self._command_socket = command_socket
+        self._deadman_timeout = deadman_timeout
+        self._max_age = max_age
+        self._status_interval = status_interval
+        channel = grpc.aio.insecure_channel(query_config('internal.services.kernel'))
+        self._channel = channel
+        self._joystick_stream = channel.stream_unary(
+            f'{CONTROL_SERVICE}/JoystickStream',
+            request_serializer=JoystickRequest.SerializeToString,
+            response_deserializer=Response.FromString
+            )
+        self._joystick = channel.unary_unary(
+            f'{CONTROL_SERVICE}/Joystick',
+            request_serializer=JoystickRequest.SerializeToString,
+            response_deserializer=Response.FromString
+            )
+        # Drivers that do not implement JoystickStream get unary calls
+        self._streaming = True
+        # Channel the current setpoints belong to, and the newest
+        # sequence number received on it
+        self._session = None
+        self._received = 0
+        # Identity of the setpoints the law accepted on the current channel
+        self._accepted = None
+        # Newest setpoint that has not been sent yet, with its arrival time
+        self._pending = None
+        self._last_arrival = 0.0
+        self._wake = asyncio.Event()
+        self._status = TeleopStatus()
+        self._task = None
+
+    def handle(self, message):
+        '''
+        Accepts a serialized setpoint from the swarm controller.
+        '''
+        setpoint = TeleopSetpoint()
+        setpoint.ParseFromString(message)
+        if setpoint.channel != self._session:
+            # A new channel starts its own sequence
+            logger.info(f'Teleop channel {setpoint.channel} opened by {setpoint.identity}')
+            self._session = setpoint.channel
+            self._received = 0
+            self._accepted = None
+            self._pending = None
+            self._status = TeleopStatus(vehicle_id=query_config('vehicle.name'))
+        if setpoint.sequence_number <= self._received:
+            logger.debug(f'Dropping out of order setpoint {setpoint.sequence_number}')
+            self._status.dropped += 1
+            return
+        self._received = setpoint.sequence_number
+        if self._pending is not None:
+            self._status.dropped += 1
+        self._last_arrival = time.monotonic()
+        self._pending = (setpoint, self._last_arrival)
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.exceptions.CancelledError:
+                pass
+        await self._channel.close()
+
+    async def _send_status(self, response):
+        # Responses from the law authority use its own message classes
+        self._status.response.ParseFromString(response.SerializeToString())
+        try:
+            # Never queue stale status while disconnected
+            await self._command_socket.send_multipart(
+                [TELEOP_FRAME, self._status.SerializeToString()],
+                flags=zmq.NOBLOCK
+                )
+        except zmq.error.Again:
+            logger.debug('Swarm controller unreachable, skipping teleop status')
+
+    async def _write(self, call, setpoint):
+        '''
+        Sends a setpoint to the driver, returning the call to use for the
+        next one, or None if the call failed, and whether it was sent.
+        '''
+        request = JoystickRequest(request=generate_request(), velocity=setpoint.velocity)
+        if setpoint.HasField('duration'):
+            request.duration.CopyFrom(setpoint.duration)
+        if not self._streaming:
+            try:
+                response = await self._joystick(request, metadata=[('identity', setpoint.identity)])
+            except grpc.aio.AioRpcError as e:
+                response = generate_response(e.code().value[0] + 2, resp_string=e.details())
+            if response.status > 2:
+                await self._send_status(response)
+                return call, False
+            self._accepted = setpoint.identity
+            return call, True
+        if call is None:
+            call = self._joystick_stream(metadata=[('identity', setpoint.identity)])
+        try:
+            await call.write(request)
+            return call, True
+        except (grpc.aio.AioRpcError, asyncio.InvalidStateError):
+            pass
+        code = await call.code()
+        if code == grpc.StatusCode.UNIMPLEMENTED:
+            logger.info('Driver does not implement JoystickStream, falling back to Joystick')
+            self._streaming = False
+            return await self._write(None, setpoint)
+        details = await call.details()
+        logger.error(f'Teleop stream closed with {code}: {details}')
+        await self._send_status(generate_response(code.value[0] + 2, resp_string=details))
+        return None, False
+
+    async def _finish(self, call):
+        '''
+        Closes a JoystickStream call, returning its response, or None if
+        there was no call. The law only rules on a stream once it ends.
+        '''
+        if call is None:
+            return None
+        try:
+            await call.done_writing()
+        except (grpc.aio.AioRpcError, asyncio.InvalidStateError):
+            pass
+        try:
+            return await call
+        except grpc.aio.AioRpcError as e:
+            return generate_response(e.code().value[0] + 2, resp_string=e.details())
+
+    async def _run(self):
+        '''
+        Sends the newest setpoint whenever one arrives, until the deadman
+        timeout passes without a setpoint.
+        '''
+        call = None
+        identity = None
+        session = self._session
+        self._status.holding = False
+        last_status = 0.0
+        try:
+            while True:
+                now = time.monotonic()
+                if now - last_status >= self._status_interval:
+                    await self._send_status(generate_response(1))
+                    last_status = now
+                if self._session != session:
+                    # Setpoints from an old channel must not follow new ones
+                    await self._finish(call)
+                    call, session = None, self._session
+                if self._pending is not None:
+                    setpoint, arrival = self._pending
+                    self._pending = None
+                    if now - arrival > self._max_age:
+                        self._status.dropped += 1
+                        continue
+                    call, sent = await self._write(call, setpoint)
+                    if sent:
+                        identity = setpoint.identity
+                        self._status.sequence_number = setpoint.sequence_number
+                    continue
+                remaining = self._last_arrival + self._deadman_timeout - now
+                if remaining <= 0:
+                    break
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wake.wait(),
+                        min(remaining, last_status + self._status_interval - now)
+                        )
+                except asyncio.TimeoutError:
+                    pass
+            response = await self._finish(call)
+            call = None
+            if response is not None:
+                if response.status <= 2:
+                    self._accepted = identity
+                else:
+                    await self._send_status(response)
+            if self._accepted is None:
+                # Channels the law never accepted must not take control with a Hold
+                logger.warning('No teleop setpoint within the deadman timeout, but none were accepted')
+            else:
+                logger.warning('No teleop setpoint within the deadman timeout, holding!')
+                self._status.holding = True
+                response = (await self._law_authority.send_commands(['Control.Hold'], self._accepted))[0]
+                await self._send_status(response)
+            if self._pending is not None:
+                # Teleop resumed while the Hold was being sent
+                self._task = asyncio.create_task(self._run())
+        except grpc.aio.AioRpcError as e:
+            logger.error(f'Teleop failed with {e.code()}: {e.details()}')
+            await self._send_status(generate_response(e.code().value[0] + 2, resp_string=e.details()))
+        finally:
+            if call is not None:
+                call.cancel()
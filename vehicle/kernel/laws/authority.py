@@ -5,16 +5,18 @@ import json
 from google.protobuf.descriptor_pool import DescriptorPool
 from google.protobuf.descriptor_pb2 import FileDescriptorSet
 from google.protobuf.message_factory import GetMessages
-from google.protobuf.json_format import ParseDict, MessageToDict
+from google.protobuf.json_format import ParseDict, ParseError
 from google.protobuf import any_pb2
 import toml
 import os
-from fnmatch import fnmatch
 import logging
-import aiorwlock
+from dataclasses import dataclass
+from typing import Any
+# Law import
+from kernel.laws.matcher import CompiledLaw
 # Utility import
 from util.config import query_config
-from steeleagle_sdk.protocol.rpc_helpers import native_grpc_call, generate_response, generate_request
+from steeleagle_sdk.protocol.rpc_helpers import build_grpc_callable, stream_grpc_callable, generate_response, generate_request
 # Protocol import
 from steeleagle_sdk.protocol.descriptors import get_descriptors
 
@@ -29,6 +31,27 @@ class Failsafe(Enum):
     DC_LOCAL_COMPUTE = 4
     CORE_ERROR = 5
 
+@dataclass(frozen=True)
+class LawSnapshot:
+    '''
+    Immutable view of the current law. A new snapshot is published
+    whenever a transition completes, so readers never see a partially
+    applied law and do not need to lock.
+    '''
+    state: str = None
+    law: dict = None
+    matcher: CompiledLaw = None
+
+@dataclass(frozen=True)
+class MethodStub:
+    '''
+    Everything needed to dispatch a command to a kernel method, resolved
+    once from the descriptor pool.
+    '''
+    method_desc: Any
+    request_class: Any
+    call: Any
+
 class LawAuthority:
     '''
     Maintains a unified state of the current control law. Other entities
@@ -44,9 +67,18 @@ class LawAuthority:
         with open(path, 'r') as laws:
             self._spec = toml.load(laws)
             self._base = self._spec['__BASE__']
-        self._state = None
-        self._law = None
-        self._lock = aiorwlock.RWLock()
+        # Compile all laws up front so matching does not need to re-parse
+        # rules on every call
+        self._compiled = {
+            state: CompiledLaw(law, self._base)
+            for state, law in self._spec.items()
+            if isinstance(law, dict) and 'rules' in law
+        }
+        self._snapshot = LawSnapshot()
+        # Law transitions and failsafes are serialized through this queue
+        # and run by a single worker task
+        self._transitions = asyncio.Queue()
+        self._transition_task = None
         # Open a channel to connect to kernel services 
         self._channel = grpc.aio.insecure_channel(query_config('internal.services.kernel'))
         # Create a descriptor pool which can look up services by name from
@@ -60,6 +92,33 @@ class LawAuthority:
                 self._name_table[service.name] = f'{file_descriptor_proto.package}.{service.name}'
         # Message class holder to support dynamic instantiation of messages
         self._message_classes = GetMessages(descriptor_set.file)
+        # Build a reusable callable for every method, indexed by its short
+        # name (e.g. Control.Hold)
+        self._methods = {}
+        for name, service in self._name_table.items():
+            service_desc = self._desc_pool.FindServiceByName(service)
+            for method_desc in service_desc.methods:
+                # Client streams (e.g. Control.JoystickStream) cannot be
+                # sent as a single command
+                if method_desc.client_streaming:
+                    continue
+                classes = (
+                        self._message_classes[method_desc.input_type.full_name],
+                        self._message_classes[method_desc.output_type.full_name]
+                        )
+                self._methods[f'{name}.{method_desc.name}'] = MethodStub(
+                        method_desc,
+                        classes[0],
+                        build_grpc_callable(
+                            f'/{service}/{method_desc.name}',
+                            method_desc,
+                            classes,
+                            self._channel
+                            )
+                        )
+        # Parsed requests for JSON commands, so payloads are only
+        # parsed the first time a command is sent
+        self._templates = {}
 
     async def start(self, startup):
         '''
@@ -86,95 +145,55 @@ class LawAuthority:
             logger.error('Transition cancelled!')
             return False
 
-    def check_equal(self, command, request, matcher):
-        '''
-        Checks whether a command matches a command matcher.
-        '''
-        root = None
-        payload = None
-        splits = matcher.split('|')
-        if len(splits) < 2: # No payload match
-            root = splits[0]
-            if fnmatch(command, root):
-                return True
-            else:
-                return False
-        else: # Payload match
-            try:
-                root, payload = splits
-                payload = json.loads(payload)
-                if fnmatch(command, root):
-                    obj = MessageToDict(
-                            request,
-                            preserving_proto_field_name=True
-                            )
-                    return all(k in obj and obj[k] == v for k, v in payload.items())
-                else:
-                    return False
-            except Exception as e:
-                logger.error(f'Encountered error {e} while matching, ignoring...')
-                return False
-    
     async def allows(self, command, request):
         '''
         Perform name matching against law to see if command is
         authorized for the service.
         '''
-        async with self._lock.reader_lock:
-            for expr in (self._law['rules']['allowed'] + self._base['rules']['allowed']):
-                if self.check_equal(command, request, expr):
-                    return True
-            return False
+        matcher = self._snapshot.matcher
+        return matcher is not None and matcher.allows(command, request)
 
     async def match(self, command, request):
         '''
         Switch to the next control state if a name match is found.
         '''
-        next_state = None
-        async with self._lock.reader_lock:
-            # Always consider user conditions first, then apply base cases
-            user_matches = []
-            matches = self._base['rules']['match']
-            if 'match' in self._law['rules']:
-                user_matches = self._law['rules']['match']
-            for expr in user_matches: # User specified
-                if self.check_equal(command, request, expr[0]):
-                    matched = expr
-                    next_state = expr[1]
-                    break
-            for expr in matches: # Base cases
-                if self.check_equal(command, request, expr[0]):
-                    matched = expr
-                    next_state = expr[1]
-                    break
-        if next_state and next_state != self._state:
+        snapshot = self._snapshot
+        if snapshot.matcher is None:
+            return
+        matched = snapshot.matcher.match(command, request)
+        if matched and matched.target != snapshot.state:
             logger.info(
-                    f'{command} matches match expression {matched}; switching law to {next_state}!'
+                    f'{command} matches match expression {[matched.expr, matched.target]}; switching law to {matched.target}!'
                     )
-            await self.set_law(next_state)
+            await self.set_law(matched.target)
 
     async def failsafe(self, failsafe):
         '''
         Performs failsafe actions when key services are disconnected.
         '''
-        async with self._lock.writer_lock:
+        async def run_failsafe():
             name = failsafe.name.lower()
-            commands = []
-            if 'failsafes' in self._law and name in self._law['failsafes']:
-                commands = self._law['failsafes'][name]
+            law = self._snapshot.law or {}
+            commands = list(law.get('failsafes', {}).get(name, []))
             commands += self._base['failsafes'][name]
 
             # Retry sending until commands are fully finished
             responses = await self._send_commands(commands)
             return all(response.status == 2 for response in responses)
+        return await self._transition(run_failsafe)
 
     async def set_law(self, state):
         '''
         Sets a new law and sends on enter commands.
         '''
-        if state == self._state:
+        if state == self._snapshot.state:
             return True
-        async with self._lock.writer_lock:
+
+        async def run_transition():
+            nonlocal state
+            # An earlier queued transition may have already moved us here
+            if state == self._snapshot.state:
+                return True
             if state not in self._spec:
                 logger.error(f'State {state} is not in the law specification!')
                 state = 'REMOTE' # Go into remote mode
@@ -183,80 +202,151 @@ class LawAuthority:
                 if not all(response.status == 2 for response in responses):
                     return False
             try:
-                self._state = state
-                self._law = self._spec[state]
+                # Publish the new law only once enter commands succeed
+                self._snapshot = LawSnapshot(state, self._spec[state], self._compiled[state])
                 logger.info(f'Transitioned to law: {state}')
                 return True
             except Exception as e:
                 logger.error(f'Could not transition to law, reason: {e}')
                 return False
+        return await self._transition(run_transition)
 
     async def get_law(self):
         '''
         Gets the current law.
         '''
-        async with self._lock.reader_lock:
-            return self._state, self._law 
+        snapshot = self._snapshot
+        return snapshot.state, snapshot.law
+
+    async def _transition(self, func):
+        '''
+        Queues a transition coroutine function and waits for its result.
+        '''
+        if self._transition_task is None or self._transition_task.done():
+            self._transition_task = asyncio.create_task(self._handle_transitions())
+        future = asyncio.get_running_loop().create_future()
+        await self._transitions.put((func, future))
+        return await future
+
+    async def _handle_transitions(self):
+        '''
+        Runs queued transitions one at a time, in order of arrival.
+        '''
+        while True:
+            func, future = await self._transitions.get()
+            try:
+                result = await func()
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.exceptions.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def send_commands(self, command_list, identity):
+        '''
+        Sends a list of commands on behalf of an identity. Unlike commands
+        sent by the authority itself, these are checked against the current
+        law like any other command.
+        '''
+        if identity == 'authority':
+            raise ValueError('Commands cannot be sent as the authority')
+        return await self._send_commands(command_list, identity)
 
     async def _send_commands(self, command_list, identity='authority'):
         '''
         Sends a list of commands, either JSON or a Protobuf, to the correct service
-        in kernel and returns the results.
+        in kernel and returns the results. JSON commands prefixed with & are sent
+        concurrently with the command before them; any other command waits for all
+        commands before it to finish, acting as an ordering barrier.
         '''
-        results = []
+        batches = []
         for command in command_list:
-            try:
-                # Check if we are calling a JSON command or a proto object
-                # command from a remote controller
-                is_json_command = True if type(command) == str else False
-                if is_json_command:
-                    splits = command.split('|')
-                    if len(splits) > 1:
-                        full_name, payload = splits
-                    else:
-                        full_name = splits[0]
-                        payload = '{}'
-                    service, method = full_name.rsplit('.', 1)
-                else:
-                    full_name = command.method_name
-                    service, method = full_name.rsplit('.', 1)
-                # Fully qualify the name
-                service = self._name_table[service]
-                service_desc = self._desc_pool.FindServiceByName(service)
-                method_desc = service_desc.FindMethodByName(method)
-                # Build the request
-                request = self._message_classes[method_desc.input_type.full_name]()
-                request.request.ParseFromString(generate_request().SerializeToString())
-                if is_json_command:
-                    ParseDict(json.loads(payload), request, ignore_unknown_fields=True)
+            if type(command) == str and command.startswith('&') and len(batches):
+                batches[-1].append(command[1:])
+            else:
+                batches.append([command.lstrip('&') if type(command) == str else command])
+        results = []
+        for batch in batches:
+            if len(batch) == 1:
+                results.append(await self._send_command(batch[0], identity))
+            else:
+                results += await asyncio.gather(
+                        *(self._send_command(command, identity) for command in batch)
+                        )
+        return results
+
+    def _build_request(self, command):
+        '''
+        Resolves a command to its method stub and builds its request.
+        '''
+        # Check if we are calling a JSON command or a proto object
+        # command from a remote controller
+        if type(command) == str:
+            template = self._templates.get(command)
+            if template is None:
+                splits = command.split('|')
+                if len(splits) > 1:
+                    full_name, payload = splits
                 else:
-                    command.request.Unpack(request)
-                logger.proto(request)
-            except KeyError:
-                # Response failed due to incorrect descriptor lookup, so we reutrn
-                # an INVALID_ARGUMENT response
-                results.append(generate_response(5, resp_string=f'Command does not exist in descriptor table'))
-                continue
-            metadata = [('identity', identity)]
-            # Send in the correct classes to unmarshall from the channel
-            classes = (
-                    self._message_classes[method_desc.input_type.full_name],
-                    self._message_classes[method_desc.output_type.full_name]
-                    )
-            try:
-                response = await native_grpc_call(
-                            metadata,
-                            f'/{service}/{method}',
-                            method_desc,
-                            request,
-                            classes,
-                            self._channel
-                            )
-                results.append(response)
-                logger.proto(response)
-            except grpc.aio.AioRpcError as e:
-                logger.error(f'Encountered RPC error, {e.code()}')
-                response = generate_response(e.code().value[0] + 2, resp_string=e.details())
-                results.append(response)
+                    full_name = splits[0]
+                    payload = '{}'
+                stub = self._methods[full_name]
+                template = (stub, ParseDict(json.loads(payload), stub.request_class(), ignore_unknown_fields=True))
+                self._templates[command] = template
+            stub, payload = template
+            request = stub.request_class()
+            request.request.ParseFromString(generate_request().SerializeToString())
+            request.MergeFrom(payload)
+        else:
+            stub = self._methods[command.method_name]
+            request = stub.request_class()
+            command.request.Unpack(request)
+        return stub, request
+
+    async def _send_command(self, command, identity):
+        '''
+        Sends a single command and returns its final result.
+        '''
+        response = None
+        async for response in self._stream_command(command, identity):
+            pass
+        if response is None:
+            response = generate_response(4, resp_string='No response received')
+        return response
+
+    async def _stream_command(self, command, identity):
+        '''
+        Sends a single command and yields each of its results as they arrive.
+        Server-streaming methods yield their intermediate (e.g. IN_PROGRESS)
+        responses followed by the final response.
+        '''
+        try:
+            stub, request = self._build_request(command)
+            logger.proto(request)
+        except KeyError:
+            # Response failed due to incorrect descriptor lookup, so we reutrn
+            # an INVALID_ARGUMENT response
+            yield generate_response(5, resp_string=f'Command does not exist in descriptor table')
+            return
+        except (ValueError, ParseError) as e:
+            yield generate_response(5, resp_string=f'Malformed command: {e}')
+            return
+        metadata = [('identity', identity)]
+        try:
+            async for response in stream_grpc_callable(
+                        metadata,
+                        stub.method_desc,
+                        request,
+                        stub.call
+                        ):
                 logger.proto(response)
-        return results
+                yield response
+        except grpc.aio.AioRpcError as e:
+            logger.error(f'Encountered RPC error, {e.code()}')
+            response = generate_response(e.code().value[0] + 2, resp_string=e.details())
+            logger.proto(response)
+            yield response
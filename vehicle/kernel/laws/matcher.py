@@ -0,0 +1,181 @@
+import re
+import json
+import math
+import base64
+import logging
+from fnmatch import translate
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.internal.type_checkers import ToShortestFloat
+from google.protobuf.json_format import MessageToDict
+
+logger = logging.getLogger('kernel/laws/matcher')
+
+# Maximum number of distinct commands remembered per law before the
+# decision cache is reset (identities come from client metadata, so
+# this must be bounded)
+CACHE_SIZE = 1024
+
+# Integer types that are rendered as strings in the JSON mapping
+_STRING_INT_TYPES = {
+    FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_SINT64,
+    FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_SFIXED64
+}
+
+def _is_repeated(field):
+    # FieldDescriptor.label is deprecated in newer protobuf releases
+    is_repeated = getattr(field, 'is_repeated', None)
+    if is_repeated is not None:
+        return is_repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+def _value_matches(field, value, expected):
+    '''
+    Compares a single (non-repeated) field value against its expected
+    JSON representation, following the same rules as MessageToDict.
+    '''
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        if field.message_type.file.package == 'google.protobuf':
+            # Well-known types have special JSON mappings
+            return MessageToDict(value, preserving_proto_field_name=True) == expected
+        return isinstance(expected, dict) and message_matches(value, expected, exact=True)
+    elif field.type == FieldDescriptor.TYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value)
+        return (enum_value.name if enum_value else value) == expected
+    elif field.type in _STRING_INT_TYPES:
+        return str(value) == expected
+    elif field.type == FieldDescriptor.TYPE_BYTES:
+        return base64.b64encode(value).decode('utf-8') == expected
+    elif field.type in (FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE):
+        if math.isnan(value):
+            return expected == 'NaN'
+        elif math.isinf(value):
+            return expected == ('Infinity' if value > 0 else '-Infinity')
+        elif field.type == FieldDescriptor.TYPE_FLOAT:
+            return ToShortestFloat(value) == expected
+    return value == expected
+
+def _field_matches(field, value, expected):
+    '''
+    Compares a set field against its expected JSON representation.
+    '''
+    if not _is_repeated(field):
+        return _value_matches(field, value, expected)
+    if field.message_type and field.message_type.GetOptions().map_entry:
+        if not isinstance(expected, dict) or len(value) != len(expected):
+            return False
+        value_field = field.message_type.fields_by_name['value']
+        for k, v in value.items():
+            key = ('true' if k else 'false') if isinstance(k, bool) else str(k)
+            if key not in expected or not _value_matches(value_field, v, expected[key]):
+                return False
+        return True
+    if not isinstance(expected, list) or len(value) != len(expected):
+        return False
+    return all(_value_matches(field, v, e) for v, e in zip(value, expected))
+
+def message_matches(message, expected, exact=False):
+    '''
+    Checks a Protobuf message against a payload dict without converting
+    the message with MessageToDict. Only set fields are considered, so
+    this behaves the same as comparing against the dict form of the
+    message. If exact is set, the message may not have any fields
+    beyond those in the payload (used for nested messages).
+    '''
+    fields = {field.name: (field, value) for field, value in message.ListFields()}
+    if exact and len(fields) != len(expected):
+        return False
+    for name, want in expected.items():
+        if name not in fields:
+            return False
+        field, value = fields[name]
+        if not _field_matches(field, value, want):
+            return False
+    return True
+
+class Rule:
+    '''
+    A precompiled law rule. Rules are written as a command glob with an
+    optional JSON payload matcher, separated by a pipe
+    (e.g. internal.Control.TakeOff|{"take_off_altitude": 10.0}).
+    '''
+    __slots__ = ('expr', 'target', 'payload', '_pattern')
+
+    def __init__(self, expr, target=None):
+        self.expr = expr
+        self.target = target
+        self.payload = None
+        splits = expr.split('|')
+        self._pattern = re.compile(translate(splits[0]))
+        if len(splits) > 1:
+            try:
+                root, payload = splits
+                self.payload = json.loads(payload)
+                if not isinstance(self.payload, dict):
+                    raise ValueError('payload must be a JSON object')
+            except Exception as e:
+                logger.error(f'Encountered error {e} while compiling rule {expr}, ignoring...')
+                self._pattern = None
+
+    def matches_command(self, command):
+        return self._pattern is not None and self._pattern.match(command) is not None
+
+    def matches_request(self, request):
+        if self.payload is None:
+            return True
+        try:
+            return message_matches(request, self.payload)
+        except Exception as e:
+            logger.error(f'Encountered error {e} while matching, ignoring...')
+            return False
+
+class CompiledLaw:
+    '''
+    Indexed form of a single law from the law specification. Rules are
+    compiled once, and the rules that apply to a given command are cached
+    so that each call only has to evaluate payload matchers (if any).
+    '''
+    def __init__(self, law, base):
+        rules = law.get('rules', {})
+        base_rules = base.get('rules', {})
+        self._allowed = [Rule(expr) for expr in rules.get('allowed', []) + base_rules.get('allowed', [])]
+        self._user_matches = [Rule(expr, state) for expr, state in rules.get('match', [])]
+        self._base_matches = [Rule(expr, state) for expr, state in base_rules.get('match', [])]
+        self._cache = {}
+
+    def _candidates(self, command):
+        '''
+        Gets the allowed, user match and base match rules whose command
+        glob matches the provided command.
+        '''
+        candidates = self._cache.get(command)
+        if candidates is None:
+            if len(self._cache) >= CACHE_SIZE:
+                self._cache.clear()
+            candidates = tuple(
+                tuple(rule for rule in rules if rule.matches_command(command))
+                for rules in (self._allowed, self._user_matches, self._base_matches)
+                )
+            self._cache[command] = candidates
+        return candidates
+
+    def allows(self, command, request):
+        '''
+        Checks whether a command is authorized by the law.
+        '''
+        allowed, _, _ = self._candidates(command)
+        return any(rule.matches_request(request) for rule in allowed)
+
+    def match(self, command, request):
+        '''
+        Gets the match rule for a command, or None if there is no match.
+        A base case match takes precedence over a user specified match.
+        '''
+        _, user_matches, base_matches = self._candidates(command)
+        for rules in (base_matches, user_matches):
+            for rule in rules:
+                if rule.matches_request(request):
+                    return rule
+        return None
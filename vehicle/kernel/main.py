@@ -13,27 +13,22 @@ from kernel.laws.interceptor import LawInterceptor
 # Utility import
 from util.cleanup import register_cleanup_handler
 register_cleanup_handler() # Cleanup handler for SIGTERM
-from util.config import query_config
+from util.config import query_config, watch_config
 from util.sockets import setup_zmq_socket, SocketOperation
 from util.log import setup_logging
 setup_logging()
-# Generate proxy files
-from kernel.services.generate_proxy import generate_proxy
-generate_proxy('Control', 'control_service', query_config('internal.services.driver'))
-from kernel.services._gen_control_service_proxy import ControlProxy
-generate_proxy('Mission', 'mission_service', query_config('internal.services.mission'))
-from kernel.services._gen_mission_service_proxy import MissionProxy
+watch_config() # Reload on config change or SIGHUP
 # Service imports
+from kernel.services.proxy_service import ProxyService
 from kernel.services.report_service import ReportService
 from kernel.services.compute_service import ComputeService
 # Proto binding imports
-from steeleagle_sdk.protocol.services import control_service_pb2_grpc
-from steeleagle_sdk.protocol.services import mission_service_pb2_grpc
 from steeleagle_sdk.protocol.services import report_service_pb2_grpc
 from steeleagle_sdk.protocol.services import compute_service_pb2_grpc
 # Remote control handler import
 from handlers.command_handler import CommandHandler
 from handlers.stream_handler import StreamHandler
+from handlers.teleop import TeleopHandler
 
 logger = logging.getLogger('kernel/main')
 
@@ -55,7 +50,12 @@ async def main(args):
     # Set up the law interceptor
     law_interceptor = [LawInterceptor(law_authority)]
     # Create the remote control and stream handler
-    rc_handler = CommandHandler(law_authority, command_socket)
+    try:
+        deadman_timeout = query_config('internal.timeouts.teleop')
+    except ValueError:
+        deadman_timeout = 0.5
+    teleop_handler = TeleopHandler(law_authority, command_socket, deadman_timeout)
+    rc_handler = CommandHandler(law_authority, command_socket, teleop_handler)
     stream_handler = StreamHandler(law_authority)
     
     # Define the server that will hold our services
@@ -64,8 +64,10 @@ async def main(args):
             interceptors=law_interceptor
             )
     # Create and assign the services to the server
-    control_service_pb2_grpc.add_ControlServicer_to_server(ControlProxy(), server)
-    mission_service_pb2_grpc.add_MissionServicer_to_server(MissionProxy(), server)
+    server.add_generic_rpc_handlers((
+        ProxyService('Control', query_config('internal.services.driver')),
+        ProxyService('Mission', query_config('internal.services.mission'))
+        ))
     report_service_pb2_grpc.add_ReportServicer_to_server(ReportService(command_socket), server)
     compute_service_pb2_grpc.add_ComputeServicer_to_server(ComputeService(stream_handler), server)
     # Add main channel to server
@@ -83,9 +85,14 @@ async def main(args):
         logger.info('Device connected!')
 
         try:
-            await rc_handler.start(query_config('internal.timeouts.server'))
+            failsafe_timeout = query_config('internal.timeouts.server')
+        except ValueError:
+            failsafe_timeout = None
+        try:
+            heartbeat_interval = query_config('internal.timeouts.heartbeat')
         except ValueError:
-            await rc_handler.start(failsafe_timeout=None)
+            heartbeat_interval = None
+        await rc_handler.start(failsafe_timeout, heartbeat_interval)
         logger.info('Started handling remote input!')
         await stream_handler.start()
         logger.info('Started handling data streams!')
@@ -103,6 +110,7 @@ async def main(args):
                 stream_handler.wait_for_termination()
                 )
     except (SystemExit, asyncio.exceptions.CancelledError):
+        await teleop_handler.close()
         await server.stop(1)
     
 if __name__ == "__main__":
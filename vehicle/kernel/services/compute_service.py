@@ -1,8 +1,12 @@
+import time
 import logging
 # Protocol import
 from steeleagle_sdk.protocol.services import compute_service_pb2_grpc as compute_proto
+from steeleagle_sdk.protocol.services.compute_service_pb2 import GetDatasinkHealthResponse, DatasinkLocation
 # Utility import
 from steeleagle_sdk.protocol.rpc_helpers import generate_response
+# Delivery import
+from kernel.handlers.delivery import DeliveryPolicy
 
 logger = logging.getLogger('kernel/services/compute_service')
 
@@ -12,26 +16,35 @@ class ComputeService(compute_proto.ComputeServicer):
     '''
     def __init__(self, stream_handler):
         self._stream_handler = stream_handler
-        self._datasinks = set([])
+        # Datasink names mapped to their telemetry delivery policy
+        self._datasinks = {}
 
-    async def AddDatasinks(self, request, context):
-        new_datasinks = set([])
+    def _parse_datasinks(self, request, verb):
+        new_datasinks = {}
         for datasink in request.datasinks:
             location = 'local:' if datasink.location else 'remote:'
-            logger.info(f'Adding datasink {location}{datasink.id}!')
-            new_datasinks.add(f'{location}{datasink.id}')
+            policy = DeliveryPolicy.from_proto(datasink)
+            details = f' with {policy}' if policy else ''
+            logger.info(f'{verb} datasink {location}{datasink.id}{details}!')
+            new_datasinks[f'{location}{datasink.id}'] = policy
+        return new_datasinks
+
+    async def AddDatasinks(self, request, context):
+        try:
+            new_datasinks = self._parse_datasinks(request, 'Adding')
+        except ValueError as e:
+            return generate_response(5, resp_string=f'Invalid datasink policy: {e}')
         
-        self._datasinks = self._datasinks.union(new_datasinks)
+        self._datasinks.update(new_datasinks)
         self._stream_handler.update_target_engines(self._datasinks)
         
         return generate_response(2)
 
     async def SetDatasinks(self, request, context):
-        new_datasinks = set([])
-        for datasink in request.datasinks:
-            location = 'local:' if datasink.location else 'remote:'
-            logger.info(f'Adding datasink {location}{datasink.id}!')
-            new_datasinks.add(f'{location}{datasink.id}')
+        try:
+            new_datasinks = self._parse_datasinks(request, 'Adding')
+        except ValueError as e:
+            return generate_response(5, resp_string=f'Invalid datasink policy: {e}')
         
         self._datasinks = new_datasinks
         self._stream_handler.update_target_engines(self._datasinks)
@@ -39,13 +52,32 @@ class ComputeService(compute_proto.ComputeServicer):
         return generate_response(2)
 
     async def RemoveDatasinks(self, request, context):
-        new_datasinks = set([])
         for datasink in request.datasinks:
             location = 'local:' if datasink.location else 'remote:'
             logger.info(f'Removing datasink {location}{datasink.id}!')
-            new_datasinks.add(f'{location}{datasink.id}')
+            self._datasinks.pop(f'{location}{datasink.id}', None)
         
-        self._datasinks = self._datasinks.difference(new_datasinks)
         self._stream_handler.update_target_engines(self._datasinks)
         
         return generate_response(2)
+
+    async def GetDatasinkHealth(self, request, context):
+        response = GetDatasinkHealthResponse(response=generate_response(2))
+        now = time.monotonic()
+        health = self._stream_handler.health
+        for datasink in health:
+            stats = response.datasinks.add(
+                id=datasink.id,
+                location=DatasinkLocation.LOCAL if datasink.location == 'local' else DatasinkLocation.REMOTE,
+                healthy=not datasink.quiet,
+                results=datasink.results,
+                latency_p50=datasink.percentile(50),
+                latency_p90=datasink.percentile(90),
+                latency_p99=datasink.percentile(99),
+                in_flight=len(datasink.pending),
+                stalled_for=datasink.stalled_for(now),
+                starved_for=health.starved_for(datasink, now)
+                )
+            if datasink.last_result_time is not None:
+                stats.last_result.FromNanoseconds(int(datasink.last_result_time * 1e9))
+        return response
@@ -0,0 +1,130 @@
+import grpc
+import logging
+from functools import partial
+from google.protobuf.descriptor_pool import DescriptorPool
+from google.protobuf.message_factory import GetMessageClass
+# Protocol import
+from steeleagle_sdk.protocol.descriptors import get_descriptors
+
+logger = logging.getLogger('kernel/services/proxy_service')
+
+# Metadata set by gRPC itself, which is not forwarded
+RESERVED_METADATA = ('user-agent', 'content-type', 'te')
+
+class RawRequest:
+    '''
+    Serialized request passed through the kernel without being parsed.
+    Reading a field (e.g. to match a law payload) parses it on first use.
+    '''
+    __slots__ = ('data', '_message_class', '_message')
+
+    def __init__(self, data, message_class):
+        self.data = data
+        self._message_class = message_class
+        self._message = None
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = self._message_class.FromString(self.data)
+        return self._message
+
+    def __getattr__(self, name):
+        return getattr(self.message, name)
+
+def _serialize(request):
+    return request.data
+
+def _forwarded_metadata(metadata):
+    return tuple(
+        (key, value) for key, value in metadata or ()
+        if not key.startswith((':', 'grpc-')) and key not in RESERVED_METADATA
+        )
+
+class ProxyService(grpc.GenericRpcHandler):
+    '''
+    Proxy that forwards every method of a service to the internal service
+    implementing it. This allows identity verification and command
+    authorization without increasing burden of implementation for
+    external services. Methods are found in the protocol descriptors at
+    startup, and requests and responses are passed through as serialized
+    bytes. The caller's deadline, metadata and cancellation carry over to
+    the forwarded call, and its status is returned to the caller.
+    '''
+    def __init__(self, service_name, address, descriptors=None):
+        descriptors = descriptors or get_descriptors()
+        pool = DescriptorPool()
+        for file in descriptors.file:
+            pool.Add(file)
+        service = None
+        for file in descriptors.file:
+            for service_proto in file.service:
+                if service_proto.name == service_name:
+                    service = pool.FindServiceByName(f'{file.package}.{service_name}')
+        if service is None:
+            raise ValueError(f'no service named {service_name} in the protocol descriptors')
+        self.name = service.full_name
+        self._channel = grpc.aio.insecure_channel(address)
+        self._handlers = {}
+        for method in service.methods:
+            path = f'/{service.full_name}/{method.name}'
+            message_class = GetMessageClass(method.input_type)
+            self._handlers[path] = self._build_handler(path, method, message_class)
+
+    def _build_handler(self, path, method, message_class):
+        if method.client_streaming:
+            # Client streams are forwarded as they are, without parsing
+            deserializer = serializer = None
+        else:
+            deserializer = partial(RawRequest, message_class=message_class)
+            serializer = _serialize
+        if method.client_streaming and method.server_streaming:
+            call = self._channel.stream_stream(path)
+            factory, behavior = grpc.stream_stream_rpc_method_handler, self._stream(call)
+        elif method.client_streaming:
+            call = self._channel.stream_unary(path)
+            factory, behavior = grpc.stream_unary_rpc_method_handler, self._unary(call)
+        elif method.server_streaming:
+            call = self._channel.unary_stream(path, request_serializer=serializer)
+            factory, behavior = grpc.unary_stream_rpc_method_handler, self._stream(call)
+        else:
+            call = self._channel.unary_unary(path, request_serializer=serializer)
+            factory, behavior = grpc.unary_unary_rpc_method_handler, self._unary(call)
+        return factory(behavior, request_deserializer=deserializer)
+
+    def service(self, handler_call_details):
+        return self._handlers.get(handler_call_details.method)
+
+    def _call(self, multicallable, request, context):
+        return multicallable(
+            request,
+            timeout=context.time_remaining(),
+            metadata=_forwarded_metadata(context.invocation_metadata())
+            )
+
+    def _unary(self, multicallable):
+        async def behavior(request, context):
+            call = self._call(multicallable, request, context)
+            try:
+                return await call
+            except grpc.aio.AioRpcError as e:
+                await context.abort(e.code(), e.details(), _forwarded_metadata(e.trailing_metadata()))
+            finally:
+                # Cancels the forwarded call if the caller went away
+                call.cancel()
+        return behavior
+
+    def _stream(self, multicallable):
+        async def behavior(request, context):
+            call = self._call(multicallable, request, context)
+            try:
+                async for response in call:
+                    yield response
+            except grpc.aio.AioRpcError as e:
+                await context.abort(e.code(), e.details(), _forwarded_metadata(e.trailing_metadata()))
+            finally:
+                call.cancel()
+        return behavior
+
+    async def close(self):
+        await self._channel.close()
@@ -1,99 +1,142 @@
 import os
-import time
-import subprocess
-import argparse
-import requests
 import json
+import argparse
 import tomllib
+import threading
+import requests
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 # Utility imports
 from util.cleanup import register_cleanup_handler
 register_cleanup_handler()
+from util.supervisor import Service, Supervisor, grpc_probe
 
 ROOST_REPO = 'https://git.cmusatyalab.org/steeleagle/roost/-/raw/main/drivers/'
 ROOST_PYPI = 'https://git.cmusatyalab.org/api/v4/projects/85/packages/pypi/simple'
 PYTHON_DEFAULT = '3.12' # Default Python used by the vehicle driver
+# Driver metadata is cached so booting does not wait on the network
+METADATA_CACHE = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'steeleagle' / 'drivers'
 
-def start_services(log, info):
-    running = []
-    logger = ['python', 'logger/main.py']
+def fetch_driver_metadata(package, timeout=10):
+    '''
+    Fetches the startup commands and Python version of a driver from
+    the roost repository. Returns None if the driver cannot be found.
+    '''
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        cap = pool.submit(requests.get, f'{ROOST_REPO}/{package}/cap.toml', timeout=timeout)
+        pyproject = pool.submit(requests.get, f'{ROOST_REPO}/{package}/pyproject.toml', timeout=timeout)
+        cap_request, py_request = cap.result(), pyproject.result()
+    startup = []
+    if cap_request.status_code == 200:
+        try:
+            # Attempt to load startup commands
+            startup = tomllib.loads(cap_request.text)['startup']
+        except:
+            print('WARNING: Cap could not be read for startup commands, ignoring...')
+    else:
+        print('WARNING: No cap found!')
+    python = PYTHON_DEFAULT
+    if py_request.status_code == 200:
+        try:
+            # Attempt to get the requires-python string
+            python = tomllib.loads(py_request.text)['project']['requires-python']
+        except Exception as e:
+            print('WARNING: Could not read Python version for driver, ignoring...')
+    else:
+        print('ERROR: Could not find associated pyproject.toml, are you sure the package exists?')
+        return None
+    return {'startup': startup, 'python': python}
+
+def _cache_driver_metadata(package):
+    try:
+        metadata = fetch_driver_metadata(package)
+    except requests.RequestException as e:
+        print(f'WARNING: Could not fetch metadata for {package}: {e}')
+        return None
+    if metadata is not None:
+        METADATA_CACHE.mkdir(parents=True, exist_ok=True)
+        (METADATA_CACHE / f'{package}.json').write_text(json.dumps(metadata))
+    return metadata
+
+def get_driver_metadata(package):
+    '''
+    Gets driver metadata from the local cache, refreshing the cache in
+    the background for the next boot, or fetches it if it is not cached.
+    '''
+    try:
+        metadata = json.loads((METADATA_CACHE / f'{package}.json').read_text())
+    except (OSError, ValueError):
+        return _cache_driver_metadata(package)
+    threading.Thread(target=_cache_driver_metadata, args=(package,), daemon=True).start()
+    return metadata
+
+def get_services(log, info, metadata):
+    '''
+    Builds the vehicle services. The kernel waits for every other service,
+    which start in parallel.
+    '''
+    from util.config import query_config
+    services = []
+    kernel_depends = ['mission']
     if log:
-        task = subprocess.Popen(logger)
-        running.append(task)
-    # Start the driver
+        services.append(Service(
+            'logger', ['python', 'logger/main.py'],
+            probe=grpc_probe(query_config('internal.services.flight_log'))
+            ))
+        kernel_depends.append('logger')
     startup = []
     if info:
-        # Get and read the cap file
-        cap_request = requests.get(f'{ROOST_REPO}/{info["package"]}/cap.toml')
-        if cap_request.status_code == 200:
-            try:
-                # Attempt to load startup commands
-                startup = tomllib.loads(cap_request.text)['startup']
-            except:
-                print('WARNING: Cap could not be read for startup commands, ignoring...')
-        else:
-            print('WARNING: No cap found!')
-        # Get and read the pyproject file
-        python = PYTHON_DEFAULT
-        py_request = requests.get(f'{ROOST_REPO}/{info["package"]}/pyproject.toml')
-        if py_request.status_code == 200:
-            try:
-                # Attempt to get the requires-python string
-                python = tomllib.loads(py_request.text)['project']['requires-python']
-            except Exception as e:
-                print('WARNING: Could not read Python version for driver, ignoring...')
-        else:
-            print('ERROR: Could not find associated pyproject.toml, are you sure the package exists?')
-            return
-        if info["kwargs"]:
-            driver = ['uvx', 
-                      '--extra-index-url', ROOST_PYPI,
-                      '--python', python,
-                      info["package"], '--kwargs', json.dumps(info["kwargs"]), info["name"], info["address"], info["telemetry"], info["imagery"]]
-        else:
-            driver = ['uvx', 
-                      '--extra-index-url', ROOST_PYPI,
-                      '--python', python,
-                      info["package"], info["name"], info["address"], info["telemetry"], info["imagery"]]
-        task = subprocess.Popen(driver)
-        running.append(task)
-        time.sleep(5)
-    # Start the mission
-    mission = ['python', 'mission/main.py']
-    task = subprocess.Popen(mission)
-    running.append(task)
-    time.sleep(1)
+        startup = metadata['startup']
+        kwargs = ['--kwargs', json.dumps(info["kwargs"])] if info["kwargs"] else []
+        driver = ['uvx',
+                  '--extra-index-url', ROOST_PYPI,
+                  '--python', metadata['python'],
+                  info["package"], *kwargs, info["name"], info["address"], info["telemetry"], info["imagery"]]
+        services.append(Service('driver', driver, probe=grpc_probe(info['address']), ready_timeout=120.0))
+        kernel_depends.append('driver')
+    services.append(Service(
+        'mission', ['python', 'mission/main.py'],
+        probe=grpc_probe(query_config('internal.services.mission'))
+        ))
     # Start the kernel
     kernel = ['python', 'kernel/main.py']
     if len(startup) > 0:
         kernel.append('--startup')
         for s in startup:
             kernel.append(f'{s}')
-    task = subprocess.Popen(kernel)
-    running.append(task)
-    
-    running.reverse() # Reverse the processes so the logger dies last
+    services.append(Service(
+        'kernel', kernel, depends=kernel_depends,
+        probe=grpc_probe(query_config('internal.services.kernel'))
+        ))
+    return services
+
+def start_services(log, info):
+    metadata = None
+    if info:
+        metadata = get_driver_metadata(info['package'])
+        if metadata is None:
+            return
+    supervisor = Supervisor(get_services(log, info, metadata))
+    supervisor.start()
     try:
-        for subp in running:
-            subp.wait()
+        supervisor.wait()
     except SystemExit:
-        for subp in running:
-            subp.terminate()
-            subp.wait()
+        # Stops the kernel first and the logger last
+        supervisor.stop()
 
 def test_services(test, log):
-    logger_task = subprocess.Popen(['python', 'logger/main.py'])
-    time.sleep(0.1)
-    test_task = subprocess.Popen(['pytest', f'{test}', '-s', '-vv'])
-    time.sleep(0.1)
+    from util.config import query_config
+    supervisor = Supervisor([
+        Service('logger', ['python', 'logger/main.py'],
+                probe=grpc_probe(query_config('internal.services.flight_log'))),
+        Service('test', ['pytest', f'{test}', '-s', '-vv'], depends=['logger'], restart=False)
+        ])
+    supervisor.start()
     try:
-        test_task.wait()
-        logger_task.terminate()
-        logger_task.wait()
+        supervisor.wait('test')
     except SystemExit:
-        test_task.terminate()
-        test_task.wait()
-        logger_task.terminate()
-        logger_task.wait()
+        pass
+    supervisor.stop()
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Configures the logger and starts all major modules.')
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+'''
+Offline indexer and query tool for MCAP flight logs.
+
+Indexing a flight log scans it once and writes a sidecar (<log>.idx)
+describing each chunk: its file offset, time range and, per channel, the
+number of messages, their time range and which log levels and EVENTS
+they contain. Queries only read the sidecars, then seek straight to the
+chunks that can hold matching messages, so looking through hundreds of
+flights does not mean reading them. Sidecars are rebuilt whenever their
+log has changed since it was indexed.
+
+Run from the vehicle directory:
+    python logger/flight_log_index.py index logger/logs
+    python logger/flight_log_index.py query logger/logs --topic kernel/laws/authority \
+        --level ERROR --since 2025-06-01T12:00:00 --until 2025-06-01T13:00:00
+    python logger/flight_log_index.py query logger/logs --event law_transition
+'''
+import io
+import os
+import re
+import sys
+import json
+import struct
+import argparse
+from fnmatch import fnmatch
+from datetime import datetime, timezone
+from pathlib import Path
+# MCAP import
+from mcap.reader import make_reader
+from mcap.opcode import Opcode
+from mcap.records import Chunk
+from mcap.data_stream import ReadDataStream
+from mcap.stream_reader import get_chunk_data_stream
+from mcap_protobuf.decoder import DecoderFactory
+# Protocol import
+from google.protobuf.json_format import MessageToDict
+from steeleagle_sdk.protocol.services import flight_log_service_pb2 as log_proto
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = '.idx'
+LOG_SCHEMA = log_proto.LogMessage.DESCRIPTOR.full_name
+LEVELS = [name for name, _ in sorted(log_proto.LogType.items(), key=lambda item: item[1])]
+# Log messages worth finding quickly, which the index records per chunk
+EVENTS = {
+    'law_transition': re.compile(r'^Transitioned to law: ')
+}
+
+def index_path(path):
+    return Path(f'{path}{INDEX_SUFFIX}')
+
+# Record opcode and length, and the start of a message record
+_RECORD = struct.Struct('<BQ')
+_MESSAGE = struct.Struct('<HIQ')
+
+def _messages(f, offset, channels=None):
+    '''
+    Yields (channel ID, log time, data) for the messages in the chunk at
+    offset, optionally only those on the given channels. Records are
+    parsed in place, which is much faster than building MCAP records.
+    '''
+    # Skip the chunk's opcode and length
+    f.seek(offset + _RECORD.size, io.SEEK_SET)
+    stream, length = get_chunk_data_stream(Chunk.read(ReadDataStream(f)))
+    data = memoryview(stream.read(length))
+    position = 0
+    while position < length:
+        opcode, size = _RECORD.unpack_from(data, position)
+        position += _RECORD.size
+        if opcode == Opcode.MESSAGE:
+            channel_id, _, log_time = _MESSAGE.unpack_from(data, position)
+            if channels is None or channel_id in channels:
+                # Skip the sequence, log time and publish time
+                yield channel_id, log_time, data[position + 22:position + size]
+        position += size
+
+def build_index(path):
+    '''
+    Scans a flight log and writes its sidecar index, returning the index.
+    '''
+    path = Path(path)
+    stat = path.stat()
+    with open(path, 'rb') as f:
+        summary = make_reader(f).get_summary()
+        if summary is None:
+            raise ValueError(f'{path} has no summary, recover it with `mcap recover` first')
+        channels = {}
+        for channel_id, channel in summary.channels.items():
+            schema = summary.schemas.get(channel.schema_id)
+            channels[str(channel_id)] = {
+                'topic': channel.topic,
+                'schema': schema.name if schema else ''
+            }
+        log_channels = {int(cid) for cid, channel in channels.items() if channel['schema'] == LOG_SCHEMA}
+        chunks = []
+        for chunk_index in sorted(summary.chunk_indexes, key=lambda index: index.chunk_start_offset):
+            stats = {}
+            for channel_id, log_time, data in _messages(f, chunk_index.chunk_start_offset):
+                entry = stats.get(channel_id)
+                if entry is None:
+                    # Count, start time, end time, log level and event bitmasks
+                    entry = stats[channel_id] = [0, log_time, log_time, 0, 0]
+                entry[0] += 1
+                entry[1] = min(entry[1], log_time)
+                entry[2] = max(entry[2], log_time)
+                if channel_id in log_channels:
+                    message = log_proto.LogMessage.FromString(data)
+                    entry[3] |= 1 << message.type
+                    for bit, pattern in enumerate(EVENTS.values()):
+                        if pattern.search(message.msg):
+                            entry[4] |= 1 << bit
+            chunks.append({
+                'offset': chunk_index.chunk_start_offset,
+                'start': chunk_index.message_start_time,
+                'end': chunk_index.message_end_time,
+                'channels': {str(cid): entry for cid, entry in stats.items()}
+            })
+    index = {
+        'version': INDEX_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'start': min((chunk['start'] for chunk in chunks), default=0),
+        'end': max((chunk['end'] for chunk in chunks), default=0),
+        'channels': channels,
+        'chunks': chunks
+    }
+    # Write atomically so a concurrent query never sees half an index
+    tmp = index_path(path).with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+    os.replace(tmp, index_path(path))
+    return index
+
+def load_index(path, build=True):
+    '''
+    Loads the sidecar index of a flight log, (re)building it if it is
+    missing or out of date. Returns None if there is no usable index.
+    '''
+    path = Path(path)
+    stat = path.stat()
+    try:
+        with open(index_path(path)) as f:
+            index = json.load(f)
+        if index.get('version') == INDEX_VERSION and \
+                (index['size'], index['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+            return index
+    except (OSError, ValueError):
+        pass
+    if not build:
+        return None
+    return build_index(path)
+
+def find_logs(paths):
+    '''
+    Expands files and directories into the flight logs they contain.
+    '''
+    logs = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            logs.extend(sorted(path.glob('*.mcap')))
+        else:
+            logs.append(path)
+    return logs
+
+def parse_time(value):
+    '''
+    Parses a Unix time in seconds or an ISO 8601 time (UTC unless it has
+    an offset) into Unix nanoseconds.
+    '''
+    try:
+        return int(float(value) * 1e9)
+    except ValueError:
+        pass
+    time = datetime.fromisoformat(value)
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return int(time.timestamp() * 1e9)
+
+class Query:
+    '''
+    Filters for flight log messages. Topics may be globs, level is the
+    minimum log level, message_type matches a schema's full or short
+    name, and event is one of EVENTS. Times are Unix nanoseconds, with
+    until being exclusive.
+    '''
+    def __init__(self, topics=None, level=None, since=None, until=None, message_type=None,
+                 pattern=None, event=None):
+        self.topics = topics or None
+        self.level = level
+        self.since = since
+        self.until = until
+        self.message_type = message_type
+        self.pattern = re.compile(pattern) if pattern else None
+        self.event = EVENTS[event] if event else None
+        self.event_mask = 1 << list(EVENTS).index(event) if event else 0
+        # Log levels a message may have, as a bitmask
+        self.level_mask = 0
+        if level is not None:
+            minimum = LEVELS.index(level.upper())
+            for value in range(minimum, len(LEVELS)):
+                self.level_mask |= 1 << value
+
+    def match_channel(self, channel):
+        if self.topics and not any(fnmatch(channel['topic'], topic) for topic in self.topics):
+            return False
+        if self.message_type and self.message_type not in \
+                (channel['schema'], channel['schema'].rsplit('.', 1)[-1]):
+            return False
+        # Only log messages have a level, and text to search
+        if (self.level_mask or self.pattern or self.event) and channel['schema'] != LOG_SCHEMA:
+            return False
+        return True
+
+    def overlaps(self, start, end):
+        if self.since is not None and end < self.since:
+            return False
+        return self.until is None or start < self.until
+
+    def match_stats(self, stats):
+        count, start, end, levels, events = stats
+        if not self.overlaps(start, end):
+            return False
+        if self.event_mask and not events & self.event_mask:
+            return False
+        return not self.level_mask or levels & self.level_mask
+
+    def match_message(self, log_time, message):
+        if self.since is not None and log_time < self.since:
+            return False
+        if self.until is not None and log_time >= self.until:
+            return False
+        if self.level_mask and not (1 << message.type) & self.level_mask:
+            return False
+        if self.event and not self.event.search(message.msg):
+            return False
+        return not self.pattern or self.pattern.search(message.msg)
+
+class FlightLogIndex:
+    '''
+    Answers queries over a set of indexed flight logs, streaming matches
+    in time order within each flight, and flights in start time order.
+    '''
+    def __init__(self, paths, build=True):
+        self._logs = []
+        for path in find_logs(paths):
+            try:
+                index = load_index(path, build)
+            except (OSError, ValueError) as e:
+                print(f'Skipping {path}: {e}', file=sys.stderr)
+                continue
+            if index is not None:
+                self._logs.append((path, index))
+        self._logs.sort(key=lambda log: log[1]['start'])
+        self._decoder = DecoderFactory()
+        # Chunks read by queries, to check how selective the index is
+        self.chunks_read = 0
+
+    def query(self, query):
+        '''
+        Yields (path, topic, log time, message) for every match. Log
+        messages are LogMessages, other messages are decoded with their
+        schema.
+        '''
+        for path, index in self._logs:
+            if not index['chunks'] or not query.overlaps(index['start'], index['end']):
+                continue
+            channels = {cid for cid, channel in index['channels'].items() if query.match_channel(channel)}
+            if not channels:
+                continue
+            offsets = [
+                chunk['offset'] for chunk in index['chunks']
+                if query.overlaps(chunk['start'], chunk['end']) and any(
+                    cid in channels and query.match_stats(stats)
+                    for cid, stats in chunk['channels'].items()
+                    )
+                ]
+            if offsets:
+                yield from self._read(path, index, offsets, {int(cid) for cid in channels}, query)
+
+    def _read(self, path, index, offsets, channels, query):
+        log_channels = {cid for cid in channels if index['channels'][str(cid)]['schema'] == LOG_SCHEMA}
+        summary = None
+        with open(path, 'rb') as f:
+            for offset in offsets:
+                self.chunks_read += 1
+                messages = sorted(_messages(f, offset, channels), key=lambda message: message[1])
+                for channel_id, log_time, data in messages:
+                    if channel_id in log_channels:
+                        message = log_proto.LogMessage.FromString(data)
+                        if not query.match_message(log_time, message):
+                            continue
+                    else:
+                        if not query.match_message(log_time, None):
+                            continue
+                        # Other messages are decoded with the schema in the log
+                        if summary is None:
+                            position = f.tell()
+                            f.seek(0)
+                            summary = make_reader(f).get_summary()
+                            f.seek(position)
+                        channel = summary.channels[channel_id]
+                        message = self._decode(summary.schemas.get(channel.schema_id), data)
+                    yield path, index['channels'][str(channel_id)]['topic'], log_time, message
+
+    def _decode(self, schema, data):
+        decoder = self._decoder.decoder_for('protobuf', schema) if schema else None
+        return decoder(bytes(data)) if decoder else bytes(data)
+
+def format_match(path, topic, log_time, message, as_json=False):
+    time = datetime.fromtimestamp(log_time / 1e9, timezone.utc).isoformat()
+    if isinstance(message, log_proto.LogMessage):
+        level = log_proto.LogType.Name(message.type)
+        content = message.msg
+    else:
+        level = 'PROTO'
+        content = MessageToDict(message) if hasattr(message, 'DESCRIPTOR') else message.hex()
+    if as_json:
+        return json.dumps({'file': path.name, 'time': time, 'level': level, 'topic': topic, 'message': content})
+    return f'{time} [{level}] {topic}: {content}'
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Index and query MCAP flight logs')
+    commands = parser.add_subparsers(dest='command', required=True)
+    index_parser = commands.add_parser('index', help='Build sidecar indexes')
+    index_parser.add_argument('paths', nargs='+', help='Flight logs or directories of them')
+    index_parser.add_argument('-f', '--force', action='store_true', help='Rebuild up to date indexes')
+    query_parser = commands.add_parser('query', help='Query indexed flight logs')
+    query_parser.add_argument('paths', nargs='+', help='Flight logs or directories of them')
+    query_parser.add_argument('-t', '--topic', action='append', help='Topic or topic glob (repeatable)')
+    query_parser.add_argument('-l', '--level', choices=LEVELS, type=str.upper, help='Minimum log level')
+    query_parser.add_argument('-s', '--since', type=parse_time, help='Start time (Unix seconds or ISO 8601)')
+    query_parser.add_argument('-u', '--until', type=parse_time, help='End time (Unix seconds or ISO 8601)')
+    query_parser.add_argument('-m', '--type', dest='message_type', help='Message type (full or short name)')
+    query_parser.add_argument('-g', '--grep', help='Regular expression to search log text for')
+    query_parser.add_argument('-e', '--event', choices=list(EVENTS), help='Indexed log event')
+    query_parser.add_argument('-n', '--limit', type=int, help='Maximum number of results')
+    query_parser.add_argument('-j', '--json', action='store_true', help='Print JSON lines')
+    query_parser.add_argument('--no-build', action='store_true', help='Skip logs that are not indexed')
+    args = parser.parse_args(argv)
+
+    if args.command == 'index':
+        for path in find_logs(args.paths):
+            try:
+                if args.force or load_index(path, build=False) is None:
+                    index = build_index(path)
+                    print(f'Indexed {path}: {len(index["chunks"])} chunks')
+            except (OSError, ValueError) as e:
+                print(f'Could not index {path}: {e}', file=sys.stderr)
+        return
+
+    log_index = FlightLogIndex(args.paths, build=not args.no_build)
+    query = Query(args.topic, args.level, args.since, args.until, args.message_type, args.grep, args.event)
+    for count, match in enumerate(log_index.query(query)):
+        if args.limit is not None and count >= args.limit:
+            break
+        print(format_match(*match, as_json=args.json), flush=True)
+
+if __name__ == '__main__':
+    main()
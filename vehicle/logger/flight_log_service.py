@@ -1,13 +1,14 @@
 import os
-import time
 import logging
 from concurrent import futures
-# MCAP import
-from mcap_protobuf.writer import Writer
+# Writer import
+from flight_log_writer import FlightLogWriter
 # Utility import
 from util.config import query_config
 from steeleagle_sdk.protocol.rpc_helpers import generate_response
 # Protocol import
+from google.protobuf import descriptor_pool, message_factory
+from steeleagle_sdk.protocol.descriptors import get_descriptors
 from steeleagle_sdk.protocol.services.flight_log_service_pb2_grpc import FlightLogServicer
 from steeleagle_sdk.protocol.services import flight_log_service_pb2 as log_proto
 
@@ -19,9 +20,23 @@ class FlightLogService(FlightLogServicer):
     def __init__(self, filename):
         self._mcap_logger = None
         log_config = query_config('logging')
-        # Get path relative to vehicle directory
-        self._file = open(filename, 'wb')
-        self._mcap_logger = Writer(self._file)
+        # Writer options are optional in the logging config
+        options = {}
+        for key in ['chunk_size', 'compression', 'checkpoint_interval']:
+            if key in log_config:
+                options[key] = log_config[key]
+        if 'max_file_size' in log_config:
+            options['max_file_size'] = log_config['max_file_size'] * 1024 * 1024
+        if 'max_file_duration' in log_config:
+            options['max_file_duration'] = log_config['max_file_duration']
+        # Writes are queued and batched on the writer thread, so RPC
+        # handlers never wait on the file
+        self._mcap_logger = FlightLogWriter(filename, **options)
+        # Binary Protobuf logs are decoded with the protocol descriptors
+        self._pool = descriptor_pool.DescriptorPool()
+        for file in get_descriptors().file:
+            self._pool.Add(file)
+        self._message_classes = {}
         print('Logger attached!')
     
     def _get_publish_ts(self, proto):
@@ -29,15 +44,12 @@ class FlightLogService(FlightLogServicer):
         Gets a timestamp from the request object to get an 
         accurate publish timestamp.
         '''
-        ts = proto.request.timestamp
-        return round((ts.seconds + ts.nanos / 1e9) * 1000)
-
-    def _log_to_mcap(self, request, content):
-        ts = round(time.time() * 1000)
-        self._mcap_logger.write_message(
-            topic=request.topic,
-            message=content,
-            log_time=ts,
+        return proto.request.timestamp.ToNanoseconds()
+
+    def _log_to_mcap(self, request, content, topic=None):
+        self._mcap_logger.write(
+            topic if topic is not None else request.topic,
+            content,
             publish_time=self._get_publish_ts(request)
         )
 
@@ -45,13 +57,55 @@ class FlightLogService(FlightLogServicer):
         self._log_to_mcap(request, request.log)
         return generate_response(2)
 
+    def _get_message_class(self, type_name):
+        message_class = self._message_classes.get(type_name)
+        if message_class is None:
+            descriptor = self._pool.FindMessageTypeByName(type_name)
+            message_class = message_factory.GetMessageClass(descriptor)
+            self._message_classes[type_name] = message_class
+        return message_class
+
+    def _log_proto(self, request):
+        if not request.HasField('message'):
+            self._log_to_mcap(request, request.reqrep_proto)
+            return
+        # Binary messages are written with their own schema, on a topic
+        # per message type since each MCAP channel has a single schema
+        type_name = request.message.TypeName()
+        try:
+            message = self._get_message_class(type_name)()
+        except KeyError:
+            self._log_to_mcap(request, log_proto.LogMessage(
+                type=log_proto.LogType.WARNING,
+                msg=f'Could not log unknown Protobuf type {type_name}'
+                ))
+            return
+        request.message.Unpack(message)
+        self._log_to_mcap(request, message, topic=f'{request.topic}/{message.DESCRIPTOR.name}')
+
     def LogProto(self, request, context):
-        message = request.reqrep_proto
-        self._log_to_mcap(request, message)
+        self._log_proto(request)
         return generate_response(2)
 
+    def LogBatch(self, request_iterator, context):
+        count = 0
+        for batch in request_iterator:
+            for request in batch.logs:
+                self._log_to_mcap(request, request.log)
+            for request in batch.proto_logs:
+                self._log_proto(request)
+            count += len(batch.logs) + len(batch.proto_logs)
+            if batch.dropped:
+                # Record the gap so it shows up on playback
+                self._log_to_mcap(batch, log_proto.LogMessage(
+                    type=log_proto.LogType.WARNING,
+                    msg=f'Client dropped {batch.dropped} log records'
+                    ), topic='logger')
+        return generate_response(2, resp_string=f'{count} records written')
+
     def cleanup(self):
         # Make sure we clean up the MCAP log so it is written to disk
-        self._mcap_logger.finish()
-        self._file.close()
-        print(f'Logger exited, logs written to: {self._file.name}')
+        self._mcap_logger.close()
+        if self._mcap_logger.dropped:
+            print(f'Logger dropped {self._mcap_logger.dropped} messages')
+        print(f'Logger exited, logs written to: {", ".join(self._mcap_logger.files)}')
@@ -0,0 +1,190 @@
+import os
+import time
+import threading
+import importlib.util
+from pathlib import Path
+from collections import deque
+# MCAP import
+from mcap.well_known import MessageEncoding
+from mcap.writer import CompressionType, Writer
+from mcap_protobuf.schema import register_schema
+
+# Chunk compression options, and the module each one needs
+COMPRESSION = {
+    'zstd': (CompressionType.ZSTD, 'zstandard'),
+    'lz4': (CompressionType.LZ4, 'lz4'),
+    'none': (CompressionType.NONE, None)
+}
+
+def get_compression(name):
+    '''
+    Gets the MCAP compression type for a name, falling back to no
+    compression if its library is not installed.
+    '''
+    if name not in COMPRESSION:
+        raise ValueError(f'unknown compression {name}, expected one of {list(COMPRESSION)}')
+    compression, module = COMPRESSION[name]
+    if module is not None and importlib.util.find_spec(module) is None:
+        print(f'{module} is not installed, writing uncompressed flight logs')
+        return CompressionType.NONE
+    return compression
+
+class FlightLogWriter:
+    '''
+    Writes Protobuf messages to MCAP flight logs from a background thread,
+    so RPC handlers only have to queue them. Messages are written in
+    batches into compressed chunks, and the log rolls over to a new file
+    (with a complete summary) once it reaches max_file_size bytes or
+    max_file_duration seconds. Every checkpoint_interval seconds the open
+    chunk is written out and the file is synced, so a crash loses at most
+    one interval of logs and the file can be recovered with `mcap recover`.
+
+    Files are named after path, with a segment number added from the
+    second file on (e.g. flight.mcap, flight_1.mcap, ...).
+    '''
+    def __init__(self, path, chunk_size=1024 * 1024, compression='zstd', max_file_size=0,
+                 max_file_duration=0, checkpoint_interval=5.0, flush_interval=0.05,
+                 batch_size=1024, capacity=100000):
+        self._path = Path(path)
+        self._chunk_size = chunk_size
+        self._compression = get_compression(compression)
+        self._max_file_size = max_file_size
+        self._max_file_duration = max_file_duration
+        self._checkpoint_interval = checkpoint_interval
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._queue = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        # Messages written, and lost because the queue was full
+        self.written = 0
+        self.dropped = 0
+        # Every file written so far, in order
+        self.files = []
+        self._segment = 0
+        self._open()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='flight_log_writer', daemon=True)
+        self._thread.start()
+
+    def write(self, topic, message, publish_time=None):
+        '''
+        Queues a message to be written. Times are in Unix nanoseconds, and
+        the publish time defaults to the time it was queued.
+        '''
+        entry = (topic, message, time.time_ns(), publish_time)
+        with self._lock:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(entry)
+        if len(self._queue) >= self._batch_size:
+            self._wake.set()
+
+    def close(self):
+        '''
+        Writes any queued messages and finishes the current file.
+        '''
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join()
+
+    def _file_name(self, segment):
+        if segment == 0:
+            return self._path
+        return self._path.with_name(f'{self._path.stem}_{segment}{self._path.suffix}')
+
+    def _open(self):
+        path = self._file_name(self._segment)
+        self._file = open(path, 'wb')
+        self._writer = Writer(self._file, chunk_size=self._chunk_size, compression=self._compression)
+        self._writer.start(library='steeleagle flight log')
+        # Schemas and channels are registered per file
+        self._channels = {}
+        self._file_written = 0
+        self._opened = time.monotonic()
+        self._next_checkpoint = self._opened + self._checkpoint_interval
+        self.files.append(str(path))
+
+    def _finish(self):
+        self._writer.finish()
+        self._file.close()
+
+    def _roll(self):
+        self._finish()
+        self._segment += 1
+        self._open()
+
+    def _checkpoint(self):
+        # Writes out the open chunk, even if it is not full yet
+        self._writer.flush()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._next_checkpoint = time.monotonic() + self._checkpoint_interval
+
+    def _due_roll(self, now):
+        # Never roll over to a new file from an empty one
+        if not self._file_written:
+            return False
+        if self._max_file_size and self._file.tell() >= self._max_file_size:
+            return True
+        return bool(self._max_file_duration) and now - self._opened >= self._max_file_duration
+
+    def _channel(self, topic, message_class):
+        channel = self._channels.get(topic)
+        if channel is None:
+            schema_id = register_schema(self._writer, message_class)
+            channel_id = self._writer.register_channel(
+                topic=topic,
+                message_encoding=MessageEncoding.Protobuf,
+                schema_id=schema_id
+                )
+            channel = self._channels[topic] = (channel_id, message_class)
+        elif channel[1] is not message_class:
+            raise ValueError(
+                f'topic {topic} has type {channel[1].DESCRIPTOR.full_name}, '
+                f'cannot write a {message_class.DESCRIPTOR.full_name}'
+                )
+        return channel[0]
+
+    def _drain(self):
+        # Only write what is queued now, so that a steady stream of
+        # messages cannot hold off rolls and checkpoints
+        remaining = len(self._queue)
+        while remaining:
+            count = min(remaining, self._batch_size)
+            remaining -= count
+            self._write_batch(count)
+            if self._due_roll(time.monotonic()):
+                self._roll()
+
+    def _write_batch(self, count):
+        popleft = self._queue.popleft
+        add_message = self._writer.add_message
+        written = 0
+        for _ in range(count):
+            topic, message, log_time, publish_time = popleft()
+            try:
+                add_message(
+                    channel_id=self._channel(topic, type(message)),
+                    log_time=log_time,
+                    data=message.SerializeToString(),
+                    publish_time=publish_time if publish_time is not None else log_time
+                    )
+                written += 1
+            except ValueError as e:
+                print(f'Could not log message on {topic}: {e}')
+        self.written += written
+        self._file_written += written
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self._drain()
+            now = time.monotonic()
+            if self._due_roll(now):
+                self._roll()
+            elif now >= self._next_checkpoint:
+                self._checkpoint()
+        self._drain()
+        self._finish()
@@ -14,10 +14,13 @@ from flight_log_service import FlightLogService
 async def main():
     # Get the file path
     filepath = Path(__file__).parent / 'logs'
+    date_time = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H:%M:%S")
     if query_config('logging.custom_filename') != '':
         filepath = filepath / query_config('logging.custom_filename')
+        # A restarted logger must not overwrite the log it was writing
+        if filepath.exists():
+            filepath = filepath.with_name(f'{filepath.stem}_{date_time}{filepath.suffix}')
     else:
-        date_time = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H:%M:%S")
         name = query_config('vehicle.name')
         filename = name + '_' + date_time + '.mcap'
         filepath = filepath / filename
@@ -8,9 +8,10 @@ from mission.mission_service import MissionService
 
 # Utility import
 from util.log import setup_logging
-from util.config import query_config
+from util.config import query_config, watch_config
 
 setup_logging()
+watch_config() # Reload on config change or SIGHUP
 
 logger = logging.getLogger("mission/main")
 
@@ -21,6 +22,10 @@ async def main():
     address['telemetry'] = 'ipc:///tmp/driver_telem.sock'
     address['results'] = 'ipc:///tmp/results.sock'
     # address['results'] = query_config('internal.streams.results')
+    try:
+        address['results_cache'] = query_config('internal.streams.results_cache').replace('unix', 'ipc')
+    except ValueError:
+        pass
 
     # Define the server that will hold our services
     server = grpc.aio.server(migration_thread_pool=futures.ThreadPoolExecutor(max_workers=10))
@@ -37,8 +37,10 @@ class MissionService(MissionServicer):
         vehicle_address = self.address.get("vehicle")
         tel_address = self.address.get("telemetry")
         results_address = self.address.get("results")
+        results_cache_address = self.address.get("results_cache")
         map = self.mission_map
-        await dsl_msn_runtime.init(self.mission, vehicle_address, tel_address, results_address, map)
+        await dsl_msn_runtime.init(self.mission, vehicle_address, tel_address, results_address, map,
+                                   result_cache_address=results_cache_address)
 
     async def Start(self, request, context):
         """Start an uploaded mission"""
@@ -0,0 +1,97 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from mcap.reader import make_reader
+from mcap_protobuf.writer import Writer
+# Writer import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'logger'))
+from flight_log_writer import FlightLogWriter, get_compression
+# Protocol import
+import steeleagle_sdk.protocol.messages.telemetry_pb2 as telemetry_proto
+import steeleagle_sdk.protocol.services.flight_log_service_pb2 as log_proto
+
+'''
+Benchmark for sustained flight log throughput. Writes a mix of log
+records and imagery metadata from several threads (like the log service's
+RPC handlers) and compares writing them directly through a locked
+mcap_protobuf writer against the batched FlightLogWriter.
+
+Run from the vehicle directory:
+    PYTHONPATH=. python test/benchmarks/flight_log_benchmark.py --messages 200000
+'''
+
+def messages(count):
+    log = log_proto.LogMessage(type=log_proto.LogType.INFO, msg='Sent Control.SetVelocity to vehicle')
+    frame = telemetry_proto.Frame(id=1, h_res=1920, v_res=1080, channels=3)
+    for i in range(count):
+        if i % 4:
+            yield 'kernel/handlers/command_handler', log
+        else:
+            yield 'imagery', frame
+
+def run_threads(threads, count, write):
+    def worker():
+        for topic, message in messages(count // threads):
+            write(topic, message)
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+
+def direct(path, args):
+    lock = threading.Lock()
+    with open(path, 'wb') as f:
+        writer = Writer(f, chunk_size=args.chunk_size, compression=get_compression(args.compression))
+        def write(topic, message):
+            with lock:
+                writer.write_message(topic, message, time.time_ns(), time.time_ns())
+        start = time.perf_counter()
+        run_threads(args.threads, args.messages, write)
+        queued = time.perf_counter() - start
+        writer.finish()
+    return queued, time.perf_counter() - start, [path]
+
+def batched(path, args):
+    writer = FlightLogWriter(
+        path,
+        chunk_size=args.chunk_size,
+        compression=args.compression,
+        max_file_size=args.max_file_size * 1024 * 1024,
+        # Queue everything so the sustained rate is not limited by drops
+        capacity=args.messages
+        )
+    start = time.perf_counter()
+    run_threads(args.threads, args.messages, lambda topic, message: writer.write(topic, message))
+    queued = time.perf_counter() - start
+    writer.close()
+    if writer.dropped:
+        print(f'dropped {writer.dropped} messages')
+    return queued, time.perf_counter() - start, writer.files
+
+def count_messages(files):
+    total = 0
+    for name in files:
+        with open(name, 'rb') as f:
+            total += make_reader(f).get_summary().statistics.message_count
+    return total
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--messages', type=int, default=100000, help='Messages to write [default: 100000]')
+    parser.add_argument('-t', '--threads', type=int, default=4, help='Writing threads [default: 4]')
+    parser.add_argument('-c', '--compression', default='zstd', help='Chunk compression (zstd, lz4, none) [default: zstd]')
+    parser.add_argument('-s', '--chunk-size', type=int, default=1024 * 1024, help='Chunk size in bytes [default: 1 MiB]')
+    parser.add_argument('-m', '--max-file-size', type=int, default=0, help='Roll files after this many MiB [default: 0]')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for label, func in [('direct', direct), ('batched', batched)]:
+            queued, total, files = func(os.path.join(directory, f'{label}.mcap'), args)
+            print(f'{label}:')
+            print(f'  caller:    {args.messages / queued:,.0f} msg/s')
+            print(f'  sustained: {args.messages / total:,.0f} msg/s')
+            print(f'  files:     {len(files)}, {count_messages(files)} messages, '
+                  f'{sum(os.path.getsize(name) for name in files) / 1024 / 1024:.1f} MiB')
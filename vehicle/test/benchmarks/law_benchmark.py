@@ -0,0 +1,102 @@
+import time
+import json
+import argparse
+from fnmatch import fnmatch
+import toml
+from google.protobuf.json_format import MessageToDict
+# Law import
+from kernel.laws.matcher import CompiledLaw
+# Protocol import
+import steeleagle_sdk.protocol.common_pb2 as common_proto
+import steeleagle_sdk.protocol.services.control_service_pb2 as control_proto
+import steeleagle_sdk.protocol.services.mission_service_pb2 as mission_proto
+
+'''
+Micro-benchmark for per-call law authorization latency. Compares the
+original string-based matcher (re-split, re-parse and MessageToDict per
+rule) against the precompiled matcher used by the law authority.
+
+Run from the vehicle directory:
+    PYTHONPATH=. python test/benchmarks/law_benchmark.py
+'''
+
+def legacy_check_equal(command, request, matcher):
+    splits = matcher.split('|')
+    if len(splits) < 2:
+        return fnmatch(command, splits[0])
+    root, payload = splits
+    payload = json.loads(payload)
+    if fnmatch(command, root):
+        obj = MessageToDict(request, preserving_proto_field_name=True)
+        return all(k in obj and obj[k] == v for k, v in payload.items())
+    return False
+
+def legacy_authorize(law, base, command, request):
+    allowed = False
+    for expr in (law['rules']['allowed'] + base['rules']['allowed']):
+        if legacy_check_equal(command, request, expr):
+            allowed = True
+            break
+    next_state = None
+    if allowed:
+        for expr in law['rules'].get('match', []):
+            if legacy_check_equal(command, request, expr[0]):
+                next_state = expr[1]
+                break
+        for expr in base['rules']['match']:
+            if legacy_check_equal(command, request, expr[0]):
+                next_state = expr[1]
+                break
+    return allowed, next_state
+
+def compiled_authorize(compiled, command, request):
+    allowed = compiled.allows(command, request)
+    next_state = None
+    if allowed:
+        rule = compiled.match(command, request)
+        if rule:
+            next_state = rule.target
+    return allowed, next_state
+
+CALLS = [
+    ('internal.Control.Joystick', control_proto.JoystickRequest(
+        velocity=common_proto.Velocity(x_vel=1.0, y_vel=0.5))),
+    ('internal.Control.TakeOff', control_proto.TakeOffRequest(take_off_altitude=10.0)),
+    ('internal.Control.SetGlobalPosition', control_proto.SetGlobalPositionRequest(
+        location=common_proto.Location(latitude=10.0, longitude=5.0))),
+    ('internal.Mission.Start', mission_proto.StartRequest()),
+    ('server.Control.Hold', control_proto.HoldRequest()),
+    ('external.Mission.Notify', mission_proto.NotifyRequest())
+]
+
+def run(label, func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for command, request in CALLS:
+            func(command, request)
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / (iterations * len(CALLS)) * 1e6
+    print(f'{label:<10} {per_call:8.2f} us/call')
+    return per_call
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks law authorization latency.')
+    parser.add_argument('--laws', type=str, default='test/configs/law_test/laws.toml', help='law specification to benchmark against')
+    parser.add_argument('--law', type=str, default='LOCAL', help='law to authorize commands under (default: LOCAL)')
+    parser.add_argument('--iterations', type=int, default=20000, help='number of passes over the command mix')
+    args = parser.parse_args()
+
+    spec = toml.load(args.laws)
+    base = spec['__BASE__']
+    law = spec[args.law]
+    compiled = CompiledLaw(law, base)
+
+    # Both implementations must agree before timing them
+    for command, request in CALLS:
+        expected = legacy_authorize(law, base, command, request)
+        actual = compiled_authorize(compiled, command, request)
+        assert expected == actual, f'{command}: {expected} != {actual}'
+
+    before = run('legacy', lambda c, r: legacy_authorize(law, base, c, r), args.iterations)
+    after = run('compiled', lambda c, r: compiled_authorize(compiled, c, r), args.iterations)
+    print(f'speedup    {before / after:8.2f}x')
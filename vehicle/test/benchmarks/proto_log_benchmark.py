@@ -0,0 +1,80 @@
+import os
+import time
+import logging
+import argparse
+from google.protobuf.json_format import MessageToDict
+# Protocol import
+import steeleagle_sdk.protocol.services.control_service_pb2 as control_proto
+import steeleagle_sdk.protocol.messages.telemetry_pb2 as telemetry_proto
+
+'''
+Micro-benchmark for the caller-side cost of logger.proto. Compares eager
+JSON conversion (the original behaviour) against lazy records sent to the
+flight log handler as binary Protobufs, with and without a rate limit,
+and measures the console handler that setup_logging installs with
+console_protos off and on, against printing protos on the calling thread.
+
+Run from the vehicle directory:
+    PYTHONPATH=. python test/benchmarks/proto_log_benchmark.py
+'''
+
+def eager_proto(logger, message):
+    if logger.isEnabledFor(logging.PROTO):
+        logger.log(logging.PROTO, f'{message.DESCRIPTOR.name} | {MessageToDict(message)}')
+
+def measure(label, iterations, log, message):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        log(message)
+    elapsed = time.perf_counter() - start
+    print(f'{label:<32} {elapsed / iterations * 1e6:8.2f} us/call')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--iterations', type=int, default=20000, help='Calls per case [default: 20000]')
+    args = parser.parse_args()
+    os.environ.setdefault('CONFIGPATH', './test/configs/default/config.toml')
+    os.environ.setdefault('INTERNALPATH', './test/configs/default/internal.toml')
+    os.environ.setdefault('LAWPATH', './test/configs/default/laws.toml')
+    from util.log import FlightLogHandler, PROTO_SAMPLER, ColorFormatter, console_handler
+    # No log service is listening, so records are dropped after being sent
+    # from the flush thread, off the calling thread
+    text_handler = FlightLogHandler('unix:///tmp/proto_log_benchmark.sock', capacity=args.iterations)
+    binary_handler = FlightLogHandler('unix:///tmp/proto_log_benchmark.sock', capacity=args.iterations, binary_protos=True)
+    messages = [
+        ('joystick', control_proto.JoystickRequest()),
+        ('frame', telemetry_proto.Frame(id=1, h_res=1920, v_res=1080, channels=3, data=bytes(64 * 1024)))
+    ]
+    for name, message in messages:
+        for label, handler in [('text', text_handler), ('binary', binary_handler)]:
+            logger = logging.getLogger(f'{name}_{label}')
+            logger.propagate = False
+            logger.addHandler(handler)
+            logger.setLevel(logging.PROTO)
+            if label == 'text':
+                measure(f'{name} eager text', args.iterations, lambda m: eager_proto(logger, m), message)
+            measure(f'{name} lazy {label}', args.iterations, logger.proto, message)
+        PROTO_SAMPLER.set_limit(message.DESCRIPTOR.name, rate=5)
+        measure(f'{name} rate limited', args.iterations, logger.proto, message)
+    text_handler.close()
+    binary_handler.close()
+    # Console output goes to devnull, so only formatting is measured
+    devnull = open(os.devnull, 'w')
+    sync_handler = logging.StreamHandler(devnull)
+    sync_handler.setFormatter(ColorFormatter())
+    console_handlers = [
+        ('console sync', sync_handler),
+        ('console filtered', console_handler(False, devnull)),
+        ('console queued', console_handler(True, devnull))
+    ]
+    PROTO_SAMPLER.set_limits({})
+    for name, message in messages:
+        for label, handler in console_handlers:
+            logger = logging.getLogger(f'{name}_{label}')
+            logger.propagate = False
+            logger.addHandler(handler)
+            logger.setLevel(logging.PROTO)
+            measure(f'{name} {label}', args.iterations, logger.proto, message)
+    for _, handler in console_handlers:
+        handler.close()
+    devnull.close()
@@ -27,7 +27,11 @@ async def wait_for_services(required, command_socket, timeout=5.0):
     start = time.time()
     while len(required) > 0 and time.time() - start < timeout:
         try:
-            identity, ready = await command_socket.recv_multipart(flags=zmq.NOBLOCK)
+            frames = await command_socket.recv_multipart(flags=zmq.NOBLOCK)
+            # Skip heartbeats, which carry an extra frame
+            if len(frames) != 2:
+                continue
+            identity, ready = frames
             service = test_proto.ServiceReady()
             service.ParseFromString(ready)
             if service.readied_service in required:
@@ -11,6 +11,7 @@ from steeleagle_sdk.protocol.descriptors import get_descriptors
 class RPCMethod:
     name: str
     streaming: bool
+    client_streaming: bool = False
 
 def generate_mock_service(service_name, service_filename):
     '''
@@ -37,9 +38,7 @@ def generate_mock_service(service_name, service_filename):
             for method in service.method:
                 if method.client_streaming and method.server_streaming:
                     raise NotImplemented("No mock generation method for method type: bidirectional stream!")
-                elif method.client_streaming:
-                    raise NotImplemented("No mock generation method for method type: client stream!")
-                rpc = RPCMethod(method.name, method.server_streaming)
+                rpc = RPCMethod(method.name, method.server_streaming, method.client_streaming)
                 context['methods'].append(rpc)
 
     # Get the Jinja template
@@ -49,10 +49,14 @@ class MockSwarmController:
         
         complete = False
         logger.info("Receiving...")
-        identity, resp_bytes = await self._socket.recv_multipart()
         response = command_proto.CommandResponse()
-        response.ParseFromString(resp_bytes)
-        logger.info(str(MessageToDict(response)))
+        # Skip over progress responses (OK/IN_PROGRESS) until the
+        # command finishes
+        while response.response.status <= 1:
+            identity, resp_bytes = await self._socket.recv_multipart()
+            response.ParseFromString(resp_bytes)
+            logger.info(str(MessageToDict(response)))
+            assert(response.sequence_number == self._seq_num)
         if response.response.status == req_obj.status:
             logger.info(f"Got correct status: {req_obj.status}!")
             complete = True
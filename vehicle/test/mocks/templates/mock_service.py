@@ -20,7 +20,13 @@ class Mock{{ service_name }}Service({{ service_filename }}_pb2_grpc.{{ service_n
     '''
     def __init__(self, sequencer):
         self._sequencer = sequencer
-    {% for method in methods %}{% if method.streaming %}
+    {% for method in methods %}{% if method.client_streaming %}
+    async def {{ method.name }}(self, request_iterator, context):
+        logger.info('{{ method.name }} called!')
+        async for request in request_iterator:
+            self._sequencer.write(request)
+        return generate_response(2)
+    {% elif method.streaming %}
     async def {{ method.name }}(self, request, context):
         self._sequencer.write(request)
         logger.info('{{ method.name }} called!')
@@ -0,0 +1,79 @@
+import pytest
+import asyncio
+import logging
+import zmq
+import zmq.asyncio
+# Capture import
+from kernel.handlers.capture import CaptureStage
+
+logger = logging.getLogger(__name__)
+
+class Test_Capture:
+    '''
+    Test class focused on capture stages shared between producers.
+    '''
+    @pytest.fixture
+    def sockets(self):
+        ctx = zmq.asyncio.Context()
+        pub = ctx.socket(zmq.PUB)
+        pub.bind('inproc://capture_test')
+        sub = ctx.socket(zmq.SUB)
+        sub.setsockopt(zmq.SUBSCRIBE, b'')
+        sub.connect('inproc://capture_test')
+        yield pub, sub
+        pub.close()
+        sub.close()
+
+    async def publish(self, pub, messages):
+        for topic, data in messages:
+            await pub.send_multipart([topic, data])
+        await asyncio.sleep(0.1)
+
+    @pytest.mark.asyncio
+    async def test_latest(self, sockets):
+        pub, sub = sockets
+        conversions = []
+        def convert(data):
+            conversions.append(data)
+            return data.decode('utf-8')
+        capture = CaptureStage('test', sub, convert, latest=True)
+        fast = capture.consumer()
+        slow = capture.consumer()
+        capture.start()
+        await asyncio.sleep(0.1)
+        # Only the newest message per topic survives, with the topic that
+        # has waited the longest served first
+        await self.publish(pub, [(b'cam0', b'%d' % i) for i in range(5)] + [(b'cam1', b'100')])
+        assert(await fast.get() == '4')
+        assert(await fast.get() == '100')
+        assert(fast.dropped == 4)
+        await self.publish(pub, [(b'cam0', b'5')])
+        assert(await fast.get() == '5')
+        # The slow consumer skips straight to the newest frame, which has
+        # already been converted
+        assert(await slow.get() == '100')
+        assert(await slow.get() == '5')
+        assert(conversions == [b'4', b'100', b'5'])
+        capture.stop()
+
+    @pytest.mark.asyncio
+    async def test_ordered(self, sockets):
+        pub, sub = sockets
+        capture = CaptureStage('test', sub, lambda data: data, history=3)
+        fast = capture.consumer()
+        slow = capture.consumer()
+        capture.start()
+        await asyncio.sleep(0.1)
+        await self.publish(pub, [(b'telemetry', b'%d' % i) for i in range(2)])
+        assert([await fast.get() for _ in range(2)] == [b'0', b'1'])
+        await self.publish(pub, [(b'telemetry', b'%d' % i) for i in range(2, 5)])
+        assert([await fast.get() for _ in range(3)] == [b'2', b'3', b'4'])
+        # The slow consumer lost the messages that aged out of the history
+        assert([await slow.get() for _ in range(3)] == [b'2', b'3', b'4'])
+        assert(slow.dropped == 2)
+        # Skipping coalesces the backlog down to the newest message
+        await self.publish(pub, [(b'telemetry', b'%d' % i) for i in range(5, 8)])
+        fast.skip()
+        assert(await fast.get() == b'7')
+        assert(fast.dropped == 2)
+        capture.stop()
@@ -0,0 +1,142 @@
+import pytest
+import asyncio
+import zmq
+import zmq.asyncio
+import logging
+# Protocol import
+from steeleagle_sdk.protocol.messages.telemetry_pb2 import DriverTelemetry
+
+logger = logging.getLogger(__name__)
+
+TOPIC = 'driver_telemetry'
+
+def battery(percentage):
+    tel = DriverTelemetry()
+    tel.vehicle_info.battery_info.percentage = percentage
+    return [TOPIC.encode(), tel.SerializeToString()]
+
+def percentage(tel):
+    return tel.vehicle_info.battery_info.percentage
+
+class Telemetry:
+    '''
+    A MissionStore subscribed to telemetry published by the test.
+    '''
+    def __init__(self, tmp_path):
+        from steeleagle_sdk.api.mission_store import MissionStore
+        self.context = zmq.asyncio.Context()
+        self.publisher = self.context.socket(zmq.PUB)
+        self.publisher.bind(f'ipc://{tmp_path}/telemetry.sock')
+        self.store = MissionStore(f'ipc://{tmp_path}/telemetry.sock', f'ipc://{tmp_path}/results.sock')
+
+    async def __aenter__(self):
+        await self.store.start()
+        await asyncio.sleep(0.2)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.store.stop()
+        self.store.ctx.destroy(linger=0)
+        self.context.destroy(linger=0)
+
+    async def publish(self, value):
+        version = self.store.get_version('telemetry', TOPIC)
+        await self.publisher.send_multipart(battery(value))
+        await self.store.wait_for_update('telemetry', TOPIC, version, timeout=2)
+        # Let the watchers run before the next sample
+        await asyncio.sleep(0.05)
+
+class Test_Conditions:
+    '''
+    Test class focused on waking DSL events on new samples.
+    '''
+    @pytest.mark.asyncio
+    async def test_wait_for_update(self, tmp_path):
+        async with Telemetry(tmp_path) as telemetry:
+            store = telemetry.store
+            assert(store.get_version('telemetry', TOPIC) == 0)
+            assert(await store.get_latest('telemetry', TOPIC) is None)
+            waiter = asyncio.create_task(store.wait_for_update('telemetry', TOPIC))
+            await asyncio.sleep(0.1)
+            assert(not waiter.done())
+            await telemetry.publisher.send_multipart(battery(50))
+            version, tel = await asyncio.wait_for(waiter, 2)
+            assert(version == 1 and percentage(tel) == 50)
+            # Returns at once if a newer sample is already stored
+            version, tel = await store.wait_for_update('telemetry', TOPIC, 0, timeout=0.1)
+            assert(version == 1)
+            with pytest.raises(TimeoutError):
+                await store.wait_for_update('telemetry', TOPIC, 1, timeout=0.1)
+            await telemetry.publish(40)
+            assert(store.get_version('telemetry', TOPIC) == 2)
+            assert(percentage(await store.get_latest('telemetry', TOPIC)) == 40)
+
+    @pytest.mark.asyncio
+    async def test_wait_for(self, tmp_path):
+        from steeleagle_sdk.dsl.runtime.conditions import Conditions
+        from steeleagle_sdk.dsl.runtime.predicates import CompiledPredicate, at_most
+        async with Telemetry(tmp_path) as telemetry:
+            conditions = Conditions(telemetry.store)
+            await telemetry.publish(10)
+            # A condition that already holds returns without a new sample
+            tel = await asyncio.wait_for(conditions.wait_for('telemetry', TOPIC, CompiledPredicate([at_most(
+                'vehicle_info.battery_info.percentage', 20)])), 1)
+            assert(percentage(tel) == 10)
+            # Otherwise compiled and plain predicates wake on the first sample that holds
+            waiters = [
+                asyncio.create_task(conditions.wait_for('telemetry', TOPIC, CompiledPredicate([at_most(
+                    'vehicle_info.battery_info.percentage', 5)]))),
+                asyncio.create_task(conditions.wait_for('telemetry', TOPIC, lambda tel: percentage(tel) <= 5))
+            ]
+            await asyncio.sleep(0.05)
+            await telemetry.publish(8)
+            assert(not any(waiter.done() for waiter in waiters))
+            await telemetry.publish(4)
+            assert([percentage(waiter.result()) for waiter in waiters] == [4, 4])
+            # The watcher stops on the next sample, with nobody waiting
+            await telemetry.publish(3)
+            assert(not conditions._watchers)
+            await conditions.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled(self, tmp_path):
+        from steeleagle_sdk.dsl.runtime.conditions import Conditions
+        from steeleagle_sdk.dsl.runtime.predicates import CompiledPredicate, at_most
+        def below(value):
+            return CompiledPredicate([at_most('vehicle_info.battery_info.percentage', value)])
+        async with Telemetry(tmp_path) as telemetry:
+            conditions = Conditions(telemetry.store)
+            key = ('telemetry', TOPIC)
+            await telemetry.publish(90)
+            # Events race, and the losers are cancelled, as in a transition
+            racers = [
+                asyncio.create_task(conditions.wait_for(*key, below(50))),
+                asyncio.create_task(conditions.wait_for(*key, below(5))),
+                asyncio.create_task(conditions.wait_for(*key, lambda tel: percentage(tel) <= 5))
+            ]
+            await asyncio.sleep(0.05)
+            await telemetry.publish(30)
+            done, pending = await asyncio.wait(racers, timeout=1, return_when=asyncio.FIRST_COMPLETED)
+            assert(done == {racers[0]} and len(pending) == 2)
+            for racer in pending:
+                racer.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            assert(len(conditions._tables[key]) == 0 and not conditions._waiting[key])
+            # Slots removed while the watcher runs are not woken
+            low = asyncio.create_task(conditions.wait_for(*key, below(5)))
+            high = asyncio.create_task(conditions.wait_for(*key, below(20)))
+            await asyncio.sleep(0.05)
+            watcher = conditions._watchers[key]
+            low.cancel()
+            await asyncio.gather(low, return_exceptions=True)
+            await telemetry.publish(10)
+            assert(percentage(high.result()) == 10)
+            assert(len(conditions._tables[key]) == 0)
+            await telemetry.publish(3)
+            assert(watcher.done())
+            # Closing cancels whatever is still waiting
+            waiter = asyncio.create_task(conditions.wait_for(*key, below(1)))
+            await asyncio.sleep(0.05)
+            await conditions.close()
+            await asyncio.gather(waiter, return_exceptions=True)
+            assert(waiter.cancelled() and not conditions._watchers)
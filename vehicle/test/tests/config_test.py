@@ -0,0 +1,55 @@
+import pytest
+import shutil
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Test_Config:
+    '''
+    Test class focused on config validation and reloading.
+    '''
+    @pytest.fixture
+    def config(self, tmp_path, monkeypatch):
+        import util.config as config
+        # Reload copies of the config files, restoring the loaded config after
+        config_path = tmp_path / 'config.toml'
+        internal_path = tmp_path / 'internal.toml'
+        shutil.copy(config.CONFIG_PATH, config_path)
+        shutil.copy(config.INTERNAL_PATH, internal_path)
+        monkeypatch.setattr(config, 'CONFIG_PATH', str(config_path))
+        monkeypatch.setattr(config, 'INTERNAL_PATH', str(internal_path))
+        monkeypatch.setattr(config, '_SUBSCRIBERS', {})
+        state = config._STATE
+        yield config, config_path
+        config._STATE = state
+        config.CONFIG, config.INTERNAL = state[0], state[1]
+
+    def test_access(self, config):
+        config, _ = config
+        assert(config.query_config('logging.log_level') == config.CONFIG.logging.log_level)
+        assert(config.query_config('internal.services.kernel') == config.INTERNAL.services.kernel)
+        with pytest.raises(ValueError):
+            config.query_config('logging.missing')
+        with pytest.raises(ValueError):
+            config.validate_config({'vehicle': {'name': 1}}, {})
+
+    def test_reload(self, config):
+        config, config_path = config
+        levels = []
+        config.subscribe_config('logging.log_level', levels.append)
+        text = config_path.read_text()
+        level = config.query_config('logging.log_level')
+        name = config.query_config('vehicle.name')
+        text = text.replace(f"log_level = '{level}'", "log_level = 'ERROR'")
+        config_path.write_text(text.replace(f"name = '{name}'", "name = 'renamed'"))
+        assert(config.reload_config() == ['logging.log_level'])
+        assert(levels == ['ERROR'])
+        assert(config.query_config('logging.log_level') == 'ERROR')
+        # Structural keys need a restart
+        assert(config.query_config('vehicle.name') == name)
+        # Invalid files are ignored
+        config_path.write_text(text.replace("log_level = 'ERROR'", 'log_level = 5'))
+        assert(config.reload_config() == [])
+        assert(config.query_config('logging.log_level') == 'ERROR')
+        with pytest.raises(ValueError):
+            config.subscribe_config('vehicle.name', print)
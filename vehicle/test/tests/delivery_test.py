@@ -0,0 +1,69 @@
+import logging
+from gabriel_protocol import gabriel_pb2
+# Delivery import
+from kernel.handlers.delivery import DeliveryPolicy, DeliveryScheduler, changed, flatten
+# Protocol import
+import steeleagle_sdk.protocol.common_pb2 as common_proto
+import steeleagle_sdk.protocol.messages.telemetry_pb2 as telemetry_proto
+import steeleagle_sdk.protocol.services.compute_service_pb2 as compute_proto
+
+logger = logging.getLogger(__name__)
+
+def sample(latitude, seconds=0):
+    telemetry = telemetry_proto.DriverTelemetry(
+        position_info=telemetry_proto.PositionInfo(
+            global_position=common_proto.Location(latitude=latitude)
+            )
+        )
+    telemetry.timestamp.seconds = seconds
+    input_frame = gabriel_pb2.InputFrame()
+    input_frame.any_payload.Pack(telemetry)
+    return input_frame
+
+class Test_Delivery:
+    '''
+    Test class focused on per-datasink telemetry delivery.
+    '''
+    def test_policy_from_proto(self):
+        info = compute_proto.DatasinkInfo(id='engine')
+        assert(DeliveryPolicy.from_proto(info) is None)
+        info.policy.max_rate = 2.0
+        assert(DeliveryPolicy.from_proto(info) == DeliveryPolicy(2.0))
+        info.policy.change_threshold = 0.0
+        assert(DeliveryPolicy.from_proto(info) == DeliveryPolicy(2.0, 0.0))
+
+    def test_changed(self):
+        telemetry = telemetry_proto.DriverTelemetry()
+        telemetry.ParseFromString(sample(1.0, seconds=5).any_payload.value)
+        flat = flatten(telemetry)
+        # Timestamps are ignored
+        assert(flat == {'position_info.global_position.latitude': 1.0})
+        assert(not changed(flat, {'position_info.global_position.latitude': 1.05}, 0.1))
+        assert(changed(flat, {'position_info.global_position.latitude': 1.2}, 0.1))
+        assert(changed(flat, {}, 0.1))
+        assert(changed(None, flat, 0.1))
+
+    def test_rate_limit(self):
+        scheduler = DeliveryScheduler(telemetry_proto.DriverTelemetry)
+        assert(scheduler.next_due(0) is None)
+        scheduler.set_engines({'all': None, 'slow': DeliveryPolicy(max_rate=2.0)})
+        assert(scheduler.select(sample(1.0), 10.0) == ['all', 'slow'])
+        # The rate limited datasink waits out its window, while the other
+        # gets every sample in order
+        assert(scheduler.next_due(10.1) == 0)
+        assert(not scheduler.coalesce(10.1))
+        assert(scheduler.select(sample(1.0), 10.1) == ['all'])
+        # With only rate limited datasinks left, samples are coalesced
+        scheduler.set_engines({'slow': DeliveryPolicy(max_rate=2.0)})
+        assert(abs(scheduler.next_due(10.1) - 0.4) < 1e-9)
+        assert(scheduler.coalesce(10.5))
+        assert(scheduler.select(sample(1.0), 10.5) == ['slow'])
+
+    def test_change_only(self):
+        scheduler = DeliveryScheduler(telemetry_proto.DriverTelemetry)
+        scheduler.set_engines({'all': None, 'changes': DeliveryPolicy(change_threshold=0.5)})
+        assert(scheduler.select(sample(1.0, seconds=1), 0) == ['all', 'changes'])
+        assert(scheduler.select(sample(1.2, seconds=2), 1) == ['all'])
+        assert(scheduler.select(sample(1.4, seconds=3), 2) == ['all'])
+        # Changes are measured against the last sample sent
+        assert(scheduler.select(sample(1.6, seconds=4), 3) == ['all', 'changes'])
@@ -0,0 +1,225 @@
+import os
+import sys
+import grpc
+import logging
+import threading
+from concurrent import futures
+from mcap.reader import make_reader
+# Protocol import
+from steeleagle_sdk.protocol.rpc_helpers import generate_response
+from steeleagle_sdk.protocol.services import flight_log_service_pb2 as log_proto
+from steeleagle_sdk.protocol.services import flight_log_service_pb2_grpc as log_grpc
+
+logger = logging.getLogger(__name__)
+
+class CollectingFlightLog(log_grpc.FlightLogServicer):
+    '''
+    Stand-in log service that keeps every batch it receives.
+    '''
+    def __init__(self):
+        self.batches = []
+        self.received = threading.Event()
+
+    def LogBatch(self, request_iterator, context):
+        for batch in request_iterator:
+            self.batches.append(batch)
+        self.received.set()
+        return generate_response(2)
+
+    @property
+    def messages(self):
+        return [log.log.msg for batch in self.batches for log in batch.logs]
+
+def serve(addr):
+    service = CollectingFlightLog()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    log_grpc.add_FlightLogServicer_to_server(service, server)
+    server.add_insecure_port(addr)
+    server.start()
+    return service, server
+
+def record(name, msg):
+    return logging.LogRecord(name, logging.INFO, __file__, 0, msg, None, None)
+
+class Test_FlightLog:
+    '''
+    Test class focused on the batched flight log handler.
+    '''
+    def test_batches(self, tmp_path):
+        from util.log import FlightLogHandler
+        addr = f'unix://{tmp_path}/log.sock'
+        service, server = serve(addr)
+        handler = FlightLogHandler(addr, batch_size=4)
+        for i in range(10):
+            handler.handle(record('test', f'{i}'))
+        handler.close()
+        assert(service.messages == [f'{i}' for i in range(10)])
+        assert(max(len(batch.logs) for batch in service.batches) == 4)
+        server.stop(0)
+
+    def test_drops(self, tmp_path):
+        from util.log import FlightLogHandler
+        addr = f'unix://{tmp_path}/log.sock'
+        service, server = serve(addr)
+        # Keep the flush thread asleep so the ring buffer overflows
+        handler = FlightLogHandler(addr, capacity=5, batch_size=100, flush_interval=60)
+        for i in range(8):
+            handler.handle(record('test', f'{i}'))
+        handler.close()
+        assert(handler.dropped == 3)
+        assert(service.messages == [f'{i}' for i in range(3, 8)])
+        assert(service.batches[0].dropped == 3)
+        server.stop(0)
+
+    def test_spill(self, tmp_path):
+        from util.log import FlightLogHandler
+        addr = f'unix://{tmp_path}/log.sock'
+        spill_path = tmp_path / 'log.spill'
+        handler = FlightLogHandler(addr, flush_interval=0.05, spill_path=str(spill_path), retry_interval=0.1)
+        handler.handle(record('test', 'offline'))
+        handler.flush()
+        for _ in range(50):
+            if handler.spilled:
+                break
+            threading.Event().wait(0.05)
+        assert(handler.spilled == 1 and spill_path.exists())
+        # Once the service is up, spilled records are replayed first
+        service, server = serve(addr)
+        threading.Event().wait(0.5)
+        handler.handle(record('test', 'online'))
+        handler.close()
+        assert(service.messages == ['offline', 'online'])
+        assert(not spill_path.exists())
+        assert(handler.failed == 0)
+        server.stop(0)
+
+    def test_writer_rolls(self, tmp_path):
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'logger'))
+        from flight_log_writer import FlightLogWriter
+        writer = FlightLogWriter(tmp_path / 'flight.mcap', chunk_size=1024, max_file_size=4096, batch_size=50)
+        message = log_proto.LogMessage(type=log_proto.LogType.INFO, msg='x' * 100)
+        for _ in range(500):
+            writer.write('test', message, publish_time=1)
+        writer.close()
+        assert(writer.written == 500 and len(writer.files) > 1)
+        assert(writer.files[1].endswith('flight_1.mcap'))
+        # Every file is finished with its own summary
+        total = 0
+        for name in writer.files:
+            with open(name, 'rb') as f:
+                total += make_reader(f).get_summary().statistics.message_count
+        assert(total == 500)
+
+    def test_writer_checkpoint(self, tmp_path):
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'logger'))
+        from flight_log_writer import FlightLogWriter
+        from mcap.stream_reader import StreamReader
+        from mcap.records import Message
+        from mcap.exceptions import EndOfFile
+        writer = FlightLogWriter(tmp_path / 'flight.mcap', batch_size=1, checkpoint_interval=0.1)
+        message = log_proto.LogMessage(type=log_proto.LogType.INFO, msg='checkpoint')
+        # Far less than a chunk, so nothing is written out until a checkpoint
+        for _ in range(5):
+            writer.write('test', message)
+        for _ in range(50):
+            if writer.written == 5:
+                break
+            threading.Event().wait(0.05)
+        # Let a checkpoint pass, then read the file as a crash would leave
+        # it: unfinished, with no summary
+        threading.Event().wait(0.5)
+        records = []
+        with open(writer.files[0], 'rb') as f:
+            try:
+                for record in StreamReader(f).records:
+                    records.append(record)
+            except EndOfFile:
+                pass
+        messages = [r for r in records if isinstance(r, Message)]
+        assert(len(messages) == 5)
+        assert(all(log_proto.LogMessage.FromString(m.data) == message for m in messages))
+        writer.close()
+
+    def test_proto_sampling(self):
+        from util.log import ProtoSampler
+        sampler = ProtoSampler({'JoystickRequest': {'rate': 2}, 'Frame': {'sample': 3}})
+        assert([sampler.allow('JoystickRequest') for _ in range(4)] == [True, True, False, False])
+        assert([sampler.allow('Frame') for _ in range(6)] == [True, False, False, True, False, False])
+        assert(all(sampler.allow('HoldRequest') for _ in range(10)))
+
+    def test_console_protos(self):
+        import io
+        from util.log import console_handler
+        from steeleagle_sdk.protocol.services.control_service_pb2 import JoystickRequest
+        logger = logging.getLogger('console_protos')
+        logger.propagate = False
+        logger.setLevel(logging.PROTO)
+        output = {}
+        for console_protos in [False, True]:
+            stream = io.StringIO()
+            handler = console_handler(console_protos, stream)
+            logger.addHandler(handler)
+            logger.warning('warning')
+            logger.proto(JoystickRequest())
+            logger.removeHandler(handler)
+            # Closing the queued handler prints what is still queued
+            handler.close()
+            output[console_protos] = stream.getvalue()
+        assert('warning' in output[False] and 'JoystickRequest' not in output[False])
+        assert('warning' in output[True] and 'JoystickRequest' in output[True])
+
+    def test_binary_protos(self, tmp_path):
+        import steeleagle_sdk.protocol.services.control_service_pb2 as control_proto
+        from util.log import FlightLogHandler, ProtoMessage
+        addr = f'unix://{tmp_path}/log.sock'
+        service, server = serve(addr)
+        handler = FlightLogHandler(addr, binary_protos=True)
+        proto_logger = logging.getLogger('binary_protos')
+        proto_logger.addHandler(handler)
+        proto_logger.setLevel(logging.PROTO)
+        request = control_proto.TakeOffRequest(take_off_altitude=10.0)
+        proto_logger.proto(request)
+        proto_logger.removeHandler(handler)
+        handler.close()
+        logged = service.batches[0].proto_logs[0]
+        assert(logged.topic == 'binary_protos')
+        assert(logged.message.Is(control_proto.TakeOffRequest.DESCRIPTOR))
+        server.stop(0)
+        # The service writes the message with its own schema
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'logger'))
+        from flight_log_service import FlightLogService
+        log_service = FlightLogService(str(tmp_path / 'flight.mcap'))
+        log_service.LogBatch(iter(service.batches), None)
+        log_service.cleanup()
+        with open(tmp_path / 'flight.mcap', 'rb') as f:
+            (schema, channel, message), = make_reader(f).iter_messages()
+        assert(channel.topic == 'binary_protos/TakeOffRequest')
+        assert(control_proto.TakeOffRequest.FromString(message.data) == request)
+        # Text is only made when a handler formats the record
+        assert(str(ProtoMessage(request)) == "TakeOffRequest | {'takeOffAltitude': 10.0}")
+
+    def test_index_query(self, tmp_path):
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'logger'))
+        from flight_log_writer import FlightLogWriter
+        from flight_log_index import FlightLogIndex, Query, index_path
+        writer = FlightLogWriter(tmp_path / 'flight.mcap', chunk_size=1024, batch_size=50)
+        for i in range(300):
+            level = log_proto.LogType.ERROR if i in (10, 250) else log_proto.LogType.INFO
+            msg = 'Transitioned to law: __BASE__' if i == 150 else f'{i:03} ' + 'x' * 50
+            writer.write('kernel/laws/authority', log_proto.LogMessage(type=level, msg=msg))
+            writer.write('kernel/handlers/command', log_proto.LogMessage(type=log_proto.LogType.INFO, msg='y' * 50))
+        writer.close()
+        log_index = FlightLogIndex([tmp_path])
+        assert(index_path(tmp_path / 'flight.mcap').exists())
+        matches = list(log_index.query(Query(['kernel/laws/*'], level='ERROR')))
+        assert([message.msg[:3] for _, topic, _, message in matches] == ['010', '250'])
+        # Only chunks holding errors are read
+        assert(log_index.chunks_read == 2)
+        until = matches[1][2]
+        matches = list(log_index.query(Query(['kernel/laws/authority'], level='WARNING', until=until)))
+        assert(len(matches) == 1)
+        matches = list(log_index.query(Query(['kernel/laws/authority'], pattern='^29[0-9] ')))
+        assert(len(matches) == 10)
+        log_index.chunks_read = 0
+        matches = list(log_index.query(Query(event='law_transition')))
+        assert(len(matches) == 1 and log_index.chunks_read == 1)
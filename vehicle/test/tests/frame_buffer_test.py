@@ -0,0 +1,92 @@
+import logging
+import numpy as np
+import cv2
+import pytest
+# Frame buffer import
+from util.frame_buffer import FrameBufferWriter, FrameBufferReader, FrameBufferSource
+from kernel.handlers.imagery import encode_frame
+# Protocol import
+import steeleagle_sdk.protocol.messages.telemetry_pb2 as telemetry_proto
+
+logger = logging.getLogger(__name__)
+
+SHAPE = (4, 8, 3)
+
+def image(value):
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+class Test_FrameBuffer:
+    '''
+    Test class focused on the shared memory imagery transport.
+    '''
+    def test_view(self, tmp_path):
+        path = str(tmp_path / 'imagery')
+        writer = FrameBufferWriter(path, slot_count=2, slot_size=image(0).nbytes)
+        reader = FrameBufferReader(path)
+        index, sequence = writer.write(image(7))
+        view = reader.view(index, sequence, SHAPE)
+        assert((view == 7).all())
+        # Views read the mapping in place and cannot be written to
+        assert(np.shares_memory(view, reader._buffer))
+        assert(not view.flags.writeable)
+        del view
+        reader.close()
+        writer.close()
+
+    def test_overwrite(self, tmp_path):
+        path = str(tmp_path / 'imagery')
+        writer = FrameBufferWriter(path, slot_count=2, slot_size=image(0).nbytes)
+        reader = FrameBufferReader(path)
+        index, sequence = writer.write(image(1))
+        view = reader.view(index, sequence, SHAPE)
+        # Wrap around to the first slot
+        writer.write(image(2))
+        writer.write(image(3))
+        assert(not reader.valid(index, sequence))
+        assert((view == 3).all())
+        with pytest.raises(LookupError):
+            reader.view(index, sequence)
+        with pytest.raises(ValueError):
+            writer.write(np.zeros(image(0).nbytes + 1, dtype=np.uint8))
+        del view
+        reader.close()
+        writer.close()
+
+    def test_reopen(self, tmp_path):
+        path = str(tmp_path / 'imagery')
+        source = FrameBufferSource(path)
+        writer = FrameBufferWriter(path, slot_count=2, slot_size=image(0).nbytes)
+        reader = source.get()
+        assert(source.get() is reader)
+        # A restarted driver recreates the buffer
+        writer.close()
+        writer = FrameBufferWriter(path, slot_count=4, slot_size=image(0).nbytes)
+        assert(reader.stale())
+        assert(source.get().slot_count == 4)
+        writer.close()
+
+    def test_encode_slot(self, tmp_path):
+        path = str(tmp_path / 'imagery')
+        writer = FrameBufferWriter(path, slot_count=2, slot_size=image(0).nbytes)
+        source = FrameBufferSource(path)
+        index, sequence = writer.write(image(7))
+        data = telemetry_proto.Frame(
+            id=1,
+            h_res=SHAPE[1],
+            v_res=SHAPE[0],
+            channels=SHAPE[2],
+            slot=telemetry_proto.FrameSlot(index=index, sequence=sequence)
+            ).SerializeToString()
+        frame = telemetry_proto.Frame()
+        encode_frame(data, frame_buffer=source).any_payload.Unpack(frame)
+        assert(not frame.HasField('slot'))
+        decoded = cv2.imdecode(np.frombuffer(frame.data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        assert(decoded.shape == SHAPE)
+        # Frames in shared memory need a frame buffer, and must still be there
+        with pytest.raises(ValueError):
+            encode_frame(data)
+        writer.write(image(8))
+        writer.write(image(9))
+        with pytest.raises(LookupError):
+            encode_frame(data, frame_buffer=source)
+        writer.close()
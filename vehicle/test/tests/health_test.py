@@ -0,0 +1,51 @@
+import pytest
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Test_Health:
+    '''
+    Test class focused on tracking datasink health.
+    '''
+    def test_quiet_datasink(self):
+        from kernel.handlers.health import ComputeHealth
+        health = ComputeHealth({'remote': 3.0, 'local': None})
+        health.set_datasinks(['remote:detector', 'local:tracker'])
+        # Results returned promptly
+        for frame_id in range(1, 11):
+            now = frame_id * 0.1
+            health.record_send('remote', 'images', frame_id, ['detector'], 1, now)
+            health.record_result('remote', 'images', frame_id, 'detector', now + 0.05)
+        detector, tracker = list(health)
+        assert(detector.results == 10)
+        assert(detector.percentile(50) == pytest.approx(0.05))
+        assert(health.check(2.0) == [])
+        # The engine dies with a frame outstanding, holding the only token
+        health.record_send('remote', 'images', 11, ['detector'], 0, 2.0)
+        assert(health.check(4.0) == [])
+        assert(health.starved_for(detector, 4.0) == pytest.approx(2.0))
+        assert(health.check(5.0) == [detector])
+        # Reported once per outage
+        assert(health.check(6.0) == [])
+        health.record_result('remote', 'images', 11, 'detector', 6.5)
+        assert(not detector.quiet)
+        assert(health.starved_for(detector, 6.5) == 0.0)
+        # Local datasinks without a timeout never go quiet
+        health.record_send('local', 'images', 1, ['tracker'], 1, 0.0)
+        assert(health.check(100.0) == [])
+        assert(tracker.stalled_for(100.0) == 100.0)
+
+    def test_skipped_frames(self):
+        from kernel.handlers.health import ComputeHealth
+        health = ComputeHealth({'remote': 1.0})
+        health.set_datasinks(['remote:detector'])
+        # A frame the engine dropped does not make it look stalled once
+        # later frames have results
+        health.record_send('remote', 'images', 1, ['detector'], 1, 0.0)
+        for frame_id in range(2, 40):
+            now = frame_id * 0.1
+            health.record_send('remote', 'images', frame_id, ['detector'], 1, now)
+            health.record_result('remote', 'images', frame_id, 'detector', now + 0.02)
+            assert(health.check(now + 0.02) == [])
+        detector, = list(health)
+        assert(len(detector.pending) == 0)
@@ -0,0 +1,40 @@
+import pytest
+import asyncio
+import logging
+# Protocol import
+from steeleagle_sdk.protocol.services.remote_service_pb2 import Heartbeat
+
+logger = logging.getLogger(__name__)
+
+# Leading frame of a heartbeat on the command socket
+HEARTBEAT_FRAME = b'heartbeat'
+
+async def recv_heartbeat(command_socket):
+    '''
+    Receives the next heartbeat sent by the kernel, skipping any other
+    messages.
+    '''
+    while True:
+        frames = await asyncio.wait_for(command_socket.recv_multipart(), 5.0)
+        if len(frames) == 3 and frames[1] == HEARTBEAT_FRAME:
+            heartbeat = Heartbeat()
+            heartbeat.ParseFromString(frames[2])
+            return frames, heartbeat
+
+class Test_Heartbeat:
+    '''
+    Test class focused on heartbeats sent to the swarm controller.
+    '''
+    @pytest.mark.asyncio
+    async def test_heartbeat_rtt(self, command_socket, kernel):
+        frames, first = await recv_heartbeat(command_socket)
+        assert(first.rtt == 0.0)
+        # Echo the heartbeat back like the swarm controller does
+        await command_socket.send_multipart(frames)
+        # Heartbeats sent before the echo arrived still report no RTT
+        for _ in range(10):
+            _, second = await recv_heartbeat(command_socket)
+            assert(second.sequence_number > first.sequence_number)
+            if second.rtt > 0.0:
+                break
+        assert(second.rtt > 0.0)
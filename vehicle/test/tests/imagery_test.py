@@ -0,0 +1,70 @@
+import time
+import logging
+import numpy as np
+import cv2
+# Imagery import
+from kernel.handlers.imagery import EncoderPolicy, encode_frame
+# Protocol import
+import steeleagle_sdk.protocol.messages.telemetry_pb2 as telemetry_proto
+
+logger = logging.getLogger(__name__)
+
+def raw_frame(frame_id, h_res=8, v_res=4):
+    image = np.full((v_res, h_res, 3), frame_id % 256, dtype=np.uint8)
+    return telemetry_proto.Frame(
+        id=frame_id,
+        data=image.tobytes(),
+        h_res=h_res,
+        v_res=v_res,
+        channels=3
+        ).SerializeToString()
+
+class Test_Imagery:
+    '''
+    Test class focused on imagery encoding.
+    '''
+    def test_encode_frame(self):
+        input_frame = encode_frame(raw_frame(7))
+        frame = telemetry_proto.Frame()
+        assert(input_frame.any_payload.Unpack(frame))
+        assert(frame.id == 7)
+        image = cv2.imdecode(np.frombuffer(frame.data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        assert(image.shape == (4, 8, 3))
+
+    def test_encode_scaled_frame(self):
+        input_frame = encode_frame(raw_frame(7), quality=50, scale=0.5)
+        frame = telemetry_proto.Frame()
+        input_frame.any_payload.Unpack(frame)
+        assert((frame.encoding.jpeg_quality, frame.encoding.scale) == (50, 0.5))
+        # The frame keeps its native resolution so detections can be rescaled
+        assert((frame.h_res, frame.v_res) == (8, 4))
+        image = cv2.imdecode(np.frombuffer(frame.data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        assert(image.shape == (2, 4, 3))
+
+    def test_encoder_policy(self):
+        policy = EncoderPolicy('test', min_quality=70, max_quality=90, min_scale=0.5,
+            min_frame_rate=5.0, max_frame_rate=20.0, target_token_wait=0.1, target_rtt=0.5)
+        now = time.monotonic()
+        def step(wait, rtt=0.0):
+            nonlocal now
+            now += 1.0
+            policy.record_token_wait(wait)
+            policy.record_rtt(rtt)
+            return policy.update(now)
+        # Back off quality, then resolution, then frame rate
+        history = []
+        while step(0.5):
+            history.append((policy.quality, policy.scale, policy.frame_rate))
+        assert(history == [
+            (80, 1.0, 20.0), (70, 1.0, 20.0),
+            (70, 0.75, 20.0), (70, 0.5, 20.0),
+            (70, 0.5, 10.0), (70, 0.5, 5.0)
+            ])
+        # High round trip times also count as congestion
+        assert(not step(0.0, rtt=1.0))
+        # Stay put between half and full target, then recover in reverse
+        assert(not step(0.07))
+        assert(step(0.01) and policy.frame_rate == 10.0)
+        while step(0.01):
+            pass
+        assert(policy.params == (90, 1.0) and policy.frame_rate == 20.0)
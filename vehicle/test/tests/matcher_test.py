@@ -0,0 +1,57 @@
+import pytest
+import logging
+from google.protobuf.json_format import MessageToDict
+# Law import
+from kernel.laws.matcher import CompiledLaw, Rule, message_matches
+# Protocol import
+import steeleagle_sdk.protocol.common_pb2 as common_proto
+import steeleagle_sdk.protocol.services.control_service_pb2 as control_proto
+
+logger = logging.getLogger(__name__)
+
+class Test_Matcher:
+    '''
+    Test class focused on the precompiled law matcher.
+    '''
+    @pytest.mark.parametrize('request_obj, payload', [
+        (control_proto.TakeOffRequest(take_off_altitude=10.0), {'take_off_altitude': 10.0}),
+        (control_proto.TakeOffRequest(take_off_altitude=10.1), {'take_off_altitude': 10.1}),
+        (control_proto.TakeOffRequest(take_off_altitude=5.0), {'take_off_altitude': 10.0}),
+        (control_proto.TakeOffRequest(), {'take_off_altitude': 0.0}),
+        (control_proto.SetGlobalPositionRequest(location=common_proto.Location(latitude=10.0)),
+            {'location': {'latitude': 10.0}}),
+        (control_proto.SetGlobalPositionRequest(location=common_proto.Location(latitude=10.0, longitude=1.0)),
+            {'location': {'latitude': 10.0}}),
+        (control_proto.SetGlobalPositionRequest(location=common_proto.Location(latitude=0.0)),
+            {'location': {'latitude': 0.0}}),
+        (control_proto.SetGlobalPositionRequest(), {'location': {}}),
+        (control_proto.SetGlobalPositionRequest(location=common_proto.Location()), {'location': {}}),
+    ])
+    def test_payload_equivalence(self, request_obj, payload):
+        # The compiled matcher must agree with the MessageToDict comparison
+        obj = MessageToDict(request_obj, preserving_proto_field_name=True)
+        expected = all(k in obj and obj[k] == v for k, v in payload.items())
+        assert(message_matches(request_obj, payload) == expected)
+
+    def test_rule_globs(self):
+        rule = Rule('internal.Control.*')
+        assert(rule.matches_command('internal.Control.Arm'))
+        assert(not rule.matches_command('server.Control.Arm'))
+        # Malformed payloads never match
+        rule = Rule('internal.Control.*|{"take_off_altitude": ')
+        assert(not rule.matches_command('internal.Control.TakeOff'))
+
+    def test_match_precedence(self):
+        base = {'rules': {'allowed': ['server.*'], 'match': [['server.Control.*', 'REMOTE']]}}
+        law = {'rules': {'allowed': ['internal.Control.*'], 'match': [
+            ['server.Control.ReturnToHome', 'LOCAL'],
+            ['internal.Control.TakeOff|{"take_off_altitude": 10.0}', 'REMOTE']
+            ]}}
+        compiled = CompiledLaw(law, base)
+        takeoff = control_proto.TakeOffRequest(take_off_altitude=10.0)
+        assert(compiled.allows('internal.Control.TakeOff', takeoff))
+        assert(not compiled.allows('internal.Mission.Start', takeoff))
+        assert(compiled.match('internal.Control.TakeOff', takeoff).target == 'REMOTE')
+        assert(compiled.match('internal.Control.TakeOff', control_proto.TakeOffRequest()) is None)
+        # Base cases take precedence over user matches
+        assert(compiled.match('server.Control.ReturnToHome', control_proto.ReturnToHomeRequest()).target == 'REMOTE')
@@ -0,0 +1,56 @@
+import pytest
+import asyncio
+import zmq
+import zmq.asyncio
+import logging
+# Protocol import
+from steeleagle_sdk.protocol.messages.telemetry_pb2 import DriverTelemetry
+from steeleagle_sdk.protocol.messages.result_pb2 import FrameResult, ResultEnvelope
+from steeleagle_sdk.protocol.rpc_helpers import result_topic
+
+logger = logging.getLogger(__name__)
+
+def envelope(engine_id, frame_id, seconds):
+    result = ResultEnvelope(engine_id=engine_id, frame_id=frame_id,
+                            type=FrameResult.DESCRIPTOR.full_name,
+                            payload=FrameResult(frame_id=frame_id).SerializeToString())
+    result.timestamp.FromSeconds(seconds)
+    return result.SerializeToString()
+
+class Test_MissionStore:
+    '''
+    Test class focused on keeping the latest telemetry and results.
+    '''
+    @pytest.mark.asyncio
+    async def test_clock_steps_back(self, tmp_path, monkeypatch):
+        from steeleagle_sdk.api import mission_store
+        context = zmq.asyncio.Context()
+        telemetry = context.socket(zmq.PUB)
+        telemetry.bind(f'ipc://{tmp_path}/telemetry.sock')
+        results = context.socket(zmq.PUB)
+        results.bind(f'ipc://{tmp_path}/results.sock')
+        store = mission_store.MissionStore(f'ipc://{tmp_path}/telemetry.sock', f'ipc://{tmp_path}/results.sock')
+        try:
+            await store.start()
+            await asyncio.sleep(0.2)
+            # Telemetry is stored even if the wall clock steps backwards
+            sample = DriverTelemetry().SerializeToString()
+            for version, now in [(1, 1000.0), (2, 900.0)]:
+                monkeypatch.setattr(mission_store.time, 'time', lambda: now)
+                await telemetry.send_multipart([b'driver', sample])
+                latest, _ = await store.wait_for_update('telemetry', 'driver', version - 1, timeout=2)
+                assert(latest == version)
+            # So are results from the subscription, whatever their timestamp
+            for version, seconds in [(1, 200), (2, 100)]:
+                await results.send_multipart([result_topic('detector'), envelope('detector', version, seconds)])
+                latest, _ = await store.wait_for_update('results', 'detector', version - 1, timeout=2)
+                assert(latest == version)
+            # Cache replies only replace results with an earlier timestamp
+            store._store_result(envelope('detector', 3, 50), only_newer=True)
+            assert(store.get_version('results', 'detector') == 2)
+            store._store_result(envelope('detector', 4, 300), only_newer=True)
+            assert(store.get_version('results', 'detector') == 3)
+        finally:
+            await store.stop()
+            store.ctx.destroy(linger=0)
+            context.destroy(linger=0)
@@ -0,0 +1,198 @@
+import math
+import random
+import logging
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
+
+'''
+Reference predicates: the per-event checks the compiled predicates
+replaced, evaluated one event and one sample at a time in Python.
+'''
+def deg_diff(a, b):
+    d = abs((a - b) % 360.0)
+    return d if d <= 180.0 else 360.0 - d
+
+def haversine_m(a, b):
+    if a.latitude is None or a.longitude is None:
+        return None
+    lat1, lon1, lat2, lon2 = map(math.radians, [a.latitude, a.longitude, b.latitude, b.longitude])
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371000.0 * math.asin(math.sqrt(h))
+
+def near(value, target, tol):
+    return target is None or (value is not None and abs(value - target) <= tol)
+
+def reference_battery(event, tel):
+    if not tel.vehicle_info or not tel.vehicle_info.battery_info:
+        return False
+    pct = tel.vehicle_info.battery_info.percentage
+    return pct is not None and pct <= event.threshold
+
+def reference_satellites(event, tel):
+    if not tel.vehicle_info or not tel.vehicle_info.gps_info:
+        return False
+    sats = tel.vehicle_info.gps_info.satellites
+    return sats is not None and sats >= event.threshold
+
+def reference_velocity(event, tel):
+    if not tel.position_info:
+        return False
+    v = tel.position_info.velocity_body if event.frame == 0 else tel.position_info.velocity_neu
+    if v is None:
+        return False
+    return all(near(getattr(v, axis), getattr(event.target, axis), event.tol)
+               for axis in ('x_vel', 'y_vel', 'z_vel', 'angular_vel'))
+
+def reference_relative_position(event, tel):
+    if not tel.position_info or not tel.position_info.relative_position:
+        return False
+    cur = tel.position_info.relative_position
+    if not all(near(getattr(cur, axis), getattr(event.target, axis), event.tol_m) for axis in ('x', 'y', 'z')):
+        return False
+    if event.target.angle is not None:
+        return cur.angle is not None and deg_diff(cur.angle, event.target.angle) <= event.tol_deg
+    return True
+
+def reference_global_position(event, tel):
+    if event.target is None or not tel.position_info or not tel.position_info.global_position:
+        return False
+    cur = tel.position_info.global_position
+    if event.target.latitude is not None and event.target.longitude is not None:
+        d = haversine_m(cur, event.target)
+        if d is None or d > event.tol_m:
+            return False
+    if not near(cur.altitude, event.target.altitude, event.tol_alt_m):
+        return False
+    if event.target.heading is not None:
+        return cur.heading is not None and deg_diff(cur.heading, event.target.heading) <= event.tol_deg
+    return True
+
+def random_telemetry(rng):
+    from steeleagle_sdk.dsl.types.datatypes.telemetry import DriverTelemetry
+    def fields(values):
+        # Each field is missing some of the time
+        return {name: value for name, value in values if rng.random() > 0.15}
+    position_info = {}
+    for name in ('velocity_body', 'velocity_neu'):
+        if rng.random() < 0.9:
+            position_info[name] = fields((axis, round(rng.uniform(-2, 2), 1))
+                                         for axis in ('x_vel', 'y_vel', 'z_vel', 'angular_vel'))
+    if rng.random() < 0.9:
+        position_info['relative_position'] = fields(
+            [(axis, round(rng.uniform(-3, 3), 1)) for axis in ('x', 'y', 'z')] +
+            [('angle', rng.uniform(-400, 400))])
+    if rng.random() < 0.9:
+        position_info['global_position'] = fields([
+            ('latitude', 40.0 + rng.uniform(-1e-4, 1e-4)), ('longitude', -79.9 + rng.uniform(-1e-4, 1e-4)),
+            ('altitude', rng.uniform(9, 11)), ('heading', rng.uniform(-360, 360))])
+    vehicle_info = {}
+    if rng.random() < 0.9:
+        vehicle_info['battery_info'] = fields([('percentage', rng.randint(0, 100))])
+    if rng.random() < 0.9:
+        vehicle_info['gps_info'] = fields([('satellites', rng.randint(0, 20))])
+    data = {'vehicle_info': vehicle_info}
+    if rng.random() < 0.9:
+        data['position_info'] = position_info
+    return DriverTelemetry.model_validate(data)
+
+def random_events(rng):
+    from steeleagle_sdk.dsl.types.events.singulars import singulars
+    from steeleagle_sdk.dsl.types.datatypes.common import Velocity, Location, Position
+    from steeleagle_sdk.dsl.types.datatypes.control import ReferenceFrame
+    def maybe(value):
+        return rng.choice([None, value])
+    events = []
+    for _ in range(60):
+        events.append((reference_battery, singulars.BatteryReached(threshold=rng.randint(0, 100))))
+        events.append((reference_satellites, singulars.SatellitesReached(threshold=rng.randint(0, 20))))
+        events.append((reference_velocity, singulars.VelocityReached(
+            frame=rng.choice([ReferenceFrame.BODY, ReferenceFrame.NEU]),
+            target=Velocity(x_vel=maybe(rng.uniform(-2, 2)), y_vel=maybe(0.0), angular_vel=maybe(rng.uniform(-2, 2))),
+            tol=rng.uniform(0, 2))))
+        events.append((reference_relative_position, singulars.RelativePositionReached(
+            target=Position(x=maybe(rng.uniform(-3, 3)), y=maybe(0.0), angle=maybe(rng.uniform(-180, 180))),
+            tol_m=rng.uniform(0, 3), tol_deg=rng.uniform(0, 180))))
+        # Without a target, the event never holds
+        target = {} if rng.random() < 0.2 else {'target': Location(
+            latitude=40.0, longitude=-79.9, altitude=maybe(10.0), heading=maybe(rng.uniform(-180, 180)))}
+        events.append((reference_global_position, singulars.GlobalPositionReached(
+            **target, tol_m=rng.uniform(0, 15), tol_deg=rng.uniform(0, 90))))
+    return events
+
+def sample(**fields):
+    return SimpleNamespace(**fields)
+
+class Test_Predicates:
+    '''
+    Test class focused on compiled event predicates.
+    '''
+    def test_equivalence(self):
+        from steeleagle_sdk.dsl.runtime.predicates import PredicateTable
+        rng = random.Random(1)
+        events = random_events(rng)
+        table = PredicateTable()
+        slots = [table.add(event._condition()) for _, event in events]
+        conditions = [event._condition() for _, event in events]
+        matched = 0
+        for i in range(400):
+            tel = random_telemetry(rng)
+            holds = set(table.evaluate(tel))
+            for slot, condition, (reference, event) in zip(slots, conditions, events):
+                expected = reference(event, tel)
+                matched += expected
+                assert((slot in holds) == expected), f'{event} on {tel}'
+                # Single predicates agree with the table
+                if i % 20 == 0:
+                    assert(condition(tel) == expected)
+        # Both outcomes are well represented
+        assert(0.1 < matched / (400 * len(events)) < 0.9)
+
+    def test_missing_fields(self):
+        from steeleagle_sdk.dsl.runtime.predicates import CompiledPredicate, at_most, at_least, present
+        battery = sample(battery_info=sample(percentage=None))
+        # Missing values are NaN, which fail every bound
+        assert(not CompiledPredicate([at_most('battery_info.percentage', 100)])(battery))
+        assert(not CompiledPredicate([at_least('battery_info.percentage', 0)])(battery))
+        assert(not CompiledPredicate([present('gps_info')])(battery))
+        # Sub-messages are present, whatever their fields
+        assert(CompiledPredicate([present('battery_info')])(battery))
+        assert(CompiledPredicate([at_most('battery_info.percentage', 10)])(sample(battery_info=sample(percentage=10))))
+
+    def test_angle_wraparound(self):
+        from steeleagle_sdk.dsl.runtime.predicates import CompiledPredicate, angle_near
+        assert(CompiledPredicate([angle_near('heading', 1, 2)])(sample(heading=359)))
+        assert(CompiledPredicate([angle_near('heading', 359, 2)])(sample(heading=1)))
+        assert(CompiledPredicate([angle_near('heading', -1, 0.5)])(sample(heading=359)))
+        assert(not CompiledPredicate([angle_near('heading', 1, 1.5)])(sample(heading=359)))
+        assert(not CompiledPredicate([angle_near('heading', 0, 10)])(sample(heading=180)))
+
+    def test_never_and_empty(self):
+        from steeleagle_sdk.dsl.runtime.predicates import CompiledPredicate, PredicateTable, never, present
+        anything = sample(heading=0)
+        assert(not CompiledPredicate([never()])(anything))
+        assert(not CompiledPredicate([present('heading'), never()])(anything))
+        # No clauses is a conjunction of nothing, which always holds
+        assert(CompiledPredicate([])(anything))
+        table = PredicateTable()
+        assert(table.evaluate(anything) == [])
+        assert(table.add(CompiledPredicate([never()])) == 0)
+        assert(table.add(CompiledPredicate([])) == 1)
+        assert(table.evaluate(anything) == [1])
+
+    def test_remove(self):
+        from steeleagle_sdk.dsl.runtime.predicates import CompiledPredicate, PredicateTable, at_most, at_least
+        table = PredicateTable()
+        low = table.add(CompiledPredicate([at_most('percentage', 20)]))
+        high = table.add(CompiledPredicate([at_least('percentage', 10)]))
+        assert(table.evaluate(sample(percentage=15)) == [low, high])
+        # Slots stay the same as others are removed and added
+        table.remove(low)
+        table.remove(low)
+        assert(len(table) == 1 and table.evaluate(sample(percentage=15)) == [high])
+        again = table.add(CompiledPredicate([at_most('percentage', 20)]))
+        assert(again not in (low, high))
+        assert(table.evaluate(sample(percentage=15)) == [high, again])
+        table.remove(high)
+        table.remove(again)
+        assert(len(table) == 0 and table.evaluate(sample(percentage=15)) == [])
@@ -0,0 +1,91 @@
+import pytest
+import asyncio
+import grpc
+import logging
+# Protocol import
+import steeleagle_sdk.protocol.services.control_service_pb2 as control_proto
+import steeleagle_sdk.protocol.services.control_service_pb2_grpc as control_grpc
+from steeleagle_sdk.protocol.rpc_helpers import generate_response
+
+logger = logging.getLogger(__name__)
+
+class RecordingControl(control_grpc.ControlServicer):
+    '''
+    Driver stand-in that records what each call looked like on arrival.
+    '''
+    def __init__(self):
+        self.calls = []
+        self.cancelled = asyncio.Event()
+
+    async def Arm(self, request, context):
+        self.calls.append((request, context.time_remaining(), dict(context.invocation_metadata())))
+        return generate_response(2)
+
+    async def Joystick(self, request, context):
+        await context.abort(grpc.StatusCode.UNAVAILABLE, 'not flying')
+
+    async def TakeOff(self, request, context):
+        try:
+            for i in range(100):
+                yield generate_response(1)
+                await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+class Test_Proxy:
+    '''
+    Test class focused on forwarding kernel services to internal services.
+    '''
+    @pytest.mark.asyncio
+    async def test_forwarding(self, tmp_path):
+        from kernel.services.proxy_service import ProxyService
+        driver_addr = f'unix://{tmp_path}/driver.sock'
+        kernel_addr = f'unix://{tmp_path}/kernel.sock'
+        driver = RecordingControl()
+        driver_server = grpc.aio.server()
+        control_grpc.add_ControlServicer_to_server(driver, driver_server)
+        driver_server.add_insecure_port(driver_addr)
+        await driver_server.start()
+        kernel_server = grpc.aio.server()
+        proxy = ProxyService('Control', driver_addr)
+        kernel_server.add_generic_rpc_handlers((proxy,))
+        kernel_server.add_insecure_port(kernel_addr)
+        await kernel_server.start()
+        channel = grpc.aio.insecure_channel(kernel_addr)
+        stub = control_grpc.ControlStub(channel)
+        try:
+            # Requests arrive intact, with the caller's deadline and metadata
+            request = control_proto.ArmRequest()
+            request.request.timestamp.seconds = 10
+            response = await stub.Arm(request, timeout=5, metadata=(('identity', 'server'),))
+            assert(response.status == 2)
+            arrived, remaining, metadata = driver.calls[0]
+            assert(arrived == request)
+            assert(remaining is not None and 0 < remaining < 6)
+            assert(metadata['identity'] == 'server')
+            # Errors are returned with their status
+            with pytest.raises(grpc.aio.AioRpcError) as error:
+                await stub.Joystick(control_proto.JoystickRequest())
+            assert(error.value.code() == grpc.StatusCode.UNAVAILABLE)
+            assert(error.value.details() == 'not flying')
+            # Cancelling a stream cancels the forwarded stream
+            call = stub.TakeOff(control_proto.TakeOffRequest())
+            await call.read()
+            call.cancel()
+            await asyncio.wait_for(driver.cancelled.wait(), 2)
+        finally:
+            await channel.close()
+            await proxy.close()
+            await kernel_server.stop(0)
+            await driver_server.stop(0)
+
+    def test_raw_request(self):
+        from kernel.services.proxy_service import RawRequest
+        from kernel.laws.matcher import message_matches
+        data = control_proto.TakeOffRequest(take_off_altitude=10.0).SerializeToString()
+        request = RawRequest(data, control_proto.TakeOffRequest)
+        # Nothing is parsed until a field is read
+        assert(request._message is None)
+        assert(message_matches(request, {'take_off_altitude': 10.0}))
+        assert(request.take_off_altitude == 10.0)
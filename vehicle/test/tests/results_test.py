@@ -0,0 +1,67 @@
+import pytest
+import asyncio
+import zmq
+import zmq.asyncio
+import logging
+from gabriel_protocol import gabriel_pb2
+# Protocol import
+from steeleagle_sdk.protocol.messages.result_pb2 import FrameResult, ResultEnvelope
+from steeleagle_sdk.protocol.rpc_helpers import result_topic
+
+logger = logging.getLogger(__name__)
+
+def gabriel_result(engine_id, frame_id):
+    result = gabriel_pb2.Result(target_engine_id=engine_id, frame_id=frame_id)
+    result.any_result.Pack(FrameResult(type='detection', frame_id=frame_id))
+    return result
+
+class Test_Results:
+    '''
+    Test class focused on routing compute results to subscribers.
+    '''
+    @pytest.mark.asyncio
+    async def test_routing(self):
+        from kernel.handlers.stream_handler import StreamHandler
+        handler = StreamHandler(None)
+        cache_task = asyncio.create_task(handler._serve_latest_results())
+        context = zmq.asyncio.Context()
+        cache = context.socket(zmq.DEALER)
+        cache.connect('ipc:///tmp/results_cache.sock')
+        subscriber = context.socket(zmq.SUB)
+        try:
+            handler.process(gabriel_result('detector', 1))
+            handler.process(gabriel_result('tracker', 2))
+            # Late subscribers get the latest result per topic from the cache
+            await cache.send(result_topic('detector'))
+            frames = await asyncio.wait_for(cache.recv_multipart(), 2)
+            topic = result_topic('detector', FrameResult.DESCRIPTOR.full_name)
+            assert(frames[0] == result_topic('detector'))
+            assert(frames[1::2] == [topic])
+            envelope = ResultEnvelope.FromString(frames[2])
+            assert(envelope.engine_id == 'detector' and envelope.frame_id == 1)
+            assert(FrameResult.FromString(envelope.payload).frame_id == 1)
+            await cache.send(b'')
+            frames = await asyncio.wait_for(cache.recv_multipart(), 2)
+            assert(len(frames) == 5)
+            # Prefix subscriptions do not match engines sharing a prefix
+            subscriber.setsockopt(zmq.SUBSCRIBE, result_topic('detector'))
+            subscriber.connect('ipc:///tmp/results.sock')
+            await asyncio.sleep(0.2)
+            handler.process(gabriel_result('detector2', 3))
+            handler.process(gabriel_result('detector', 4))
+            received, data = await asyncio.wait_for(subscriber.recv_multipart(), 2)
+            assert(received == topic)
+            assert(ResultEnvelope.FromString(data).frame_id == 4)
+        finally:
+            cache_task.cancel()
+            await cache_task
+            # Contexts left to the garbage collector block on the messages
+            # queued by unconnected sockets, so tear everything down here
+            sockets = [handler._result_sock, handler._result_cache_sock]
+            sockets += [capture._socket for capture in handler._captures.values()]
+            for client in (handler._local_compute_handler, handler._remote_compute_handler):
+                if client:
+                    sockets.append(client._sock)
+            for sock in sockets:
+                sock.context.destroy(linger=0)
+            context.destroy(linger=0)
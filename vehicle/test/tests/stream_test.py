@@ -8,12 +8,28 @@ from test.helpers import send_requests, Request
 # Protocol import
 import steeleagle_sdk.protocol.services.compute_service_pb2 as compute_proto
 import steeleagle_sdk.protocol.messages.telemetry_pb2 as telemetry_proto
-from gabriel_protocol.gabriel_pb2 import ResultWrapper, PayloadType
+from steeleagle_sdk.protocol.messages.result_pb2 import ResultEnvelope
+from steeleagle_sdk.protocol.rpc_helpers import result_topic
 # Sequencer import
 from test.message_sequencer import Topic
 
 logger = logging.getLogger(__name__)
 
+async def receive_results(results):
+    '''
+    Counts the results received from the remote and local engines. Both
+    are named engine, and answer with their location as a string result.
+    '''
+    received = {'REMOTE' : 0, 'LOCAL' : 0}
+    for i in range(6):
+        try:
+            topic, data = await results.recv_multipart() # This will timeout after half a second if nothing is received
+        except zmq.error.Again:
+            continue
+        assert(topic == result_topic('engine', 'string'))
+        received[ResultEnvelope.FromString(data).payload.decode('utf-8')] += 1
+    return received
+
 class Test_Stream:
     '''
     Test class focused on image and telemetry streams.
@@ -38,14 +54,7 @@ class Test_Stream:
         await driver_telemetry.send_multipart([b'driver_telemetry', telemetry_proto.DriverTelemetry().SerializeToString()]),
         await mission_telemetry.send_multipart([b'mission_telemetry', telemetry_proto.MissionTelemetry().SerializeToString()])
         await asyncio.sleep(1)
-        received = {'REMOTE' : 0, 'LOCAL' : 0}
-        for i in range(6):
-            try:
-                topic, data = await results.recv_multipart() # This will timeout after half a second if nothing is received
-                received[topic.decode('utf-8')] += 1
-            except Exception as e:
-                pass
-        assert(expected == received)
+        assert(expected == await receive_results(results))
 
         # Try removing the remote datasink to make sure it has an effect
         requests = [
@@ -63,14 +72,7 @@ class Test_Stream:
         await driver_telemetry.send_multipart([b'driver_telemetry', telemetry_proto.DriverTelemetry().SerializeToString()]),
         await mission_telemetry.send_multipart([b'mission_telemetry', telemetry_proto.MissionTelemetry().SerializeToString()])
         await asyncio.sleep(1)
-        received = {'REMOTE' : 0, 'LOCAL' : 0}
-        for i in range(6):
-            try:
-                topic, data = await results.recv_multipart() # This will timeout after half a second if nothing is received
-                received[topic.decode('utf-8')] += 1
-            except Exception as e:
-                pass
-        assert(expected == received)
+        assert(expected == await receive_results(results))
 
         # Try adding back the remote datasink to make sure it has an effect
         requests = [
@@ -88,11 +90,4 @@ class Test_Stream:
         await driver_telemetry.send_multipart([b'driver_telemetry', telemetry_proto.DriverTelemetry().SerializeToString()]),
         await mission_telemetry.send_multipart([b'mission_telemetry', telemetry_proto.MissionTelemetry().SerializeToString()])
         await asyncio.sleep(1) 
-        received = {'REMOTE' : 0, 'LOCAL' : 0}
-        for i in range(6):
-            try:
-                topic, data = await results.recv_multipart() # This will timeout after half a second if nothing is received
-                received[topic.decode('utf-8')] += 1
-            except Exception as e:
-                pass
-        assert(expected == received)
+        assert(expected == await receive_results(results))
@@ -0,0 +1,68 @@
+import sys
+import time
+import logging
+# Utility import
+from util.supervisor import Service, Supervisor, grpc_probe, socket_probe
+
+logger = logging.getLogger(__name__)
+
+# Child that serves gRPC (with no services) after a delay
+SERVER = '''
+import sys, time, grpc
+from concurrent import futures
+time.sleep(float(sys.argv[2]))
+server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+server.add_insecure_port(sys.argv[1])
+server.start()
+server.wait_for_termination()
+'''
+
+# Child that records when it started, then exits
+CRASH = '''
+import sys, time
+with open(sys.argv[1], 'a') as f:
+    f.write(f'{time.monotonic()}\\n')
+sys.exit(3)
+'''
+
+class Test_Supervisor:
+    '''
+    Test class focused on launching and restarting vehicle services.
+    '''
+    def test_dependencies(self, tmp_path):
+        slow = f'unix://{tmp_path}/slow.sock'
+        fast = f'unix://{tmp_path}/fast.sock'
+        dependent = f'unix://{tmp_path}/dependent.sock'
+        supervisor = Supervisor([
+            Service('dependent', [sys.executable, '-c', SERVER, dependent, '0'],
+                    depends=['slow', 'fast'], probe=grpc_probe(dependent)),
+            Service('slow', [sys.executable, '-c', SERVER, slow, '1.0'], probe=grpc_probe(slow)),
+            Service('fast', [sys.executable, '-c', SERVER, fast, '0'], probe=socket_probe(fast))
+            ])
+        start = time.monotonic()
+        supervisor.start()
+        assert(supervisor.wait('dependent', timeout=0.5) is None)
+        while not supervisor['dependent'].ready.wait(0.05):
+            # The dependent only starts once both dependencies are ready
+            assert(supervisor['dependent'].process is None or supervisor['slow'].ready.is_set())
+            assert(time.monotonic() - start < 10)
+        # Independent services start in parallel
+        assert(supervisor['fast'].ready.is_set())
+        supervisor.stop()
+        assert(all(supervisor[name].process.poll() is not None for name in ('slow', 'fast', 'dependent')))
+
+    def test_restart(self, tmp_path):
+        starts = tmp_path / 'starts'
+        supervisor = Supervisor([
+            Service('crash', [sys.executable, '-c', CRASH, str(starts)], min_backoff=0.2, max_backoff=0.4),
+            Service('once', [sys.executable, '-c', CRASH, str(tmp_path / 'once')], restart=False)
+            ])
+        supervisor.start()
+        assert(supervisor.wait('once', timeout=10) == 3)
+        while not starts.exists() or len(starts.read_text().split()) < 4:
+            time.sleep(0.05)
+        supervisor.stop()
+        times = [float(line) for line in starts.read_text().split()]
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        # Restarts back off, up to the maximum
+        assert(gaps[0] >= 0.2 and gaps[1] >= 0.4 and gaps[2] >= 0.4)
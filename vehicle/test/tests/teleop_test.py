@@ -0,0 +1,76 @@
+import pytest
+import asyncio
+import logging
+# Protocol import
+from steeleagle_sdk.protocol.services.remote_service_pb2 import TeleopSetpoint, TeleopStatus
+# Sequencer import
+from test.message_sequencer import Topic
+
+logger = logging.getLogger(__name__)
+
+# Leading frame of a teleop setpoint or status on the command socket
+TELEOP_FRAME = b'teleop'
+
+async def send_setpoint(command_socket, sequence_number, identity='server'):
+    from util.config import query_config
+    setpoint = TeleopSetpoint(sequence_number=sequence_number, identity=identity, channel=1)
+    setpoint.velocity.x_vel = 1.0
+    await command_socket.send_multipart(
+        [query_config('vehicle.name').encode('utf-8'), TELEOP_FRAME, setpoint.SerializeToString()]
+        )
+
+async def recv_status(command_socket, timeout=5.0):
+    '''
+    Receives the next teleop status sent by the kernel, skipping any
+    other messages.
+    '''
+    while True:
+        frames = await asyncio.wait_for(command_socket.recv_multipart(), timeout)
+        if len(frames) == 3 and frames[1] == TELEOP_FRAME:
+            status = TeleopStatus()
+            status.ParseFromString(frames[2])
+            return status
+
+class Test_Teleop:
+    '''
+    Test class focused on streaming setpoints to the driver.
+    '''
+    @pytest.mark.asyncio
+    async def test_deadman_hold(self, messages, command_socket, kernel):
+        for sequence_number in (1, 2, 3):
+            await send_setpoint(command_socket, sequence_number)
+            await asyncio.sleep(0.05)
+        # Arrives out of order, so it is dropped
+        await send_setpoint(command_socket, 2)
+        # Stop sending; the kernel should hold after the deadman timeout
+        status = await recv_status(command_socket)
+        while not status.holding:
+            status = await recv_status(command_socket)
+        assert(status.sequence_number == 3)
+        assert(status.dropped == 1)
+        assert(status.response.status == 2)
+        joystick = (Topic.DRIVER_CONTROL_SERVICE, 'JoystickRequest')
+        assert(messages == [
+            (Topic.DRIVER_CONTROL_SERVICE, 'ConnectRequest'),
+            joystick, joystick, joystick,
+            (Topic.DRIVER_CONTROL_SERVICE, 'HoldRequest')
+            ])
+
+    @pytest.mark.asyncio
+    async def test_denied_no_hold(self, messages, command_socket, kernel):
+        # The base law does not allow internal commands
+        for sequence_number in (1, 2, 3):
+            await send_setpoint(command_socket, sequence_number, identity='internal')
+            await asyncio.sleep(0.05)
+        # Collect status until the kernel stops reporting after the deadman timeout
+        statuses = []
+        try:
+            while True:
+                statuses.append(await recv_status(command_socket, 1.0))
+        except asyncio.TimeoutError:
+            pass
+        # Usually PERMISSION_DENIED, unless a write races the rejection
+        assert(any(status.response.status > 2 for status in statuses))
+        assert(not any(status.holding for status in statuses))
+        # A channel the law denied must not take control with a Hold
+        assert(messages == [(Topic.DRIVER_CONTROL_SERVICE, 'ConnectRequest')])
@@ -1,35 +1,143 @@
 import logging
 import os
-import toml
+import signal
+import threading
+import tomllib
+
+logger = logging.getLogger('util/config')
+
+'''
+Vehicle configuration. Both config files are parsed and validated once,
+at import, into ConfigSections, which are dicts whose keys can also be
+read as attributes (e.g. CONFIG.logging.log_level). `query_config`
+resolves each access token once and caches the result.
+
+Processes that call `watch_config` reload the files when they change or
+on SIGHUP. Only RELOADABLE keys take effect without a restart; changes
+to any other key are logged and ignored. Code that depends on a
+reloadable key subscribes to it with `subscribe_config`.
+'''
+
+# Keys that can be changed without restarting, by access token
+RELOADABLE = (
+    'logging.log_level',
+    'logging.proto_limits',
+    'cloudlet.remote_compute_service'
+)
+
+# Expected types of config keys, and whether they are required
+SCHEMA = {
+    'vehicle.name': (str, True),
+    'vehicle.package': (str, False),
+    'vehicle.kwargs': (dict, False),
+    'cloudlet.swarm_controller': (str, True),
+    'cloudlet.remote_compute_service': (str, True),
+    'imagery.latest_frame': (bool, False),
+    'imagery.encoder_threads': (int, False),
+    'imagery.adaptive': (dict, False),
+    'logging.generate_flight_log': (bool, True),
+    'logging.custom_filename': (str, True),
+    'logging.file_path': (str, True),
+    'logging.log_level': (str, True),
+    'logging.chunk_size': (int, False),
+    'logging.compression': (str, False),
+    'logging.max_file_size': ((int, float), False),
+    'logging.max_file_duration': ((int, float), False),
+    'logging.checkpoint_interval': ((int, float), False),
+    'logging.binary_protos': (bool, False),
+    'logging.console_protos': (bool, False),
+    'logging.proto_limits': (dict, False),
+    'internal.timeouts': (dict, False),
+    'internal.services.kernel': (str, True),
+    'internal.services.driver': (str, True),
+    'internal.services.mission': (str, True),
+    'internal.services.flight_log': (str, True),
+    'internal.streams.driver_telemetry': (str, True),
+    'internal.streams.mission_telemetry': (str, True),
+    'internal.streams.imagery': (str, True),
+    'internal.streams.imagery_buffer': (str, False),
+    'internal.streams.local_compute': (str, False),
+    'internal.streams.results': (str, True),
+    'internal.streams.results_cache': (str, False)
+}
+
+class ConfigSection(dict):
+    '''
+    Config table whose keys can also be read as attributes. Nested tables
+    are converted when the section is built, so reads never copy.
+    '''
+    def __init__(self, table):
+        super().__init__(
+            (key, ConfigSection(value) if isinstance(value, dict) else value)
+            for key, value in table.items()
+            )
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f'config has no key {name}') from None
 
 def import_config(path):
     '''
     Import configuration file from environment variable.
     '''
-    with open(path, 'r') as file:
-        cfg = toml.load(file)
-        return cfg
+    with open(path, 'rb') as file:
+        return ConfigSection(tomllib.load(file))
 
-CONFIG = None
-if os.environ.get('CONFIGPATH'):
-    CONFIG = import_config(os.environ.get('CONFIGPATH'))
-elif os.path.isfile('config.toml'):
-    CONFIG = import_config('config.toml')
-else:
-    raise ValueError(
-            "No path provided for config file and no local file found. Try setting CONFIGPATH!"
-            )
+def _lookup(config, internal, access_token):
+    indices = access_token.split('.')
+    if indices[0] == 'internal':
+        result = internal
+        indices = indices[1:]
+    else:
+        result = config
+    for i in indices:
+        if not isinstance(result, dict) or i not in result:
+            raise ValueError(f"Malformed access token: {access_token}")
+        result = result[i] # Access the corresponding field
+    return result
+
+def validate_config(config, internal):
+    '''
+    Checks config files against the SCHEMA, raising a ValueError that
+    lists every problem found.
+    '''
+    errors = []
+    for access_token, (types, required) in SCHEMA.items():
+        types = types if isinstance(types, tuple) else (types,)
+        try:
+            value = _lookup(config, internal, access_token)
+        except ValueError:
+            if required:
+                errors.append(f'{access_token} is missing')
+            continue
+        # Booleans are ints in Python, but not in TOML
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            expected = ' or '.join(t.__name__ for t in types)
+            errors.append(f'{access_token} should be {expected}, not {type(value).__name__}')
+    if errors:
+        raise ValueError('Invalid config: ' + '; '.join(errors))
 
-INTERNAL = None
-if os.environ.get('INTERNALPATH'):
-    INTERNAL = import_config(os.environ.get('INTERNALPATH'))
-elif os.path.isfile('.internal.toml'):
-    INTERNAL = import_config('.internal.toml')
-else:
+def _find_config(env, default, name):
+    if os.environ.get(env):
+        return os.environ.get(env)
+    elif os.path.isfile(default):
+        return default
     raise ValueError(
-            "No path provided for internal config file and no local file found. Try setting INTERNALPATH!"
+            f"No path provided for {name} file and no local file found. Try setting {env}!"
             )
 
+CONFIG_PATH = _find_config('CONFIGPATH', 'config.toml', 'config')
+INTERNAL_PATH = _find_config('INTERNALPATH', '.internal.toml', 'internal config')
+CONFIG = import_config(CONFIG_PATH)
+INTERNAL = import_config(INTERNAL_PATH)
+validate_config(CONFIG, INTERNAL)
+
+# Config files and their access token cache, swapped together on reload
+# so a lookup never mixes old and new values
+_STATE = (CONFIG, INTERNAL, {})
+
 def query_config(access_token):
     '''
     Allows for accessing the CONFIG using a plaintext access token.
@@ -38,14 +146,135 @@ def query_config(access_token):
     the driver_to_hub telemetry socket under dataplane and hub, it would be
     requested using the id: hub.dataplane.driver_to_hub.telemetry.
     '''
+    config, internal, cache = _STATE
+    try:
+        return cache[access_token]
+    except KeyError:
+        pass
+    result = _lookup(config, internal, access_token)
+    cache[access_token] = result
+    return result
+
+# Callbacks for reloadable keys, by access token
+_SUBSCRIBERS = {}
+_reload_lock = threading.Lock()
+
+def subscribe_config(access_token, callback):
+    '''
+    Calls callback with the new value of a reloadable key whenever a
+    reload changes it. Callbacks run on the config watcher thread.
+    '''
+    if access_token not in RELOADABLE:
+        raise ValueError(f'{access_token} cannot be reloaded')
+    _SUBSCRIBERS.setdefault(access_token, []).append(callback)
+
+def _set(config, internal, access_token, value):
     indices = access_token.split('.')
+    table = internal if indices[0] == 'internal' else config
     if indices[0] == 'internal':
-        result = INTERNAL
         indices = indices[1:]
+    for i in indices[:-1]:
+        table = table.setdefault(i, ConfigSection({}))
+    if value is None:
+        table.pop(indices[-1], None)
     else:
-        result = CONFIG
-    for i in indices:
-        if i not in result.keys():
-            raise ValueError(f"Malformed access token: {access_token}")
-        result = result[i] # Access the corresponding field
-    return result
+        table[indices[-1]] = value
+
+def _leaves(table, prefix=''):
+    for key, value in table.items():
+        if isinstance(value, dict) and value:
+            yield from _leaves(value, f'{prefix}{key}.')
+        else:
+            yield f'{prefix}{key}', value
+
+def _optional(config, internal, access_token):
+    try:
+        return _lookup(config, internal, access_token)
+    except ValueError:
+        return None
+
+def reload_config():
+    '''
+    Reloads the config files, applying changes to RELOADABLE keys and
+    notifying their subscribers. Returns the access tokens that changed.
+    Invalid files are logged and ignored.
+    '''
+    global CONFIG, INTERNAL, _STATE
+    with _reload_lock:
+        try:
+            new_config = import_config(CONFIG_PATH)
+            new_internal = import_config(INTERNAL_PATH)
+            validate_config(new_config, new_internal)
+        except (OSError, ValueError) as e:
+            logger.error(f'Could not reload config: {e}')
+            return []
+        config, internal, _ = _STATE
+        changed = []
+        for access_token in RELOADABLE:
+            value = _optional(new_config, new_internal, access_token)
+            if value != _optional(config, internal, access_token):
+                changed.append((access_token, value))
+        # Other keys keep their values until a restart
+        old_leaves = dict(_leaves({**config, 'internal': internal}))
+        new_leaves = dict(_leaves({**new_config, 'internal': new_internal}))
+        ignored = [
+            access_token for access_token in sorted(old_leaves.keys() | new_leaves.keys())
+            if old_leaves.get(access_token) != new_leaves.get(access_token)
+            and not any(access_token == key or access_token.startswith(f'{key}.') for key in RELOADABLE)
+            ]
+        if ignored:
+            logger.warning(f'Restart to apply config changes to {", ".join(ignored)}')
+        if not changed:
+            return []
+        # Copy the current config rather than changing it in place
+        config = ConfigSection(config)
+        internal = ConfigSection(internal)
+        for access_token, value in changed:
+            _set(config, internal, access_token, value)
+        CONFIG, INTERNAL = config, internal
+        _STATE = (config, internal, {})
+        for access_token, value in changed:
+            logger.info(f'Reloaded {access_token}')
+            for callback in _SUBSCRIBERS.get(access_token, []):
+                try:
+                    callback(value)
+                except Exception as e:
+                    logger.error(f'Config subscriber for {access_token} failed: {e}')
+        return [access_token for access_token, _ in changed]
+
+_watcher = None
+
+def watch_config(interval=1.0):
+    '''
+    Starts reloading the config files whenever they change, checking
+    every interval seconds, or when the process receives SIGHUP. SIGHUP
+    is only handled if this is called from the main thread.
+    '''
+    global _watcher
+    if _watcher is not None:
+        return
+    wake = threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGHUP, lambda signum, frame: wake.set())
+
+    def mtimes():
+        stamps = []
+        for path in (CONFIG_PATH, INTERNAL_PATH):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return stamps
+
+    def watch():
+        last = mtimes()
+        while True:
+            signalled = wake.wait(interval)
+            wake.clear()
+            current = mtimes()
+            if signalled or current != last:
+                last = current
+                reload_config()
+
+    _watcher = threading.Thread(target=watch, name='config_watcher', daemon=True)
+    _watcher.start()
@@ -0,0 +1,166 @@
+import os
+import mmap
+import struct
+import logging
+import threading
+import numpy as np
+
+logger = logging.getLogger('util/frame_buffer')
+
+'''
+Shared memory ring buffer for raw imagery. Drivers write frames into
+fixed size slots of a memory-mapped file and publish only the frame
+metadata (with a FrameSlot reference) over the imagery socket, so the
+kernel can read pixel data in place instead of copying it through
+ZeroMQ and Protobuf.
+
+Layout (little endian):
+    header      magic, version, slot count, slot size
+    slot table  (sequence, length) for each slot
+    slots       slot count * slot size bytes of frame data
+
+A slot's sequence is cleared while it is being written and set once the
+write is complete, so readers can tell whether a slot still holds the
+frame they were told about. Writers always create a new file rather than
+resizing an existing one, so a restarted driver never truncates memory
+a reader still has mapped.
+'''
+
+MAGIC = b'SEFB'
+VERSION = 1
+_HEADER = struct.Struct('<4sIIQ')
+_SLOT = struct.Struct('<QQ')
+# Slot data starts on a cache line boundary
+_ALIGNMENT = 64
+
+def _data_offset(slot_count):
+    table_end = _HEADER.size + slot_count * _SLOT.size
+    return (table_end + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+class FrameBufferWriter:
+    '''
+    Creates a frame buffer and writes frames into it round robin. This is
+    the reference for drivers that publish imagery through shared memory,
+    and is used as a local stand-in for a driver in tests.
+    '''
+    def __init__(self, path, slot_count, slot_size):
+        if slot_count < 2:
+            raise ValueError('frame buffer needs at least two slots')
+        self.path = path
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self._data_offset = _data_offset(slot_count)
+        size = self._data_offset + slot_count * slot_size
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            self._mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        _HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, slot_count, slot_size)
+        self._sequence = 0
+
+    def write(self, image):
+        '''
+        Copies an image into the next slot and returns the (index,
+        sequence) to publish alongside the frame metadata.
+        '''
+        data = np.ascontiguousarray(image)
+        if data.nbytes > self.slot_size:
+            raise ValueError(f'frame of {data.nbytes} bytes does not fit in a {self.slot_size} byte slot')
+        self._sequence += 1
+        index = (self._sequence - 1) % self.slot_count
+        table = _HEADER.size + index * _SLOT.size
+        # Invalidate the slot while it is being overwritten
+        _SLOT.pack_into(self._mmap, table, 0, 0)
+        offset = self._data_offset + index * self.slot_size
+        self._mmap[offset:offset + data.nbytes] = data.reshape(-1).view(np.uint8)
+        _SLOT.pack_into(self._mmap, table, self._sequence, data.nbytes)
+        return index, self._sequence
+
+    def close(self, unlink=True):
+        self._mmap.close()
+        if unlink:
+            os.unlink(self.path)
+
+class FrameBufferReader:
+    '''
+    Maps an existing frame buffer read-only and hands out NumPy views of
+    its slots without copying.
+    '''
+    def __init__(self, path):
+        self.path = path
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            self._inode = os.fstat(fd).st_ino
+            self._mmap = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        magic, version, self.slot_count, self.slot_size = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f'{path} is not a version {VERSION} frame buffer')
+        self._data_offset = _data_offset(self.slot_count)
+        self._buffer = np.frombuffer(self._mmap, dtype=np.uint8)
+
+    def stale(self):
+        '''
+        Checks whether the buffer has been recreated (or removed) since
+        it was opened.
+        '''
+        try:
+            return os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            return True
+
+    def _slot(self, index):
+        if not 0 <= index < self.slot_count:
+            raise IndexError(f'slot {index} out of range for {self.slot_count} slots')
+        return _SLOT.unpack_from(self._mmap, _HEADER.size + index * _SLOT.size)
+
+    def valid(self, index, sequence):
+        '''
+        Checks whether a slot still holds the frame with the given sequence.
+        Call this after using a view to make sure it was not overwritten.
+        '''
+        return self._slot(index)[0] == sequence
+
+    def view(self, index, sequence, shape=None):
+        '''
+        Returns a read-only view of a frame in place, reshaped to shape if
+        given. Raises LookupError if the slot no longer holds the frame.
+        '''
+        current, length = self._slot(index)
+        if current != sequence:
+            raise LookupError(f'slot {index} holds frame {current}, not {sequence}')
+        offset = self._data_offset + index * self.slot_size
+        data = self._buffer[offset:offset + length]
+        return data.reshape(shape) if shape is not None else data
+
+    def close(self):
+        # Views must be released before the mapping can be closed
+        self._buffer = None
+        self._mmap.close()
+
+class FrameBufferSource:
+    '''
+    Thread safe handle to a frame buffer that opens it on first use, and
+    again whenever the driver recreates it.
+    '''
+    def __init__(self, path):
+        self.path = path
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._reader is None or self._reader.stale():
+                # Old readers are left to be garbage collected, since other
+                # threads may still hold views into them
+                self._reader = FrameBufferReader(self.path)
+                logger.info(f'Opened frame buffer {self.path} with {self._reader.slot_count} slots')
+            return self._reader
@@ -1,26 +1,98 @@
+import os
+import sys
 import grpc
+import time
+import queue
+import struct
 import asyncio
 import logging
+import tempfile
+import threading
+from pathlib import Path
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 # Utility import
 from steeleagle_sdk.protocol.rpc_helpers import generate_request
-from util.config import query_config
+from util.config import query_config, subscribe_config
 # Protocol import
 from google.protobuf.json_format import MessageToDict
-from steeleagle_sdk.protocol.services.flight_log_service_pb2 import LogRequest, LogMessage, LogType
+from steeleagle_sdk.protocol.services.flight_log_service_pb2 import LogRequest, LogProtoRequest, LogBatchRequest, LogMessage, LogType
 from steeleagle_sdk.protocol.services.flight_log_service_pb2_grpc import FlightLogStub
 
 # Log level for protos, between info and warning
 PROTO_LEVEL = logging.INFO + 5
 
+class ProtoMessage:
+    '''
+    Log message wrapping a Protobuf, which is only converted to text if a
+    handler formats it. Handlers that can log binary Protobufs use the
+    message directly.
+    '''
+    __slots__ = ('message',)
+
+    def __init__(self, message):
+        self.message = message
+
+    def __str__(self):
+        return f'{self.message.DESCRIPTOR.name} | {MessageToDict(self.message)}'
+
+class ProtoSampler:
+    '''
+    Limits how many Protobufs of each type are logged, to at most `rate`
+    per second and/or one in every `sample` messages. Types without limits
+    are always logged. Counts are not locked, so loggers on several
+    threads may slightly exceed a limit.
+    '''
+    def __init__(self, limits=None):
+        self._limits = {}
+        for name, limit in (limits or {}).items():
+            self.set_limit(name, **limit)
+
+    def set_limits(self, limits):
+        '''
+        Replaces every limit with a dict of type names to limits, all at
+        once so loggers never see a partial set.
+        '''
+        self._limits = ProtoSampler(limits)._limits
+
+    def set_limit(self, name, rate=None, sample=None):
+        if rate is not None and rate < 0:
+            raise ValueError(f'rate for {name} must not be negative')
+        if sample is not None and sample < 1:
+            raise ValueError(f'sample for {name} must be at least 1')
+        # Limits, then the rate window start, count in window and total seen
+        self._limits[name] = [rate, sample, 0.0, 0, 0]
+
+    def allow(self, name):
+        limit = self._limits.get(name)
+        if limit is None:
+            return True
+        rate, sample = limit[0], limit[1]
+        limit[4] += 1
+        if sample and (limit[4] - 1) % sample:
+            return False
+        if rate is not None:
+            now = time.monotonic()
+            if now - limit[2] >= 1.0:
+                limit[2] = now
+                limit[3] = 0
+            if limit[3] >= rate:
+                return False
+            limit[3] += 1
+        return True
+
+# Sampler used by logger.proto, configured by setup_logging
+PROTO_SAMPLER = ProtoSampler()
+
 '''
 The following section is used to add the 'proto' log call to the
 logging library. This way, users can log request/response Protobufs by
-calling logger.proto(<proto>).
+calling logger.proto(<proto>). Messages are sampled before a record is
+made, and only converted to text by handlers that print them.
 '''
 def proto(self, message, *args, **kwargs):
-    if self.isEnabledFor(PROTO_LEVEL):
-        str_message = f'{message.DESCRIPTOR.name} | {MessageToDict(message)}'
-        self._log(PROTO_LEVEL, str_message, args, **kwargs)
+    if self.isEnabledFor(PROTO_LEVEL) and PROTO_SAMPLER.allow(message.DESCRIPTOR.name):
+        self._log(PROTO_LEVEL, ProtoMessage(message), args, **kwargs)
 
 def root(message, *args, **kwargs):
     logging.log(PROTO_LEVEL, message, *args, **kwargs)
@@ -61,31 +133,235 @@ class ColorFormatter(logging.Formatter):
         formatter = logging.Formatter(log_fmt)
         return formatter.format(record)
 
+# Record kind and length prefix for records in the spill file
+_SPILL_HEADER = struct.Struct('<BI')
+_SPILL_KINDS = [LogRequest, LogProtoRequest]
+
 class FlightLogHandler(logging.Handler):
     '''
     Log handler for sending records to the log service and writing
-    them to an MCAP file.
+    them to an MCAP file. Records are queued in a bounded ring buffer and
+    sent in batches from a background thread, so logging never waits on
+    the log service. While the service is unreachable, records are spilled
+    to a local file and replayed once it is back. With binary_protos,
+    records from logger.proto are sent as binary Protobufs instead of text.
+
+    Counters:
+        dropped  records lost because the ring buffer was full
+        spilled  records written to the spill file
+        failed   records lost because they could not be spilled either
     '''
-    def __init__(self, addr):
+    def __init__(self, addr, capacity=10000, batch_size=256, flush_interval=0.1,
+                 spill_path=None, retry_interval=1.0, timeout=5.0, binary_protos=False):
         logging.Handler.__init__(self)
-        self._stub = FlightLogStub(grpc.insecure_channel(addr))
+        self._binary_protos = binary_protos
+        # Reconnect at least as often as sends are retried
+        backoff = max(1, int(retry_interval * 1000))
+        self._stub = FlightLogStub(grpc.insecure_channel(addr, options=[
+            ('grpc.initial_reconnect_backoff_ms', backoff),
+            ('grpc.min_reconnect_backoff_ms', backoff),
+            ('grpc.max_reconnect_backoff_ms', backoff)
+            ]))
+        self._queue = deque(maxlen=capacity)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._spill_path = spill_path
+        self._retry_interval = retry_interval
+        self._timeout = timeout
+        self.dropped = 0
+        self.spilled = 0
+        self.failed = 0
+        # Drops already reported to the log service
+        self._reported = 0
+        self._retry_at = 0.0
+        self._available = True
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='flight_log', daemon=True)
+        self._thread.start()
 
     def emit(self, record):
         try:
-            log_type = getattr(LogType, record.levelname.upper())
-            request = LogRequest(
-                request=generate_request(),
-                topic=record.name,
-                log=LogMessage(
-                    type=log_type,
-                    msg=record.getMessage()
+            if self._binary_protos and isinstance(record.msg, ProtoMessage):
+                request = LogProtoRequest(
+                    request=generate_request(),
+                    topic=record.name
+                )
+                request.message.Pack(record.msg.message)
+            else:
+                log_type = getattr(LogType, record.levelname.upper())
+                request = LogRequest(
+                    request=generate_request(),
+                    topic=record.name,
+                    log=LogMessage(
+                        type=log_type,
+                        msg=record.getMessage()
+                    )
                 )
-            )
-            self._stub.Log(request)
-        except grpc.RpcError:
-            pass
         except Exception:
             self.handleError(record)
+            return
+        # Emits are serialized by the handler lock, so only the flush
+        # thread can race this check, and it only makes room
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+        self._queue.append(request)
+        if len(self._queue) >= self._batch_size:
+            self._wake.set()
+
+    def flush(self):
+        '''
+        Wakes the flush thread; records are still sent asynchronously.
+        '''
+        self._wake.set()
+
+    def close(self):
+        '''
+        Stops the flush thread after it sends (or spills) the remaining
+        records.
+        '''
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(self._timeout)
+        logging.Handler.close(self)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self._flush()
+        self._flush()
+
+    def _take(self):
+        # Only take what is queued now, so a steady stream of records
+        # cannot keep a flush going forever
+        records = []
+        for _ in range(len(self._queue)):
+            try:
+                records.append(self._queue.popleft())
+            except IndexError:
+                break
+        return records
+
+    def _flush(self):
+        records = self._take()
+        if not records:
+            return
+        # Spilled records are replayed first to keep the log in order
+        if time.monotonic() < self._retry_at or not self._replay() or not self._send(records):
+            self._spill(records)
+
+    def _send(self, records):
+        dropped = self.dropped - self._reported
+        def batches():
+            for i in range(0, len(records), self._batch_size):
+                batch = LogBatchRequest(
+                    request=generate_request(),
+                    dropped=dropped if i == 0 else 0
+                )
+                for request in records[i:i + self._batch_size]:
+                    if isinstance(request, LogRequest):
+                        batch.logs.append(request)
+                    else:
+                        batch.proto_logs.append(request)
+                yield batch
+        try:
+            self._stub.LogBatch(batches(), timeout=self._timeout)
+        except grpc.RpcError:
+            self._retry_at = time.monotonic() + self._retry_interval
+            self._set_available(False)
+            return False
+        self._reported += dropped
+        self._set_available(True)
+        return True
+
+    def _set_available(self, available):
+        if available == self._available:
+            return
+        self._available = available
+        if available:
+            print('Flight log service available again', file=sys.stderr)
+        else:
+            print(f'Flight log service unavailable, spilling records to {self._spill_path}', file=sys.stderr)
+
+    def _spill(self, records):
+        if self._spill_path is None:
+            self.failed += len(records)
+            return
+        try:
+            with open(self._spill_path, 'ab') as f:
+                for request in records:
+                    data = request.SerializeToString()
+                    kind = 0 if isinstance(request, LogRequest) else 1
+                    f.write(_SPILL_HEADER.pack(kind, len(data)))
+                    f.write(data)
+            self.spilled += len(records)
+        except OSError:
+            self.failed += len(records)
+
+    def _replay(self):
+        '''
+        Sends spilled records to the log service, returning whether it
+        was reachable.
+        '''
+        if self._spill_path is None or not os.path.exists(self._spill_path):
+            return True
+        records = []
+        try:
+            with open(self._spill_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return True
+        offset = 0
+        while offset + _SPILL_HEADER.size <= len(data):
+            kind, length = _SPILL_HEADER.unpack_from(data, offset)
+            offset += _SPILL_HEADER.size
+            # A truncated record at the end is left over from a crash
+            if offset + length > len(data) or kind >= len(_SPILL_KINDS):
+                break
+            request = _SPILL_KINDS[kind]()
+            request.ParseFromString(data[offset:offset + length])
+            records.append(request)
+            offset += length
+        if records and not self._send(records):
+            return False
+        os.unlink(self._spill_path)
+        return True
+
+class ConsoleQueueHandler(QueueHandler):
+    '''
+    Hands records to a listener thread that prints them to the console.
+    Records are queued unformatted, so converting protos to text happens
+    on the listener thread rather than the one that logged them.
+    '''
+    def __init__(self, handler):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(self.queue, handler)
+        self.listener.start()
+
+    def prepare(self, record):
+        return record
+
+    def close(self):
+        # Prints whatever is still queued before stopping
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        super().close()
+
+def console_handler(console_protos, stream=None):
+    '''
+    Builds the console handler installed by setup_logging. PROTO level
+    records are dropped unless console_protos is set, in which case all
+    records are printed from a listener thread.
+    '''
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(ColorFormatter())
+    if not console_protos:
+        stream_handler.addFilter(lambda record: record.levelno != PROTO_LEVEL)
+        return stream_handler
+    return ConsoleQueueHandler(stream_handler)
 
 def setup_logging():
     '''
@@ -94,10 +370,31 @@ def setup_logging():
     process.
     '''
     root_logger = logging.getLogger()
+    # Optional PROTO logging settings
+    try:
+        PROTO_SAMPLER.set_limits(query_config('logging.proto_limits'))
+    except ValueError:
+        pass
+    # Limits and the log level can be retuned without a restart
+    subscribe_config('logging.proto_limits', lambda limits: PROTO_SAMPLER.set_limits(limits or {}))
+    subscribe_config('logging.log_level', root_logger.setLevel)
+    try:
+        binary_protos = query_config('logging.binary_protos')
+    except ValueError:
+        binary_protos = False
+    try:
+        console_protos = query_config('logging.console_protos')
+    except ValueError:
+        console_protos = False
     if query_config('logging.generate_flight_log'): # Only send to the log service if it's running
-        flight_log_handler = FlightLogHandler(query_config('internal.services.flight_log')) # MCAP handler
+        # Spill files are named after the process (kernel, mission, ...) so
+        # a restarted process replays what it could not send before
+        process = Path(sys.argv[0]).resolve().parent.name or 'main'
+        flight_log_handler = FlightLogHandler(
+            query_config('internal.services.flight_log'),
+            spill_path=os.path.join(tempfile.gettempdir(), f'steeleagle_flight_log_{process}.spill'),
+            binary_protos=binary_protos
+            ) # MCAP handler
         root_logger.addHandler(flight_log_handler)
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(ColorFormatter())
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(console_handler(console_protos))
     root_logger.setLevel(query_config('logging.log_level'))
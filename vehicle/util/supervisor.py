@@ -0,0 +1,205 @@
+import time
+import socket
+import subprocess
+import threading
+import grpc
+
+'''
+Process supervisor for the vehicle services. Services are started as
+soon as the services they depend on are ready, so independent services
+start in parallel, and each service is ready once its readiness probe
+passes rather than after a fixed delay. Services that exit are restarted
+with exponential backoff.
+'''
+
+def grpc_probe(address):
+    '''
+    Probe that passes once a gRPC server accepts connections at address.
+    '''
+    def probe(timeout):
+        channel = grpc.insecure_channel(address)
+        try:
+            grpc.channel_ready_future(channel).result(timeout=timeout)
+            return True
+        except grpc.FutureTimeoutError:
+            return False
+        finally:
+            channel.close()
+    return probe
+
+def socket_probe(address):
+    '''
+    Probe that passes once a socket is bound and listening at address,
+    which is either unix://path (or ipc://path) or host:port.
+    '''
+    def probe(timeout):
+        if address.startswith(('unix://', 'ipc://')):
+            family, target = socket.AF_UNIX, address.split('://', 1)[1]
+        else:
+            host, port = address.rsplit(':', 1)
+            family, target = socket.AF_INET, (host, int(port))
+        deadline = time.monotonic() + timeout
+        while True:
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(target)
+                    return True
+                except OSError:
+                    pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+    return probe
+
+class Service:
+    '''
+    A supervised child process. It is started once every service in
+    depends is ready, and is ready itself once probe (a function taking
+    a timeout and returning whether the service is up) passes, or as soon
+    as it starts if there is no probe. If restart is set, it is restarted
+    whenever it exits, waiting min_backoff seconds at first and doubling
+    up to max_backoff while it keeps exiting within stable_time seconds.
+    '''
+    def __init__(self, name, command, depends=(), probe=None, restart=True, ready_timeout=30.0,
+                 min_backoff=0.5, max_backoff=30.0, stable_time=10.0):
+        self.name = name
+        self.command = command
+        self.depends = tuple(depends)
+        self.probe = probe
+        self.restart = restart
+        self.ready_timeout = ready_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.stable_time = stable_time
+        self.ready = threading.Event()
+        self.done = threading.Event()
+        self.process = None
+        self.restarts = 0
+        self.returncode = None
+
+class Supervisor:
+    '''
+    Starts and supervises a set of services. Call `start`, then `wait`
+    for services to finish, and `stop` to terminate them in the reverse
+    of their dependency order.
+    '''
+    def __init__(self, services):
+        self._services = {service.name: service for service in services}
+        self._order = self._sort()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._started = None
+
+    def _sort(self):
+        # Order services so each comes after its dependencies
+        order = []
+        visiting = set()
+        def visit(name, path):
+            if name not in self._services:
+                raise ValueError(f'{path[-1]} depends on unknown service {name}')
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f'dependency cycle: {" -> ".join(path + [name])}')
+            visiting.add(name)
+            for dependency in self._services[name].depends:
+                visit(dependency, path + [name])
+            order.append(name)
+        for name in self._services:
+            visit(name, [])
+        return [self._services[name] for name in order]
+
+    def __getitem__(self, name):
+        return self._services[name]
+
+    def start(self):
+        self._started = time.monotonic()
+        for service in self._order:
+            thread = threading.Thread(target=self._run, args=(service,), name=f'supervise_{service.name}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def wait(self, name=None, timeout=None):
+        '''
+        Waits for a service (or every service) to finish, returning the
+        exit code of the service, or None if the timeout passed first.
+        Waits in short steps so signals are handled promptly.
+        '''
+        services = [self._services[name]] if name else self._order
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for service in services:
+            while not service.done.wait(0.1):
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+        return services[-1].returncode
+
+    def stop(self, timeout=5.0):
+        '''
+        Terminates every service, dependents first, killing any that have
+        not exited after timeout seconds.
+        '''
+        with self._lock:
+            self._stopping.set()
+        for service in reversed(self._order):
+            process = service.process
+            if process is None or process.poll() is not None:
+                continue
+            process.terminate()
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                print(f'WARNING: {service.name} did not exit, killing it')
+                process.kill()
+                process.wait()
+        for thread in self._threads:
+            thread.join()
+
+    def _wait_dependencies(self, service):
+        for dependency in service.depends:
+            while not self._services[dependency].ready.wait(0.1):
+                if self._stopping.is_set():
+                    return False
+        return True
+
+    def _wait_ready(self, service, process):
+        if service.probe is None:
+            service.ready.set()
+            return
+        started = time.monotonic()
+        warned = False
+        while process.poll() is None and not self._stopping.is_set():
+            if service.probe(0.5):
+                service.ready.set()
+                print(f'{service.name} ready in {time.monotonic() - started:.2f}s '
+                      f'({time.monotonic() - self._started:.2f}s since launch)')
+                return
+            if not warned and time.monotonic() - started >= service.ready_timeout:
+                print(f'WARNING: {service.name} is not ready after {service.ready_timeout}s, still waiting...')
+                warned = True
+
+    def _run(self, service):
+        if not self._wait_dependencies(service):
+            service.done.set()
+            return
+        backoff = service.min_backoff
+        while True:
+            with self._lock:
+                if self._stopping.is_set():
+                    break
+                process = service.process = subprocess.Popen(service.command)
+            started = time.monotonic()
+            self._wait_ready(service, process)
+            service.returncode = process.wait()
+            service.ready.clear()
+            if self._stopping.is_set() or not service.restart:
+                break
+            # Back off from services that keep crashing
+            if time.monotonic() - started >= service.stable_time:
+                backoff = service.min_backoff
+            print(f'WARNING: {service.name} exited with code {service.returncode}, restarting in {backoff:.1f}s')
+            if self._stopping.wait(backoff):
+                break
+            backoff = min(backoff * 2, service.max_backoff)
+            service.restarts += 1
+        service.done.set()